@@ -0,0 +1,37 @@
+"""add task indexes for project listing and overdue scan
+
+Revision ID: 7c1e9b2d4f60
+Revises: 40aa87844ab4
+Create Date: 2026-10-18 10:12:41.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e9b2d4f60'
+down_revision: Union[str, Sequence[str], None] = '40aa87844ab4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_project_id_status', 'tasks', ['project_id', 'status'], unique=False)
+    # partial on Postgres (ignored by other dialects): closed tasks never need the overdue scan
+    op.create_index(
+        'ix_tasks_status_deadline',
+        'tasks',
+        ['status', 'deadline'],
+        unique=False,
+        postgresql_where=sa.text("status <> 'DONE'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_status_deadline', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_status', table_name='tasks')
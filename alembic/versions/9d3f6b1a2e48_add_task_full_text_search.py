@@ -0,0 +1,56 @@
+"""add full-text search over task title/description
+
+Revision ID: 9d3f6b1a2e48
+Revises: e4a2c9f17b35
+Create Date: 2026-10-18 16:40:12.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f6b1a2e48'
+down_revision: Union[str, Sequence[str], None] = 'e4a2c9f17b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        # FTS5 over tasks, kept in sync by triggers (see app/models/task.py)
+        op.execute("CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description, content='tasks', content_rowid='id')")
+        op.execute("INSERT INTO tasks_fts(tasks_fts, rank) VALUES ('rank', 'bm25(2.0, 1.0)')")
+        op.execute("""CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END""")
+        op.execute("""CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        END""")
+        op.execute("""CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END""")
+        # index the rows that already exist
+        op.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        # expression index: nothing to keep in sync, the planner matches the query's expression
+        op.execute(
+            "CREATE INDEX ix_tasks_fts ON tasks USING gin "
+            "(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, '')))"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for trigger in ('tasks_fts_au', 'tasks_fts_ad', 'tasks_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS tasks_fts")
+    elif dialect == 'postgresql':
+        op.drop_index('ix_tasks_fts', table_name='tasks')
@@ -0,0 +1,28 @@
+"""add task index for keyset pagination
+
+Revision ID: b3f5a8e1c2d7
+Revises: 7c1e9b2d4f60
+Create Date: 2026-10-18 11:02:17.540913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f5a8e1c2d7'
+down_revision: Union[str, Sequence[str], None] = '7c1e9b2d4f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_project_id_id', 'tasks', ['project_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_project_id_id', table_name='tasks')
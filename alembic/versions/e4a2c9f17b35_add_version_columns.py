@@ -0,0 +1,33 @@
+"""add version columns for optimistic concurrency
+
+Revision ID: e4a2c9f17b35
+Revises: b3f5a8e1c2d7
+Create Date: 2026-10-18 14:21:05.318264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a2c9f17b35'
+down_revision: Union[str, Sequence[str], None] = 'b3f5a8e1c2d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # existing rows start at version 1
+    op.add_column('projects', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('tasks', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('version')
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from fastapi import Header, HTTPException, Request, Response
+
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))
+# seconds; 0 (default) disables caching. Only writes made through this
+# process invalidate entries (see VersionRegistry), so enable it only when
+# this API process is the sole writer, or when TTL-long staleness is fine
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "0"))
+
+
+def make_etag(version: int, body: bytes) -> str:
+    # the body checksum keeps ETags honest even when the version did not
+    # move (writes from another process)
+    return f'W/"{version}-{zlib.crc32(body):08x}"'
+
+
+def version_etag(version: int) -> str:
+    """Strong ETag of a single task/project: its row version (If-Match input)."""
+    return f'"{version}"'
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """
+    Row version required by an If-Match header; None for no header or "*".
+    Raises ValueError for anything but one strong version ETag (weak tags
+    never match If-Match).
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip()
+    if len(tag) < 3 or tag[0] != '"' or tag[-1] != '"' or not tag[1:-1].isdigit():
+        raise ValueError(f"If-Match must be a version ETag like '\"3\"', got {if_match!r}")
+    return int(tag[1:-1])
+
+
+def if_match_version(
+    if_match: Optional[str] = Header(None, description="ETag of the version being edited; 409 if stale"),
+) -> Optional[int]:
+    """Dependency for PUT/PATCH: the expected row version, 400 on a malformed header."""
+    try:
+        return parse_if_match(if_match)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison against an If-None-Match header value."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def conditional_response(request: Request, body: bytes, etag: str) -> Response:
+    """200 with the body, or 304 if the request's If-None-Match already has `etag`."""
+    headers = {"ETag": etag}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """
+    LRU of serialized JSON bodies keyed by (key, version). With ttl <= 0
+    nothing is cached: every request is answered from the database, and
+    the weak ETag still gives 304s for unchanged bodies.
+    """
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # {key: (version, expires_at, body, etag)}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, request: Request, key: Hashable, version: int) -> Optional[Response]:
+        """Cached response (200 or 304) for this version, or None on a miss."""
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version or entry[1] < time.monotonic():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        _, _, body, etag = entry
+        return conditional_response(request, body, etag)
+
+    def store(self, request: Request, key: Hashable, version: int, body: bytes) -> Response:
+        """Cache a freshly serialized body and answer the request with it."""
+        etag = make_etag(version, body)
+        if self.ttl <= 0:
+            return conditional_response(request, body, etag)
+        with self._lock:
+            self._entries[key] = (version, time.monotonic() + self.ttl, body, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return conditional_response(request, body, etag)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+response_cache = ResponseCache()
+
+
+def cache_key(request: Request) -> tuple:
+    return (request.url.path, str(request.query_params))
@@ -0,0 +1,47 @@
+import threading
+
+
+class VersionRegistry:
+    """
+    In-process change counters. Every mutating service call bumps the
+    project it touched; the global counter moves on any change (it backs
+    the project list, whose task counts depend on every project).
+
+    Only this process's writes are seen: other API workers, the CLI and
+    the autoclose command change the DB without bumping these counters,
+    which is why ResponseCache is off unless RESPONSE_CACHE_TTL is set.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._global = 0
+        self._base = 0       # floor for every project, raised by bump_all()
+        self._projects = {}  # {project_id: version}
+
+    def project(self, project_id: int) -> int:
+        return max(self._projects.get(project_id, 0), self._base)
+
+    def all(self) -> int:
+        return self._global
+
+    def bump(self, project_id: int) -> None:
+        with self._lock:
+            self._global += 1
+            # stamp with the global counter so a bumped project never reuses an old value
+            self._projects[project_id] = self._global
+
+    def bump_all(self) -> None:
+        """For writes that may touch any project (e.g. autoclose)."""
+        with self._lock:
+            self._global += 1
+            self._projects.clear()
+            self._base = self._global
+
+    def reset(self) -> None:
+        with self._lock:
+            self._global = 0
+            self._base = 0
+            self._projects.clear()
+
+
+versions = VersionRegistry()
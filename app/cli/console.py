@@ -1,24 +1,24 @@
-import time
-import schedule
-from app.db.session import SessionLocal
-from app.commands.autoclose_overdue import autoclose_overdue_tasks
+import os
+from app.db.session import get_sessionmaker
+from app.commands.autoclose_scheduler import MAX_SLEEP_SECONDS, DeadlineScheduler
+
+
+def report(closed_count, next_deadline):
+    if closed_count:
+        print(f"[autoclose] closed {closed_count} overdue tasks (next deadline: {next_deadline or 'none'})")
 
-def job():
-    db = SessionLocal()
-    try:
-        closed_count = autoclose_overdue_tasks(db)
-        print(f"[autoclose] closed {closed_count} overdue tasks")
-    finally:
-        db.close()
 
 def main():
-    # هر 10 دقیقه یک بار
-    schedule.every(10).minutes.do(job)
+    # wakes at the next open deadline; AUTOCLOSE_MAX_SLEEP caps the sleep and
+    # so bounds how late deadlines set by the API/CLI processes are picked up
+    max_sleep = float(os.getenv("AUTOCLOSE_MAX_SLEEP", MAX_SLEEP_SECONDS))
+    scheduler = DeadlineScheduler(get_sessionmaker(), max_sleep=max_sleep, on_round=report)
 
     print("Autoclose scheduler started...")
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        pass
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
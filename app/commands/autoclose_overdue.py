@@ -2,22 +2,33 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from app.repositories.task_repository import TaskRepository
 from app.models.task import StatusEnum
+from app.cache.versions import versions
 
-def autoclose_overdue_tasks(db: Session) -> int:
+def autoclose_overdue_tasks(db: Session, bulk: bool = True, batch_size: int = 5000) -> int:
     """
     Finds all tasks with deadline < now and status != DONE
     and closes them. Returns number of closed tasks.
 ردیف‌های overdue رو می‌بنده و تعدادش رو برمی‌گردونه.
+
+    bulk=True runs set-based UPDATEs in batches of `batch_size` rows;
+    bulk=False keeps the old load-and-modify ORM loop.
     """
     repo = TaskRepository(db)
-    overdue_tasks = repo.list_overdue_open_tasks()
-
     now = datetime.utcnow()
-    for t in overdue_tasks:
-        t.status = StatusEnum.DONE
-        t.closed_at = now
 
-    if overdue_tasks:
-        db.commit()
+    if bulk:
+        closed = repo.close_overdue_open_tasks(now, batch_size=batch_size)
+    else:
+        overdue_tasks = repo.list_overdue_open_tasks()
+
+        for t in overdue_tasks:
+            t.status = StatusEnum.DONE
+            t.closed_at = now
+
+        if overdue_tasks:
+            db.commit()
+        closed = len(overdue_tasks)
 
-    return len(overdue_tasks)
\ No newline at end of file
+    if closed:
+        versions.bump_all()
+    return closed
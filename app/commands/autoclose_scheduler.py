@@ -0,0 +1,94 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Optional
+
+from app.commands.autoclose_overdue import autoclose_overdue_tasks
+from app.events import DeadlineNotifier, deadline_notifier
+from app.repositories.task_repository import TaskRepository
+
+# upper bound on one sleep: also how late a deadline set by another process
+# (API worker, CLI) can be noticed, since those cannot wake this one
+MAX_SLEEP_SECONDS = 60.0
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """
+    Closes overdue tasks when they become due instead of polling.
+
+    Each round closes what is overdue, asks the DB for the next open
+    deadline and sleeps until then (at most max_sleep seconds). A
+    notify() with an earlier deadline cuts the sleep short.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        max_sleep: float = MAX_SLEEP_SECONDS,
+        notifier: DeadlineNotifier = deadline_notifier,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        on_round: Optional[Callable[[int, Optional[datetime]], None]] = None,
+    ):
+        self.session_factory = session_factory
+        self.max_sleep = max_sleep
+        self.notifier = notifier
+        self.clock = clock
+        self.on_round = on_round
+        self.next_deadline: Optional[datetime] = None
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def notify(self, deadline: datetime) -> None:
+        next_deadline = self.next_deadline
+        if next_deadline is None or deadline < next_deadline:
+            self._wake.set()
+
+    def run_once(self) -> int:
+        """Close due tasks and plan the next wakeup. Returns closed count."""
+        db = self.session_factory()
+        try:
+            closed = autoclose_overdue_tasks(db)
+            self.next_deadline = TaskRepository(db).next_open_deadline()
+        finally:
+            db.close()
+        if self.on_round is not None:
+            self.on_round(closed, self.next_deadline)
+        return closed
+
+    def sleep_seconds(self) -> float:
+        if self.next_deadline is None:
+            return self.max_sleep
+        remaining = (self.next_deadline - self.clock()).total_seconds()
+        return min(max(remaining, 0.0), self.max_sleep)
+
+    def run(self) -> None:
+        """Loop until stop(); blocks the calling thread."""
+        self.notifier.subscribe(self.notify)
+        try:
+            while not self._stopped.is_set():
+                # cleared before the scan so a notify() during it is not lost
+                self._wake.clear()
+                try:
+                    self.run_once()
+                except Exception:
+                    # e.g. DB unreachable: retry after max_sleep rather than die
+                    logger.exception("autoclose round failed")
+                    self.next_deadline = None
+                self._wake.wait(self.sleep_seconds())
+        finally:
+            self.notifier.unsubscribe(self.notify)
+
+    def start(self) -> "DeadlineScheduler":
+        self._thread = threading.Thread(target=self.run, name="autoclose-scheduler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,46 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.controllers.async_task_controller import get_task_service
+from app.controllers.export_controller import ExportFormat, export_response
+from app.schemas.task_schema import dump_csv_chunk, dump_ndjson_chunk
+from app.services.async_task_service import AsyncTaskService
+from app.services.project_service import ProjectNotFound
+
+# Mirrors export_controller with async def endpoints; used when DB_MODE=async
+router = APIRouter(tags=["export"])
+
+
+async def encode_chunks(chunks, fmt: str):
+    if fmt == "csv":
+        yield dump_csv_chunk([], header=True)
+        async for chunk in chunks:
+            yield dump_csv_chunk(chunk)
+    else:
+        async for chunk in chunks:
+            yield dump_ndjson_chunk(chunk)
+
+
+async def _export(service: AsyncTaskService, fmt: str, project_id: Optional[int], filename: str):
+    try:
+        chunks = await service.export_chunks(project_id)
+    except ProjectNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return export_response(encode_chunks(chunks, fmt), fmt, filename)
+
+
+@router.get("/projects/{project_id}/tasks/export")
+async def export_project_tasks(
+    project_id: int,
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    return await _export(service, fmt, project_id, f"project-{project_id}-tasks")
+
+
+@router.get("/tasks/export")
+async def export_all_tasks(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    return await _export(service, fmt, None, "tasks")
@@ -0,0 +1,92 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.response_cache import cache_key, conditional_response, if_match_version, response_cache, version_etag
+from app.cache.versions import versions
+from app.db.deps import get_async_db
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.services.async_project_service import AsyncProjectService
+from app.services.project_service import ProjectNotFound, ValidationError, VersionConflict
+from app.schemas.project_schema import ProjectCreate, ProjectUpdate, ProjectOut, ProjectPage, dump_project_page
+
+# Mirrors project_controller with async def endpoints; used when DB_MODE=async
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+
+def get_project_service(db: AsyncSession = Depends(get_async_db)) -> AsyncProjectService:
+    repo = AsyncProjectRepository(db)
+    return AsyncProjectService(repo)
+
+
+@router.post("/", response_model=ProjectOut, status_code=status.HTTP_201_CREATED)
+async def create_project(
+    data: ProjectCreate,
+    response: Response,
+    service: AsyncProjectService = Depends(get_project_service),
+):
+    try:
+        project = await service.create_project(data.name, data.description or "")
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = version_etag(project.version)
+    return project
+
+
+@router.get("/", response_model=ProjectPage)
+async def list_projects(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[int] = Query(None, ge=0, description="next_cursor of the previous page"),
+    service: AsyncProjectService = Depends(get_project_service),
+):
+    # task counts make this depend on every project -> global version
+    key, version = cache_key(request), versions.all()
+    cached = response_cache.lookup(request, key, version)
+    if cached is not None:
+        return cached
+
+    rows, next_cursor = await service.list_projects_page(limit, after=after, as_rows=True)
+    return response_cache.store(request, key, version, dump_project_page(rows, next_cursor))
+
+
+@router.get("/{project_id}", response_model=ProjectOut)
+async def get_project(project_id: int, request: Request, service: AsyncProjectService = Depends(get_project_service)):
+    # not cached: the ETag is the row version, which other processes also
+    # bump, and a stale one would make every If-Match write 409
+    try:
+        project = await service.get_project(project_id)
+    except ProjectNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    body = ProjectOut.model_validate(project).model_dump_json().encode()
+    return conditional_response(request, body, version_etag(project.version))
+
+
+@router.put("/{project_id}", response_model=ProjectOut)
+async def update_project(
+    project_id: int,
+    data: ProjectUpdate,
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    service: AsyncProjectService = Depends(get_project_service),
+):
+    try:
+        project = await service.update_project(
+            project_id, data.model_dump(exclude_unset=True), expected_version=expected_version
+        )
+    except ProjectNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    response.headers["ETag"] = version_etag(project.version)
+    return project
+
+
+@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_project(project_id: int, service: AsyncProjectService = Depends(get_project_service)):
+    try:
+        await service.delete_project(project_id)
+    except ProjectNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
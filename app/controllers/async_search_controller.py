@@ -0,0 +1,54 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from app.cache.response_cache import cache_key, response_cache
+from app.cache.versions import versions
+from app.controllers.async_task_controller import get_task_service
+from app.schemas.task_schema import TaskSearchPage, dump_task_search_page
+from app.services.async_task_service import AsyncTaskService
+from app.services.project_service import ProjectNotFound
+from app.services.task_service import ValidationError
+
+# Mirrors search_controller with async def endpoints; used when DB_MODE=async
+router = APIRouter(tags=["search"])
+
+
+async def _search(
+    request: Request, service: AsyncTaskService, q: str, project_id: Optional[int], limit: int, offset: int
+):
+    key = cache_key(request)
+    version = versions.all() if project_id is None else versions.project(project_id)
+    cached = response_cache.lookup(request, key, version)
+    if cached is not None:
+        return cached
+
+    try:
+        rows, next_offset = await service.search_tasks(q, project_id, limit=limit, offset=offset)
+    except ProjectNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return response_cache.store(request, key, version, dump_task_search_page(rows, next_offset))
+
+
+@router.get("/projects/{project_id}/tasks/search", response_model=TaskSearchPage)
+async def search_project_tasks(
+    project_id: int,
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10_000),
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    return await _search(request, service, q, project_id, limit, offset)
+
+
+@router.get("/tasks/search", response_model=TaskSearchPage)
+async def search_all_tasks(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10_000),
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    return await _search(request, service, q, None, limit, offset)
@@ -0,0 +1,149 @@
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.response_cache import cache_key, conditional_response, if_match_version, response_cache, version_etag
+from app.cache.versions import versions
+from app.db.deps import get_async_db
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.services.async_task_service import AsyncTaskService
+from app.services.project_service import VersionConflict
+from app.services.task_service import TaskNotFound, ValidationError, BulkValidationError
+from app.schemas.task_schema import TaskCreate, TaskUpdate, TaskOut, TaskPage, TaskBulkOut, StatusEnum, dump_task_page
+
+# Mirrors task_controller with async def endpoints; used when DB_MODE=async
+router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["tasks"])
+
+
+def get_task_service(db: AsyncSession = Depends(get_async_db)) -> AsyncTaskService:
+    task_repo = AsyncTaskRepository(db)
+    project_repo = AsyncProjectRepository(db)
+    return AsyncTaskService(task_repo, project_repo)
+
+
+@router.post("/", response_model=TaskOut, status_code=status.HTTP_201_CREATED)
+async def create_task(
+    project_id: int,
+    data: TaskCreate,
+    response: Response,
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    try:
+        task = await service.add_task(project_id, data.title, data.description or "", data.deadline)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = version_etag(task.version)
+    return task
+
+
+@router.post("/bulk", response_model=TaskBulkOut, status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(
+    project_id: int,
+    data: List[TaskCreate],
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    """All-or-nothing: any invalid item -> 400 with per-item errors, nothing inserted."""
+    try:
+        rows = await service.add_tasks_bulk(project_id, [d.model_dump() for d in data])
+    except BulkValidationError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "errors": e.errors})
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return TaskBulkOut(items=rows)
+
+
+@router.get("/", response_model=TaskPage)
+async def list_tasks(
+    project_id: int,
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[int] = Query(None, ge=0, description="next_cursor of the previous page"),
+    status_filter: Optional[StatusEnum] = Query(None, alias="status"),
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    key, version = cache_key(request), versions.project(project_id)
+    cached = response_cache.lookup(request, key, version)
+    if cached is not None:
+        return cached
+
+    try:
+        items, next_cursor = await service.list_tasks_page(
+            project_id,
+            limit,
+            after=after,
+            status=status_filter,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            as_rows=True,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return response_cache.store(request, key, version, dump_task_page(items, next_cursor))
+
+
+@router.get("/{task_id}", response_model=TaskOut)
+async def get_task(project_id: int, task_id: int, request: Request, service: AsyncTaskService = Depends(get_task_service)):
+    # not cached: the ETag is the row version, which other processes also
+    # bump, and a stale one would make every If-Match write 409
+    try:
+        task = await service.get_task(task_id)
+        if task.project_id != project_id:
+            raise TaskNotFound("Task not found in this project")
+    except TaskNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    body = TaskOut.model_validate(task).model_dump_json().encode()
+    return conditional_response(request, body, version_etag(task.version))
+
+
+@router.put("/{task_id}", response_model=TaskOut)
+async def update_task(
+    project_id: int,
+    task_id: int,
+    data: TaskUpdate,
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    try:
+        task = await service.update_task(task_id, data.model_dump(exclude_unset=True), expected_version=expected_version)
+    except TaskNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    response.headers["ETag"] = version_etag(task.version)
+    return task
+
+
+@router.patch("/{task_id}/status", response_model=TaskOut)
+async def change_status(
+    project_id: int,
+    task_id: int,
+    status_value: str,
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    try:
+        task = await service.change_status(task_id, status_value, expected_version=expected_version)
+    except TaskNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    response.headers["ETag"] = version_etag(task.version)
+    return task
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task(project_id: int, task_id: int, service: AsyncTaskService = Depends(get_task_service)):
+    try:
+        await service.delete_task(task_id)
+    except TaskNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,61 @@
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.controllers.task_controller import get_task_service
+from app.schemas.task_schema import dump_csv_chunk, dump_ndjson_chunk
+from app.services.project_service import ProjectNotFound
+from app.services.task_service import TaskService
+
+# Included before the task router so /projects/{id}/tasks/export is not
+# taken for a task id.
+router = APIRouter(tags=["export"])
+
+ExportFormat = Literal["ndjson", "csv"]
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+def encode_chunks(chunks, fmt: str):
+    if fmt == "csv":
+        # header first: the client gets bytes before the query has returned anything
+        yield dump_csv_chunk([], header=True)
+        for chunk in chunks:
+            yield dump_csv_chunk(chunk)
+    else:
+        for chunk in chunks:
+            yield dump_ndjson_chunk(chunk)
+
+
+def export_response(body, fmt: str, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
+
+
+def _export(service: TaskService, fmt: str, project_id: Optional[int], filename: str) -> StreamingResponse:
+    try:
+        chunks = service.export_chunks(project_id)
+    except ProjectNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return export_response(encode_chunks(chunks, fmt), fmt, filename)
+
+
+@router.get("/projects/{project_id}/tasks/export")
+def export_project_tasks(
+    project_id: int,
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    service: TaskService = Depends(get_task_service),
+):
+    """Every task of the project, streamed as NDJSON (TaskOut per line) or CSV."""
+    return _export(service, fmt, project_id, f"project-{project_id}-tasks")
+
+
+@router.get("/tasks/export")
+def export_all_tasks(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    service: TaskService = Depends(get_task_service),
+):
+    """Every task of every project, ordered by project then id."""
+    return _export(service, fmt, None, "tasks")
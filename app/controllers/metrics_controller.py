@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Response
+
+from app.db import session
+from app.metrics.middleware import HTTP_METRICS
+from app.metrics.prometheus import CONTENT_TYPE, render, render_gauges
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+def _pool_snapshots() -> dict:
+    data = {"sync": session.pool_metrics.snapshot()}
+    if session.async_pool_metrics is not None:
+        data["async"] = session.async_pool_metrics.snapshot()
+    return data
+
+
+@router.get("", response_class=Response)
+def prometheus_metrics():
+    """Request latency/status/SQL histograms and pool stats, Prometheus text format."""
+    body = render(HTTP_METRICS) + render_gauges("db_pool", "Connection pool stats", _pool_snapshots())
+    return Response(body, media_type=CONTENT_TYPE)
+
+
+@router.get("/pool")
+def pool_stats():
+    """Connection pool counters/gauges, to size DB_POOL_* from real traffic."""
+    return _pool_snapshots()
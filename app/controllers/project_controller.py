@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
+from app.cache.response_cache import cache_key, conditional_response, if_match_version, response_cache, version_etag
+from app.cache.versions import versions
 from app.db.deps import get_db
 from app.repositories.project_repository import ProjectRepository
-from app.services.project_service import ProjectService, ProjectNotFound, ValidationError
-from app.schemas.project_schema import ProjectCreate, ProjectUpdate, ProjectOut
+from app.services.project_service import ProjectService, ProjectNotFound, ValidationError, VersionConflict
+from app.schemas.project_schema import ProjectCreate, ProjectUpdate, ProjectOut, ProjectPage, dump_project_page
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -17,39 +20,66 @@ def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
 @router.post("/", response_model=ProjectOut, status_code=status.HTTP_201_CREATED)
 def create_project(
     data: ProjectCreate,
+    response: Response,
     service: ProjectService = Depends(get_project_service),
 ):
     try:
-        return service.create_project(data.name, data.description or "")
+        project = service.create_project(data.name, data.description or "")
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = version_etag(project.version)
+    return project
 
 
-@router.get("/", response_model=list[ProjectOut])
-def list_projects(service: ProjectService = Depends(get_project_service)):
-    return service.list_projects()
+@router.get("/", response_model=ProjectPage)
+def list_projects(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[int] = Query(None, ge=0, description="next_cursor of the previous page"),
+    service: ProjectService = Depends(get_project_service),
+):
+    # task counts make this depend on every project -> global version
+    key, version = cache_key(request), versions.all()
+    cached = response_cache.lookup(request, key, version)
+    if cached is not None:
+        return cached
+
+    rows, next_cursor = service.list_projects_page(limit, after=after, as_rows=True)
+    return response_cache.store(request, key, version, dump_project_page(rows, next_cursor))
 
 
 @router.get("/{project_id}", response_model=ProjectOut)
-def get_project(project_id: int, service: ProjectService = Depends(get_project_service)):
+def get_project(project_id: int, request: Request, service: ProjectService = Depends(get_project_service)):
+    # not cached: the ETag is the row version, which other processes also
+    # bump, and a stale one would make every If-Match write 409
     try:
-        return service.get_project(project_id)
+        project = service.get_project(project_id)
     except ProjectNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
+    body = ProjectOut.model_validate(project).model_dump_json().encode()
+    return conditional_response(request, body, version_etag(project.version))
 
 
 @router.put("/{project_id}", response_model=ProjectOut)
 def update_project(
     project_id: int,
     data: ProjectUpdate,
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
     service: ProjectService = Depends(get_project_service),
 ):
     try:
-        return service.update_project(project_id, data.model_dump(exclude_unset=True))
+        project = service.update_project(
+            project_id, data.model_dump(exclude_unset=True), expected_version=expected_version
+        )
     except ProjectNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    response.headers["ETag"] = version_etag(project.version)
+    return project
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
+from app.cache.response_cache import cache_key, conditional_response, if_match_version, response_cache, version_etag
+from app.cache.versions import versions
 from app.db.deps import get_db
 from app.repositories.task_repository import TaskRepository
 from app.repositories.project_repository import ProjectRepository
-from app.services.task_service import TaskService, TaskNotFound, ValidationError
-from app.schemas.task_schema import TaskCreate, TaskUpdate, TaskOut
+from app.services.project_service import VersionConflict
+from app.services.task_service import TaskService, TaskNotFound, ValidationError, BulkValidationError
+from app.schemas.task_schema import TaskCreate, TaskUpdate, TaskOut, TaskPage, TaskBulkOut, StatusEnum, dump_task_page
 
 router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["tasks"])
 
@@ -20,29 +25,77 @@ def get_task_service(db: Session = Depends(get_db)) -> TaskService:
 def create_task(
     project_id: int,
     data: TaskCreate,
+    response: Response,
     service: TaskService = Depends(get_task_service),
 ):
     try:
-        return service.add_task(project_id, data.title, data.description or "", data.deadline)
+        task = service.add_task(project_id, data.title, data.description or "", data.deadline)
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = version_etag(task.version)
+    return task
 
 
-@router.get("/", response_model=list[TaskOut])
-def list_tasks(project_id: int, service: TaskService = Depends(get_task_service)):
-    return service.list_tasks_by_project(project_id)
+@router.post("/bulk", response_model=TaskBulkOut, status_code=status.HTTP_201_CREATED)
+def create_tasks_bulk(
+    project_id: int,
+    data: List[TaskCreate],
+    service: TaskService = Depends(get_task_service),
+):
+    """All-or-nothing: any invalid item -> 400 with per-item errors, nothing inserted."""
+    try:
+        rows = service.add_tasks_bulk(project_id, [d.model_dump() for d in data])
+    except BulkValidationError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "errors": e.errors})
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return TaskBulkOut(items=rows)
+
+
+@router.get("/", response_model=TaskPage)
+def list_tasks(
+    project_id: int,
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[int] = Query(None, ge=0, description="next_cursor of the previous page"),
+    status_filter: Optional[StatusEnum] = Query(None, alias="status"),
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    service: TaskService = Depends(get_task_service),
+):
+    key, version = cache_key(request), versions.project(project_id)
+    cached = response_cache.lookup(request, key, version)
+    if cached is not None:
+        return cached
+
+    try:
+        items, next_cursor = service.list_tasks_page(
+            project_id,
+            limit,
+            after=after,
+            status=status_filter,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            as_rows=True,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return response_cache.store(request, key, version, dump_task_page(items, next_cursor))
 
 
 @router.get("/{task_id}", response_model=TaskOut)
-def get_task(project_id: int, task_id: int, service: TaskService = Depends(get_task_service)):
+def get_task(project_id: int, task_id: int, request: Request, service: TaskService = Depends(get_task_service)):
+    # not cached: the ETag is the row version, which other processes also
+    # bump, and a stale one would make every If-Match write 409
     try:
         task = service.get_task(task_id)
         # (اختیاری) چک تعلق به پروژه
         if task.project_id != project_id:
             raise TaskNotFound("Task not found in this project")
-        return task
     except TaskNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
+    body = TaskOut.model_validate(task).model_dump_json().encode()
+    return conditional_response(request, body, version_etag(task.version))
 
 
 @router.put("/{task_id}", response_model=TaskOut)
@@ -50,14 +103,20 @@ def update_task(
     project_id: int,
     task_id: int,
     data: TaskUpdate,
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
     service: TaskService = Depends(get_task_service),
 ):
     try:
-        return service.update_task(task_id, data.model_dump(exclude_unset=True))
+        task = service.update_task(task_id, data.model_dump(exclude_unset=True), expected_version=expected_version)
     except TaskNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    response.headers["ETag"] = version_etag(task.version)
+    return task
 
 
 @router.patch("/{task_id}/status", response_model=TaskOut)
@@ -65,14 +124,20 @@ def change_status(
     project_id: int,
     task_id: int,
     status_value: str,
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
     service: TaskService = Depends(get_task_service),
 ):
     try:
-        return service.change_status(task_id, status_value)
+        task = service.change_status(task_id, status_value, expected_version=expected_version)
     except TaskNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    response.headers["ETag"] = version_etag(task.version)
+    return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
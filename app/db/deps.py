@@ -1,9 +1,16 @@
-from typing import Generator
-from app.db.session import SessionLocal
+from typing import AsyncGenerator, Generator
+from app.db.session import get_async_sessionmaker, get_sessionmaker
 
 def get_db() -> Generator:
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db() -> AsyncGenerator:
+    AsyncSessionLocal = get_async_sessionmaker()
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database access requires DB_MODE=async")
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,58 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+
+class RequestDbStats:
+    """Queries run and time spent in the DB driver for one request."""
+
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# set per request by MetricsMiddleware. Sync endpoints run in a threadpool
+# with a copy of the context, which still points at the same stats object.
+current_request_db: ContextVar[Optional[RequestDbStats]] = ContextVar("current_request_db", default=None)
+
+
+class QueryTimer:
+    """
+    Times every cursor execute on an engine and charges it to the current
+    request's RequestDbStats (queries outside a request are not recorded).
+    """
+
+    def attach(self, engine) -> "QueryTimer":
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        event.listen(engine, "handle_error", self._on_error)
+        return self
+
+    def detach(self, engine) -> None:
+        event.remove(engine, "before_cursor_execute", self._before)
+        event.remove(engine, "after_cursor_execute", self._after)
+        event.remove(engine, "handle_error", self._on_error)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if current_request_db.get() is not None:
+            conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        stats = current_request_db.get()
+        starts = conn.info.get("query_start")
+        if stats is None or not starts:
+            return
+        stats.queries += 1
+        stats.seconds += time.perf_counter() - starts.pop()
+
+    def _on_error(self, exception_context):
+        # a failed execute never reaches _after; drop its start time
+        conn = exception_context.connection
+        if conn is not None and current_request_db.get() is not None:
+            starts = conn.info.get("query_start")
+            if starts:
+                starts.pop()
@@ -1,11 +1,121 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 import os
+import threading
 from dotenv import load_dotenv
+from app.db.pool_metrics import PoolMetrics, TimedAsyncAdaptedQueuePool, TimedQueuePool
+from app.db.query_metrics import QueryTimer
 
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL") or "sqlite:///./dev.db"
+# "sync" (default) or "async"; async needs asyncpg / aiosqlite installed
+DB_MODE = os.getenv("DB_MODE", "sync").lower()
 
-engine = create_engine(DATABASE_URL, echo=False, future=True)
-import app.models
-SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, future=True)
\ No newline at end of file
+
+def pool_options(url: str, async_: bool = False) -> dict:
+    """
+    Engine pool kwargs from the DB_POOL_* environment variables.
+    In-memory SQLite keeps SQLAlchemy's single-connection pool.
+    """
+    u = make_url(url)
+    if u.get_backend_name() == "sqlite" and u.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if async_ else TimedQueuePool,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+        # seconds; -1 disables recycling
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", -1)),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "false").lower() in ("1", "true", "yes"),
+    }
+
+
+# Engines are created on first use (get_engine() / get_sessionmaker(), or the
+# module attributes `engine`, `SessionLocal`, ... via __getattr__ below), so
+# importing this module does not connect or load the ORM models.
+pool_metrics = PoolMetrics()
+query_timer = QueryTimer()
+_lock = threading.Lock()
+_engine = None
+_SessionLocal = None
+
+
+def get_engine():
+    global _engine, _SessionLocal
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                import app.models  # noqa: F401  (registers the mappers)
+
+                engine = create_engine(DATABASE_URL, echo=False, future=True, **pool_options(DATABASE_URL))
+                pool_metrics.attach(engine)
+                query_timer.attach(engine)
+                _SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, future=True)
+                _engine = engine
+    return _engine
+
+
+def get_sessionmaker():
+    get_engine()
+    return _SessionLocal
+
+
+def to_async_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto the matching asyncio driver."""
+    for sync_prefix, async_prefix in (
+        ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+        ("postgresql://", "postgresql+asyncpg://"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+    ):
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+async_pool_metrics = PoolMetrics() if DB_MODE == "async" else None
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def get_async_engine():
+    """The DB_MODE=async engine (None in sync mode)."""
+    global _async_engine, _AsyncSessionLocal
+    if DB_MODE != "async":
+        return None
+    if _async_engine is None:
+        with _lock:
+            if _async_engine is None:
+                import app.models  # noqa: F401
+                from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+                engine = create_async_engine(
+                    ASYNC_DATABASE_URL, echo=False, **pool_options(ASYNC_DATABASE_URL, async_=True)
+                )
+                async_pool_metrics.attach(engine.sync_engine)
+                query_timer.attach(engine.sync_engine)
+                _AsyncSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+                _async_engine = engine
+    return _async_engine
+
+
+def get_async_sessionmaker():
+    get_async_engine()
+    return _AsyncSessionLocal
+
+
+_LAZY = {
+    "engine": get_engine,
+    "SessionLocal": get_sessionmaker,
+    "async_engine": get_async_engine,
+    "AsyncSessionLocal": get_async_sessionmaker,
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return _LAZY[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,49 @@
+"""
+In-process events between the task services and background workers.
+
+Lives outside app.commands so the services do not import the scheduler
+(and through it the autoclose command) just to announce a deadline.
+"""
+import logging
+from datetime import datetime
+from typing import Callable, Optional
+
+from app.models.task import OPEN_STATUSES, naive_utc
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineNotifier:
+    """
+    In-process signal that an open task got a (new) deadline. The task
+    services call notify(); a running DeadlineScheduler subscribes so it can
+    wake up before its planned time. With no subscriber this is a no-op.
+    Callers notify after their write has committed, so a failing listener
+    is logged and never raised to them.
+    """
+
+    def __init__(self):
+        self._listeners = []
+
+    def subscribe(self, callback: Callable[[datetime], None]) -> None:
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[datetime], None]) -> None:
+        self._listeners.remove(callback)
+
+    def notify(self, deadline: Optional[datetime]) -> None:
+        if deadline is None:
+            return
+        deadline = naive_utc(deadline)
+        for callback in list(self._listeners):
+            try:
+                callback(deadline)
+            except Exception:
+                logger.exception("deadline listener failed")
+
+    def task_changed(self, task) -> None:
+        if task.status in OPEN_STATUSES:
+            self.notify(task.deadline)
+
+
+deadline_notifier = DeadlineNotifier()
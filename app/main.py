@@ -1,13 +1,64 @@
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.controllers.project_controller import router as project_router
-from app.controllers.task_controller import router as task_router
+from app.db.session import DB_MODE
+from app.controllers.metrics_controller import router as metrics_router
+from app.metrics.middleware import MetricsMiddleware
 
-app = FastAPI(title="ToDoList Web API", version="3.0.0")
 
-app.include_router(project_router)
-app.include_router(task_router)
+def create_app(db_mode: str = DB_MODE) -> FastAPI:
+    lifespan = None
+    if db_mode != "async" and os.getenv("AUTOCLOSE_IN_APP", "false").lower() in ("1", "true", "yes"):
+        lifespan = _autoclose_lifespan()
 
+    app = FastAPI(title="ToDoList Web API", version="3.0.0", lifespan=lifespan)
+    app.add_middleware(MetricsMiddleware)
 
-@app.get("/")
-def root():
-    return {"status": "ok", "message": "ToDoList API is running"}
\ No newline at end of file
+    if db_mode == "async":
+        from app.controllers.async_export_controller import router as export_router
+        from app.controllers.async_project_controller import router as project_router
+        from app.controllers.async_search_controller import router as search_router
+        from app.controllers.async_task_controller import router as task_router
+    else:
+        from app.controllers.export_controller import router as export_router
+        from app.controllers.project_controller import router as project_router
+        from app.controllers.search_controller import router as search_router
+        from app.controllers.task_controller import router as task_router
+
+    app.include_router(project_router)
+    app.include_router(export_router)
+    app.include_router(search_router)
+    app.include_router(task_router)
+    app.include_router(metrics_router)
+
+    @app.get("/")
+    def root():
+        return {"status": "ok", "message": "ToDoList API is running"}
+
+    return app
+
+
+def _autoclose_lifespan():
+    """
+    Autoclose inside the API process: task writes here wake the scheduler
+    directly, so deadlines are met without waiting for AUTOCLOSE_MAX_SLEEP.
+    Enable in one worker only.
+    """
+    from app.cli.console import report
+    from app.commands.autoclose_scheduler import MAX_SLEEP_SECONDS, DeadlineScheduler
+    from app.db.session import get_sessionmaker
+
+    max_sleep = float(os.getenv("AUTOCLOSE_MAX_SLEEP", MAX_SLEEP_SECONDS))
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        scheduler = DeadlineScheduler(get_sessionmaker(), max_sleep=max_sleep, on_round=report).start()
+        try:
+            yield
+        finally:
+            scheduler.stop()
+
+    return lifespan
+
+
+app = create_app()
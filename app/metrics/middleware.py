@@ -0,0 +1,80 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+
+from app.db.query_metrics import RequestDbStats, current_request_db
+from app.metrics.prometheus import COUNT_BUCKETS, Counter, Histogram
+
+# label values are route templates ("/projects/{project_id}"), never raw paths,
+# so the number of series stays bounded
+UNMATCHED_ROUTE = "<unmatched>"
+
+http_requests_total = Counter(
+    "http_requests_total", "HTTP responses by route and status code.", ("method", "route", "status")
+)
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds", "Time from request to last body byte.", ("method", "route")
+)
+http_request_db_queries = Histogram(
+    "http_request_db_queries", "SQL statements executed per request.", ("method", "route"), buckets=COUNT_BUCKETS
+)
+http_request_db_seconds = Histogram(
+    "http_request_db_seconds", "Time spent in the DB driver per request.", ("method", "route")
+)
+
+HTTP_METRICS = (http_requests_total, http_request_duration_seconds, http_request_db_queries, http_request_db_seconds)
+
+
+def reset_http_metrics() -> None:
+    for metric in HTTP_METRICS:
+        metric.reset()
+
+
+def server_timing(app_seconds: float, db: RequestDbStats) -> str:
+    return f'app;dur={app_seconds * 1000:.2f}, db;dur={db.seconds * 1000:.2f};desc="{db.queries} queries"'
+
+
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware: per-route latency histograms, status counts and
+    per-request SQL count/time (fed by app.db.query_metrics.QueryTimer).
+    Adds a Server-Timing header with the time to response start and the
+    DB time so far.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        db = RequestDbStats()
+        token = current_request_db.set(db)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing(time.perf_counter() - start, db))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_request_db.reset(token)
+            method, route = scope["method"], _route_label(scope)
+            http_requests_total.inc(method, route, str(status))
+            http_request_duration_seconds.observe(elapsed, method, route)
+            http_request_db_queries.observe(db.queries, method, route)
+            http_request_db_seconds.observe(db.seconds, method, route)
@@ -7,5 +7,9 @@ class Project(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(100), unique=True, nullable=False)
     description = Column(Text, nullable=True)
+    # optimistic concurrency: UPDATEs carry WHERE version = <loaded version>
+    version = Column(Integer, nullable=False, server_default="1")
 
-    tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
\ No newline at end of file
+    tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
+
+    __mapper_args__ = {"version_id_col": version}
\ No newline at end of file
@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import DDL, Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index, event, text
 from sqlalchemy.orm import relationship
 import enum
+from datetime import datetime, timezone
+from typing import Optional
 from app.db.base import Base
 
 class StatusEnum(str, enum.Enum):
@@ -8,8 +10,31 @@ class StatusEnum(str, enum.Enum):
     DOING = "doing"
     DONE = "done"
 
+# statuses that autoclose still has to look at
+OPEN_STATUSES = (StatusEnum.TODO, StatusEnum.DOING)
+
+
+def naive_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    """Deadlines are stored and compared as naive UTC; API input may carry an offset."""
+    if dt is not None and dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # list_by_project / per-status counts
+        Index("ix_tasks_project_id_status", "project_id", "status"),
+        # keyset pagination: WHERE project_id = ? AND id > ? ORDER BY id
+        Index("ix_tasks_project_id_id", "project_id", "id"),
+        # list_overdue_open_tasks; partial on Postgres so DONE rows are not indexed
+        Index(
+            "ix_tasks_status_deadline",
+            "status",
+            "deadline",
+            postgresql_where=text("status <> 'DONE'"),
+        ),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(100), nullable=False)
@@ -17,5 +42,41 @@ class Task(Base):
     status = Column(Enum(StatusEnum), default=StatusEnum.TODO, nullable=False)
     deadline = Column(DateTime, nullable=True)
     closed_at = Column(DateTime, nullable=True)
+    # optimistic concurrency, see Project.version; bulk UPDATEs bump it by hand
+    version = Column(Integer, nullable=False, server_default="1")
+
+    project = relationship("Project", back_populates="tasks")
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+# Full-text search over title/description (TaskRepository.search).
+# SQLite: FTS5 index over the tasks table, kept in sync by triggers; the
+# rank column weights title matches twice as high. Postgres: GIN index on
+# the same to_tsvector() expression task_search_stmt() queries. Migration
+# 9d3f6b1a2e48 creates the same objects; these hooks cover create_all().
+SQLITE_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description, content='tasks', content_rowid='id')",
+    "INSERT INTO tasks_fts(tasks_fts, rank) VALUES ('rank', 'bm25(2.0, 1.0)')",
+    """CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    # status/version/closed_at updates (autoclose, PATCH status) leave the index alone
+    """CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+)
+POSTGRES_SEARCH_DDL = (
+    "CREATE INDEX ix_tasks_fts ON tasks USING gin "
+    "(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, '')))",
+)
 
-    project = relationship("Project", back_populates="tasks")
\ No newline at end of file
+for _ddl in SQLITE_SEARCH_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+for _ddl in POSTGRES_SEARCH_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_ddl).execute_if(dialect="postgresql"))
+event.listen(Task.__table__, "after_drop", DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"))
@@ -0,0 +1,58 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.project import Project
+from app.repositories.project_repository import task_counts_stmt
+
+class AsyncProjectRepository:
+    """
+    asyncio counterpart of ProjectRepository (same methods, awaited).
+    Expects an expire_on_commit=False session (AsyncSessionLocal), so no refresh() after commit.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _commit(self):
+        try:
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+    async def create(self, name: str, description: str) -> Project:
+        p = Project(name=name, description=description)
+        self.db.add(p)
+        await self._commit()
+        return p
+
+    async def get(self, project_id: int) -> Optional[Project]:
+        return await self.db.get(Project, project_id)
+
+    async def get_by_name(self, name: str) -> Optional[Project]:
+        result = await self.db.execute(select(Project).where(Project.name == name))
+        return result.scalars().first()
+
+    async def list(self) -> List[Project]:
+        result = await self.db.execute(select(Project))
+        return list(result.scalars().all())
+
+    async def list_with_task_counts(
+        self, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> List[Tuple[Project, int, int, int]]:
+        result = await self.db.execute(task_counts_stmt(limit, after_id))
+        return [tuple(row) for row in result.all()]
+
+    async def list_with_task_counts_rows(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> list:
+        result = await self.db.execute(task_counts_stmt(limit, after_id, as_rows=True))
+        return list(result.all())
+
+    async def update(self, project: Project) -> Project:
+        await self._commit()
+        return project
+
+    async def delete(self, project_id: int):
+        p = await self.get(project_id)
+        if p:
+            await self.db.delete(p)
+            await self._commit()
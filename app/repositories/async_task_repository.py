@@ -0,0 +1,111 @@
+from typing import AsyncIterator, List, Optional
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.task import Task, StatusEnum
+from app.repositories.task_repository import (
+    TASK_COLUMNS,
+    in_parameter_order,
+    task_bulk_insert_stmt,
+    task_export_stmt,
+    task_page_stmt,
+    task_search_stmt,
+)
+
+class AsyncTaskRepository:
+    """
+    asyncio counterpart of TaskRepository (same methods, awaited).
+    Expects an expire_on_commit=False session (AsyncSessionLocal), so no refresh() after commit.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _commit(self):
+        try:
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+    async def create(self, project_id: int, title: str, description: str = "", deadline=None) -> Task:
+        t = Task(project_id=project_id, title=title, description=description, deadline=deadline)
+        self.db.add(t)
+        await self._commit()
+        return t
+
+    async def bulk_create(self, rows: List[dict]) -> list:
+        if not rows:
+            return []
+        dialect = self.db.get_bind().dialect.name
+        result = await self.db.execute(task_bulk_insert_stmt(dialect), rows)
+        created = in_parameter_order(dialect, result.all())
+        await self._commit()
+        return created
+
+    async def get(self, task_id: int) -> Optional[Task]:
+        return await self.db.get(Task, task_id)
+
+    async def list_by_project_page(
+        self,
+        project_id: int,
+        limit: int,
+        after_id: Optional[int] = None,
+        status: Optional[StatusEnum] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+    ) -> List[Task]:
+        stmt = task_page_stmt(project_id, limit, after_id, status, deadline_from, deadline_to)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def list_by_project_page_rows(
+        self,
+        project_id: int,
+        limit: int,
+        after_id: Optional[int] = None,
+        status: Optional[StatusEnum] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+    ) -> list:
+        stmt = task_page_stmt(project_id, limit, after_id, status, deadline_from, deadline_to, columns=TASK_COLUMNS)
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def search(self, terms: List[str], project_id: Optional[int] = None, limit: int = 20, offset: int = 0) -> list:
+        stmt = task_search_stmt(self.db.get_bind().dialect.name, terms, project_id, limit, offset)
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def iter_export_chunks(self, project_id: Optional[int] = None, chunk_size: int = 1000) -> AsyncIterator[list]:
+        stmt = task_export_stmt(project_id).execution_options(yield_per=chunk_size)
+        result = await self.db.stream(stmt)
+        async for chunk in result.partitions():
+            yield chunk
+
+    async def change_status(self, task_id: int, new_status: StatusEnum) -> Optional[Task]:
+        t = await self.get(task_id)
+        if not t:
+            return None
+
+        t.status = new_status
+        if new_status == StatusEnum.DONE:
+            t.closed_at = datetime.utcnow()
+        else:
+            t.closed_at = None
+
+        await self._commit()
+        return t
+
+    async def update(self, task: Task) -> bool:
+        if not await self.get(task.id):
+            return False
+        await self._commit()
+        return True
+
+    async def delete(self, task_id: int) -> bool:
+        t = await self.get(task_id)
+        if not t:
+            return False
+        await self.db.delete(t)
+        await self._commit()
+        return True
@@ -1,20 +1,66 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import case, exists, func, select
 from sqlalchemy.orm import Session
 from app.models.project import Project
+from app.models.task import Task, StatusEnum
+
+def task_counts_stmt(limit: Optional[int] = None, after_id: Optional[int] = None, as_rows: bool = False):
+    """
+    SELECT (project, todo, doing, done) for a keyset page of projects.
+    With as_rows, plain (id, name, description, todo_count, doing_count,
+    done_count) rows instead of the Project entity.
+    """
+    page = select(Project.id).order_by(Project.id)
+    if after_id is not None:
+        page = page.where(Project.id > after_id)
+    if limit is not None:
+        page = page.limit(limit + 1)
+    page = page.subquery()
+
+    def count_status(status: StatusEnum):
+        return func.coalesce(func.sum(case((Task.status == status, 1), else_=0)), 0)
+
+    head = (Project.id, Project.name, Project.description) if as_rows else (Project,)
+    return (
+        select(
+            *head,
+            count_status(StatusEnum.TODO).label("todo_count"),
+            count_status(StatusEnum.DOING).label("doing_count"),
+            count_status(StatusEnum.DONE).label("done_count"),
+        )
+        .join(page, page.c.id == Project.id)
+        .outerjoin(Task, Task.project_id == Project.id)
+        .group_by(Project.id)
+        .order_by(Project.id)
+    )
+
 
 class ProjectRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, autocommit: bool = True):
         self.db = db
+        # False: leave flush/commit to the caller's unit of work
+        self.autocommit = autocommit
+
+    def _commit(self):
+        # no refresh(): the session does not expire on commit and ids/defaults
+        # are already set by the INSERT, so a re-SELECT would only cost a round trip
+        if self.autocommit:
+            try:
+                self.db.commit()
+            except Exception:
+                # unique name / stale version: leave the session usable
+                self.db.rollback()
+                raise
 
     def create(self, name: str, description: str) -> Project:
         p = Project(name=name, description=description)
         self.db.add(p)
-        self.db.commit()
-        self.db.refresh(p)
+        self._commit()
         return p
 
     def get(self, project_id: int) -> Optional[Project]:
-        return self.db.query(Project).filter(Project.id == project_id).first()
+        # Session.get() checks the identity map before going to the database
+        return self.db.get(Project, project_id)
 
     def get_by_name(self, name: str) -> Optional[Project]:
         return self.db.query(Project).filter(Project.name == name).first()
@@ -22,8 +68,39 @@ class ProjectRepository:
     def list(self) -> List[Project]:
         return self.db.query(Project).all()
 
-    def delete(self, project_id: int):
+    def count(self) -> int:
+        return self.db.execute(select(func.count()).select_from(Project)).scalar_one()
+
+    def name_exists(self, name: str) -> bool:
+        """EXISTS on the unique name index; no row is loaded or mapped."""
+        return self.db.execute(select(exists().where(Project.name == name))).scalar_one()
+
+    def list_with_task_counts(
+        self, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> List[Tuple[Project, int, int, int]]:
+        """
+        (project, todo, doing, done) rows ordered by id, in one grouped query.
+        With `limit`, one extra row is fetched so callers can detect a next page.
+        """
+        return [tuple(row) for row in self.db.execute(task_counts_stmt(limit, after_id)).all()]
+
+    def list_with_task_counts_rows(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> list:
+        """Same page as list_with_task_counts, as flat rows shaped like ProjectSummaryOut."""
+        return self.db.execute(task_counts_stmt(limit, after_id, as_rows=True)).all()
+
+    def update(self, project: Project) -> bool:
+        """Persist changes to `project`; objects already in the session are just committed."""
+        if project not in self.db:
+            if self.get(project.id) is None:
+                return False
+            self.db.merge(project)
+        self._commit()
+        return True
+
+    def delete(self, project_id: int) -> bool:
         p = self.get(project_id)
-        if p:
-            self.db.delete(p)
-            self.db.commit()
\ No newline at end of file
+        if not p:
+            return False
+        self.db.delete(p)
+        self._commit()
+        return True
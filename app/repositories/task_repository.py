@@ -1,25 +1,209 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
+from sqlalchemy import column, func, insert, literal_column, or_, select, table, union_all, update
 from sqlalchemy.orm import Session
-from app.models.task import Task, StatusEnum
+from app.models.task import Task, StatusEnum, OPEN_STATUSES
 from datetime import datetime
 
+# everything TaskOut needs; used for RETURNING in bulk_create and for row listings
+TASK_COLUMNS = (
+    Task.id,
+    Task.project_id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.deadline,
+    Task.closed_at,
+)
+
+
+def task_bulk_insert_stmt(dialect: str):
+    """
+    INSERT ... RETURNING for bulk_create; SQLAlchemy sends the rows as
+    multi-row INSERTs (insertmanyvalues).
+
+    postgresql: rows come back in parameter order (sort_by_parameter_order,
+    the autoincrement id is the sorting sentinel).
+    Anything else: asking for that order makes SQLAlchemy fall back to one
+    INSERT per row (SQLite has no sentinel), so the RETURNING order is left
+    open and the caller sorts by id (see in_parameter_order).
+    """
+    stmt = insert(Task.__table__)
+    if dialect == "postgresql":
+        return stmt.returning(*TASK_COLUMNS, sort_by_parameter_order=True)
+    return stmt.returning(*TASK_COLUMNS)
+
+
+def in_parameter_order(dialect: str, rows: list) -> list:
+    """task_bulk_insert_stmt() rows in parameter order: ids are assigned in VALUES order."""
+    if dialect != "postgresql":
+        rows.sort(key=lambda row: row.id)
+    return rows
+
+
+def task_page_stmt(
+    project_id: int,
+    limit: int,
+    after_id: Optional[int] = None,
+    status: Optional[StatusEnum] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    columns=None,
+):
+    """
+    SELECT for one keyset page (shared by the sync and async repositories).
+    Selects Task entities, or plain rows of `columns` when given.
+    """
+    stmt = select(*columns) if columns else select(Task)
+    stmt = stmt.where(Task.project_id == project_id)
+    if after_id is not None:
+        stmt = stmt.where(Task.id > after_id)
+    if status is not None:
+        stmt = stmt.where(Task.status == status)
+    if deadline_from is not None:
+        stmt = stmt.where(Task.deadline >= deadline_from)
+    if deadline_to is not None:
+        stmt = stmt.where(Task.deadline <= deadline_to)
+    return stmt.order_by(Task.id).limit(limit + 1)
+
+
+def task_export_stmt(project_id: Optional[int] = None):
+    """
+    All TASK_COLUMNS rows of one project (or every project) in
+    (project_id, id) order, which ix_tasks_project_id_id returns unsorted.
+    """
+    stmt = select(*TASK_COLUMNS)
+    if project_id is not None:
+        stmt = stmt.where(Task.project_id == project_id)
+    return stmt.order_by(Task.project_id, Task.id)
+
+
+def task_search_stmt(dialect: str, terms: List[str], project_id: Optional[int], limit: int, offset: int = 0):
+    """
+    TASK_COLUMNS of tasks containing every term, best match first, one
+    extra row past `limit` (see list_by_project_page).
+
+    sqlite: FTS5 MATCH ordered by bm25 (tasks_fts, see app/models/task.py).
+    postgresql: @@ against the ix_tasks_fts expression, ordered by ts_rank.
+    Anything else: unranked LIKE scan, by id.
+    """
+    stmt = select(*TASK_COLUMNS)
+    if dialect == "sqlite":
+        fts = table("tasks_fts", column("rowid"), column("rank"))
+        # quoted terms are matched literally; space-separated means AND
+        match = " ".join(f'"{t}"' for t in terms)
+        stmt = (
+            stmt.select_from(fts)
+            .join(Task, Task.id == fts.c.rowid)
+            .where(literal_column("tasks_fts").op("MATCH")(match))
+            .order_by(fts.c.rank, Task.id)
+        )
+    elif dialect == "postgresql":
+        # constants are inlined so the expression matches the index definition
+        config, empty = literal_column("'simple'"), literal_column("''")
+        document = func.to_tsvector(
+            config,
+            func.coalesce(Task.title, empty).op("||")(literal_column("' '")).op("||")(func.coalesce(Task.description, empty)),
+        )
+        tsquery = func.plainto_tsquery(config, " ".join(terms))
+        stmt = stmt.where(document.op("@@")(tsquery)).order_by(func.ts_rank(document, tsquery).desc(), Task.id)
+    else:
+        for term in terms:
+            stmt = stmt.where(or_(Task.title.ilike(f"%{term}%"), Task.description.ilike(f"%{term}%")))
+        stmt = stmt.order_by(Task.id)
+    if project_id is not None:
+        stmt = stmt.where(Task.project_id == project_id)
+    return stmt.limit(limit + 1).offset(offset)
+
+
 class TaskRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, autocommit: bool = True):
         self.db = db
+        # False: leave flush/commit to the caller's unit of work
+        self.autocommit = autocommit
+
+    def _commit(self):
+        # no refresh(): see ProjectRepository._commit
+        if self.autocommit:
+            try:
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
 
     def create(self, project_id: int, title: str, description: str = "", deadline=None) -> Task:
         t = Task(project_id=project_id, title=title, description=description, deadline=deadline)
         self.db.add(t)
-        self.db.commit()
-        self.db.refresh(t)
+        self._commit()
         return t
 
+    def bulk_create(self, rows: List[dict]) -> list:
+        """
+        Insert many tasks with multi-row INSERTs and one commit.
+        rows: dicts with project_id/title/description/deadline.
+        Returns the inserted rows (not ORM objects) in input order.
+        """
+        if not rows:
+            return []
+        dialect = self.db.get_bind().dialect.name
+        created = in_parameter_order(dialect, self.db.execute(task_bulk_insert_stmt(dialect), rows).all())
+        self._commit()
+        return created
+
     def get(self, task_id: int) -> Optional[Task]:
-        return self.db.query(Task).filter(Task.id == task_id).first()
+        # Session.get() checks the identity map before going to the database
+        return self.db.get(Task, task_id)
 
     def list_by_project(self, project_id: int) -> List[Task]:
         return self.db.query(Task).filter(Task.project_id == project_id).all()
 
+    def count_by_project(self, project_id: int) -> int:
+        # answered from the (project_id, ...) indexes, without loading the rows
+        stmt = select(func.count()).select_from(Task).where(Task.project_id == project_id)
+        return self.db.execute(stmt).scalar_one()
+
+    def list_by_project_page(
+        self,
+        project_id: int,
+        limit: int,
+        after_id: Optional[int] = None,
+        status: Optional[StatusEnum] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+    ) -> List[Task]:
+        """
+        Keyset page ordered by id: rows with id > after_id, at most `limit`.
+        One extra row is fetched so callers can tell whether a next page exists.
+        """
+        stmt = task_page_stmt(project_id, limit, after_id, status, deadline_from, deadline_to)
+        return self.db.execute(stmt).scalars().all()
+
+    def list_by_project_page_rows(
+        self,
+        project_id: int,
+        limit: int,
+        after_id: Optional[int] = None,
+        status: Optional[StatusEnum] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+    ) -> list:
+        """Same page as list_by_project_page, as TASK_COLUMNS rows (no ORM objects)."""
+        stmt = task_page_stmt(project_id, limit, after_id, status, deadline_from, deadline_to, columns=TASK_COLUMNS)
+        return self.db.execute(stmt).all()
+
+    def search(self, terms: List[str], project_id: Optional[int] = None, limit: int = 20, offset: int = 0) -> list:
+        """Ranked TASK_COLUMNS rows for search_terms() output; limit + 1 rows at most."""
+        stmt = task_search_stmt(self.db.get_bind().dialect.name, terms, project_id, limit, offset)
+        return self.db.execute(stmt).all()
+
+    def iter_export_chunks(self, project_id: Optional[int] = None, chunk_size: int = 1000) -> Iterator[list]:
+        """
+        Export rows in lists of up to chunk_size. yield_per streams from a
+        server-side cursor where the driver has one (psycopg2), so only one
+        chunk is held in memory at a time.
+        """
+        stmt = task_export_stmt(project_id).execution_options(yield_per=chunk_size)
+        yield from self.db.execute(stmt).partitions()
+
     def change_status(self, task_id: int, new_status: StatusEnum) -> Optional[Task]:
         t = self.get(task_id)
         if not t:
@@ -33,16 +217,17 @@ class TaskRepository:
         else:
             t.closed_at = None
 
-        self.db.commit()
-        self.db.refresh(t)
+        self._commit()
         return t
 
 
     def update(self, task: Task) -> bool:
-        if not self.get(task.id):
-            return False
-        self.db.merge(task)
-        self.db.commit()
+        """Persist changes to `task`; objects already in the session are just committed."""
+        if task not in self.db:
+            if self.get(task.id) is None:
+                return False
+            self.db.merge(task)
+        self._commit()
         return True
 
     def delete(self, task_id: int) -> bool:
@@ -50,7 +235,7 @@ class TaskRepository:
         if not t:
             return False
         self.db.delete(t)
-        self.db.commit()
+        self._commit()
         return True
     def list_overdue_open_tasks(self) -> List[Task]:
         now = datetime.utcnow()
@@ -58,6 +243,55 @@ class TaskRepository:
             self.db.query(Task)
             .filter(Task.deadline.isnot(None))
             .filter(Task.deadline < now)
-            .filter(Task.status != StatusEnum.DONE)
+            # IN (open statuses) rather than != DONE so ix_tasks_status_deadline is seekable
+            .filter(Task.status.in_(OPEN_STATUSES))
             .all()
-        )
\ No newline at end of file
+        )
+
+    def next_open_deadline(self) -> Optional[datetime]:
+        """
+        Earliest deadline among open tasks (None if there is none); what the
+        autoclose scheduler sleeps until. One MIN per open status, so each
+        is a single seek on ix_tasks_status_deadline instead of a range scan.
+        """
+        per_status = union_all(
+            *(
+                select(func.min(Task.deadline).label("deadline")).where(
+                    Task.status == status, Task.deadline.isnot(None)
+                )
+                for status in OPEN_STATUSES
+            )
+        ).subquery()
+        return self.db.execute(select(func.min(per_status.c.deadline))).scalar()
+
+    def close_overdue_open_tasks(self, now: datetime, batch_size: int = 5000) -> int:
+        """
+        Set-based version of closing overdue tasks: one UPDATE per batch,
+        without loading ORM objects. Each batch is committed separately so
+        the transaction (and row locks) stay short. Returns closed count.
+
+        synchronize_session="fetch" (matched ids come back via RETURNING)
+        updates tasks already loaded in this session, so they do not keep
+        the old status/closed_at/version and fail their next update with
+        StaleDataError. Other loaded objects are left alone.
+        """
+        closed = 0
+        while True:
+            batch_ids = (
+                select(Task.id)
+                .where(Task.deadline.isnot(None))
+                .where(Task.deadline < now)
+                .where(Task.status.in_(OPEN_STATUSES))
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = self.db.execute(
+                update(Task)
+                .where(Task.id.in_(batch_ids))
+                .values(status=StatusEnum.DONE, closed_at=now, version=Task.version + 1)
+                .execution_options(synchronize_session="fetch")
+            )
+            self.db.commit()
+            closed += result.rowcount
+            if result.rowcount < batch_size:
+                return closed
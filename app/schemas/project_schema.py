@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import TypedDict
 
 class ProjectCreate(BaseModel):
     name: str = Field(min_length=1, max_length=100)
@@ -14,4 +16,46 @@ class ProjectOut(BaseModel):
     description: str | None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ProjectSummaryOut(ProjectOut):
+    todo_count: int = 0
+    doing_count: int = 0
+    done_count: int = 0
+
+    @classmethod
+    def from_row(cls, row) -> "ProjectSummaryOut":
+        """Build from a (project, todo, doing, done) repository row."""
+        project, todo, doing, done = row
+        return cls(
+            id=project.id,
+            name=project.name,
+            description=project.description,
+            todo_count=todo,
+            doing_count=doing,
+            done_count=done,
+        )
+
+class ProjectPage(BaseModel):
+    items: list[ProjectSummaryOut]
+    next_cursor: Optional[int] = None
+
+
+# JSON fast path, see task_schema.dump_task_page
+class ProjectSummaryRow(TypedDict):
+    id: int
+    name: str
+    description: Optional[str]
+    todo_count: int
+    doing_count: int
+    done_count: int
+
+class ProjectPageRows(TypedDict):
+    items: list[ProjectSummaryRow]
+    next_cursor: Optional[int]
+
+_project_page_adapter = TypeAdapter(ProjectPageRows)
+
+def dump_project_page(rows, next_cursor: Optional[int]) -> bytes:
+    """rows: from ProjectRepository.list_with_task_counts_rows."""
+    return _project_page_adapter.dump_json({"items": [r._asdict() for r in rows], "next_cursor": next_cursor})
@@ -1,6 +1,10 @@
+import csv
+import io
 from datetime import datetime
-from pydantic import BaseModel, Field
+from enum import Enum
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Optional, Literal
+from typing_extensions import TypedDict
 
 StatusEnum = Literal["todo", "doing", "done"]
 
@@ -25,4 +29,78 @@ class TaskOut(BaseModel):
     closed_at: Optional[datetime]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class TaskPage(BaseModel):
+    items: list[TaskOut]
+    next_cursor: Optional[int] = None
+
+
+class TaskSearchPage(BaseModel):
+    items: list[TaskOut]
+    # offset of the next page of (ranked) results; None on the last page
+    next_offset: Optional[int] = None
+
+
+class TaskBulkOut(BaseModel):
+    items: list[TaskOut]
+
+
+# JSON fast path for list endpoints: plain rows are serialized by a
+# precompiled adapter, with no per-row TaskOut validation. Same JSON as TaskPage.
+class TaskRow(TypedDict):
+    id: int
+    project_id: int
+    title: str
+    description: Optional[str]
+    status: str
+    deadline: Optional[datetime]
+    closed_at: Optional[datetime]
+
+class TaskPageRows(TypedDict):
+    items: list[TaskRow]
+    next_cursor: Optional[int]
+
+_task_page_adapter = TypeAdapter(TaskPageRows)
+
+def dump_task_page(rows, next_cursor: Optional[int]) -> bytes:
+    """rows: TASK_COLUMNS rows from TaskRepository.list_by_project_page_rows."""
+    return _task_page_adapter.dump_json({"items": [r._asdict() for r in rows], "next_cursor": next_cursor})
+
+class TaskSearchRows(TypedDict):
+    items: list[TaskRow]
+    next_offset: Optional[int]
+
+_task_search_adapter = TypeAdapter(TaskSearchRows)
+
+def dump_task_search_page(rows, next_offset: Optional[int]) -> bytes:
+    """rows: TASK_COLUMNS rows from TaskRepository.search, in rank order."""
+    return _task_search_adapter.dump_json({"items": [r._asdict() for r in rows], "next_offset": next_offset})
+
+
+# export: one chunk of TASK_COLUMNS rows -> bytes, so StreamingResponse
+# sends each chunk as soon as it is read
+_task_row_adapter = TypeAdapter(TaskRow)
+EXPORT_FIELDS = list(TaskRow.__annotations__)
+
+def dump_ndjson_chunk(rows) -> bytes:
+    """One TaskOut-shaped JSON object per line."""
+    dump = _task_row_adapter.dump_json
+    return b"".join([dump(r._asdict()) + b"\n" for r in rows])
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def dump_csv_chunk(rows, header: bool = False) -> bytes:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows([[_csv_value(v) for v in r] for r in rows])
+    return buf.getvalue().encode()
@@ -0,0 +1,21 @@
+"""
+Search query tokenizer shared by the API (FTS) and the CLI storages.
+
+Plain `re` only: InMemoryStorage imports this, and the memory CLI must not
+pull in SQLAlchemy or the ORM models (see test_startup).
+"""
+import re
+from typing import List
+
+_WORD = re.compile(r"\w+")
+MAX_SEARCH_TERMS = 16
+
+
+def words(text: str) -> List[str]:
+    """Every lower-cased word of `text`, in order; what the indexes store."""
+    return _WORD.findall(text.lower()) if text else []
+
+
+def search_terms(query: str) -> List[str]:
+    """Lower-cased words of a search query; also what makes it safe to embed in MATCH."""
+    return words(query)[:MAX_SEARCH_TERMS]
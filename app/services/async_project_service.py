@@ -0,0 +1,80 @@
+from typing import List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.models.project import Project
+from app.services.project_service import (
+    DUPLICATE_NAME,
+    ProjectNotFound,
+    ValidationError,
+    VersionConflict,
+    check_version,
+)
+from app.cache.versions import versions
+
+class AsyncProjectService:
+    """Same rules as ProjectService, on top of AsyncProjectRepository."""
+
+    def __init__(self, project_repo: AsyncProjectRepository):
+        self.project_repo = project_repo
+
+    async def create_project(self, name: str, description: str = "") -> Project:
+        name = name.strip()
+        if not (1 <= len(name) <= 100):
+            raise ValidationError("Project name must be 1..100 characters")
+
+        try:
+            project = await self.project_repo.create(name=name, description=description)
+        except IntegrityError:
+            raise ValidationError(DUPLICATE_NAME)
+        versions.bump(project.id)
+        return project
+
+    async def get_project(self, project_id: int) -> Project:
+        proj = await self.project_repo.get(project_id)
+        if proj is None:
+            raise ProjectNotFound(f"Project {project_id} not found")
+        return proj
+
+    async def list_projects_page(
+        self, limit: int, after: Optional[int] = None, as_rows: bool = False
+    ) -> Tuple[List[Tuple[Project, int, int, int]], Optional[int]]:
+        if as_rows:
+            rows = await self.project_repo.list_with_task_counts_rows(limit=limit, after_id=after)
+        else:
+            rows = await self.project_repo.list_with_task_counts(limit=limit, after_id=after)
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, (rows[-1].id if as_rows else rows[-1][0].id)
+        return rows, None
+
+    async def delete_project(self, project_id: int) -> None:
+        proj = await self.project_repo.get(project_id)
+        if proj is None:
+            raise ProjectNotFound(f"Project {project_id} not found")
+        await self.project_repo.delete(project_id)
+        versions.bump(project_id)
+
+    async def update_project(self, project_id: int, data: dict, expected_version: Optional[int] = None) -> Project:
+        proj = await self.project_repo.get(project_id)
+        if proj is None:
+            raise ProjectNotFound(f"Project {project_id} not found")
+        check_version(proj, expected_version)
+
+        if "name" in data and data["name"] is not None:
+            name = data["name"].strip()
+            if not (1 <= len(name) <= 100):
+                raise ValidationError("Project name must be 1..100 characters")
+            proj.name = name
+
+        if "description" in data and data["description"] is not None:
+            proj.description = data["description"]
+
+        try:
+            proj = await self.project_repo.update(proj)
+        except StaleDataError:
+            raise VersionConflict(f"Project {project_id} was changed by another request")
+        except IntegrityError:
+            raise ValidationError(DUPLICATE_NAME)
+        versions.bump(project_id)
+        return proj
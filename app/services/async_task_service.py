@@ -0,0 +1,166 @@
+from typing import List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy.orm.exc import StaleDataError
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.search import search_terms
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.models.task import Task, StatusEnum, naive_utc
+from app.services.project_service import ProjectNotFound, VersionConflict, check_version
+from app.services.task_service import TaskNotFound, ValidationError, build_bulk_task_rows
+from app.cache.versions import versions
+from app.events import deadline_notifier
+
+class AsyncTaskService:
+    """Same rules as TaskService, on top of the async repositories."""
+
+    def __init__(self, task_repo: AsyncTaskRepository, project_repo: AsyncProjectRepository):
+        self.task_repo = task_repo
+        self.project_repo = project_repo
+
+    async def add_task(self, project_id: int, title: str, description: str = "", deadline: Optional[datetime] = None) -> Task:
+        title = title.strip()
+        if not (1 <= len(title) <= 100):
+            raise ValidationError("Task title must be 1..100 characters")
+
+        project = await self.project_repo.get(project_id)
+        if project is None:
+            raise ValidationError("Project not found")
+
+        deadline = naive_utc(deadline)
+        task = await self.task_repo.create(project_id=project_id, title=title, description=description, deadline=deadline)
+        versions.bump(project_id)
+        deadline_notifier.notify(deadline)
+        return task
+
+    async def add_tasks_bulk(self, project_id: int, items: List[dict]) -> list:
+        if await self.project_repo.get(project_id) is None:
+            raise ValidationError("Project not found")
+        rows = build_bulk_task_rows(project_id, items)
+        created = await self.task_repo.bulk_create(rows)
+        versions.bump(project_id)
+        # rows hold naive UTC deadlines (build_bulk_task_rows), so they compare
+        deadline_notifier.notify(min((r["deadline"] for r in rows if r["deadline"] is not None), default=None))
+        return created
+
+    async def get_task(self, task_id: int) -> Task:
+        t = await self.task_repo.get(task_id)
+        if t is None:
+            raise TaskNotFound("Task not found")
+        return t
+
+    async def list_tasks_page(
+        self,
+        project_id: int,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+        as_rows: bool = False,
+    ) -> Tuple[List[Task], Optional[int]]:
+        status_enum = None
+        if status is not None:
+            try:
+                status_enum = StatusEnum(status)
+            except ValueError:
+                raise ValidationError("Invalid status")
+
+        # compare (and filter) the way deadlines are stored: naive UTC
+        deadline_from, deadline_to = naive_utc(deadline_from), naive_utc(deadline_to)
+        if deadline_from and deadline_to and deadline_from > deadline_to:
+            raise ValidationError("deadline_from must not be after deadline_to")
+
+        # as_rows: plain TASK_COLUMNS rows for the JSON fast path
+        fetch = self.task_repo.list_by_project_page_rows if as_rows else self.task_repo.list_by_project_page
+        rows = await fetch(
+            project_id,
+            limit,
+            after_id=after,
+            status=status_enum,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+        )
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, rows[-1].id
+        return rows, None
+
+    async def search_tasks(
+        self, query: str, project_id: Optional[int] = None, limit: int = 20, offset: int = 0
+    ) -> Tuple[list, Optional[int]]:
+        """See TaskService.search_tasks."""
+        terms = search_terms(query)
+        if not terms:
+            raise ValidationError("Search query must contain at least one word")
+        if project_id is not None and await self.project_repo.get(project_id) is None:
+            raise ProjectNotFound(f"Project {project_id} not found")
+        rows = await self.task_repo.search(terms, project_id, limit=limit, offset=offset)
+        if len(rows) > limit:
+            return rows[:limit], offset + limit
+        return rows, None
+
+    async def export_chunks(self, project_id: Optional[int] = None):
+        """Async iterator of row chunks (see TaskService.export_chunks)."""
+        if project_id is not None and await self.project_repo.get(project_id) is None:
+            raise ProjectNotFound(f"Project {project_id} not found")
+        return self.task_repo.iter_export_chunks(project_id)
+
+    async def change_status(self, task_id: int, new_status: str, expected_version: Optional[int] = None) -> Task:
+        try:
+            status_enum = StatusEnum(new_status)
+        except ValueError:
+            raise ValidationError("Invalid status")
+
+        task = await self.task_repo.get(task_id)
+        if task is None:
+            raise TaskNotFound("Task not found")
+        check_version(task, expected_version)
+
+        try:
+            task = await self.task_repo.change_status(task_id, status_enum)
+        except StaleDataError:
+            raise VersionConflict(f"Task {task_id} was changed by another request")
+        versions.bump(task.project_id)
+        deadline_notifier.task_changed(task)
+        return task
+
+    async def update_task(self, task_id: int, data: dict, expected_version: Optional[int] = None) -> Task:
+        task = await self.task_repo.get(task_id)
+        if task is None:
+            raise TaskNotFound("Task not found")
+        check_version(task, expected_version)
+
+        if "title" in data and data["title"] is not None:
+            title = data["title"].strip()
+            if not (1 <= len(title) <= 100):
+                raise ValidationError("Task title must be 1..100 characters")
+            task.title = title
+
+        if "description" in data and data["description"] is not None:
+            task.description = data["description"]
+
+        if "deadline" in data:
+            task.deadline = naive_utc(data["deadline"])
+
+        if "status" in data and data["status"] is not None:
+            try:
+                task.status = StatusEnum(data["status"])
+            except ValueError:
+                raise ValidationError("Invalid status")
+
+        try:
+            ok = await self.task_repo.update(task)
+        except StaleDataError:
+            raise VersionConflict(f"Task {task_id} was changed by another request")
+        if not ok:
+            raise TaskNotFound("Task not found")
+
+        versions.bump(task.project_id)
+        deadline_notifier.task_changed(task)
+        return task
+
+    async def delete_task(self, task_id: int) -> None:
+        task = await self.task_repo.get(task_id)
+        if task is None or not await self.task_repo.delete(task_id):
+            raise TaskNotFound("Task not found")
+        versions.bump(task.project_id)
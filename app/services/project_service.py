@@ -1,5 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from app.repositories.project_repository import ProjectRepository
+from app.cache.versions import versions
 from app.models.project import Project
 from datetime import datetime
 
@@ -9,6 +12,21 @@ class ProjectNotFound(Exception):
 class ValidationError(Exception):
     pass
 
+class VersionConflict(Exception):
+    """The row changed since the client read it (If-Match / version_id_col)."""
+    pass
+
+DUPLICATE_NAME = "Project with this name already exists"
+
+
+def check_version(obj, expected_version: Optional[int]) -> None:
+    """Raise VersionConflict unless `obj` is still at the version the client saw."""
+    if expected_version is not None and obj.version != expected_version:
+        raise VersionConflict(
+            f"{type(obj).__name__} {obj.id} is at version {obj.version}, not {expected_version}"
+        )
+
+
 class ProjectService:
     def __init__(self, project_repo: ProjectRepository):
         self.project_repo = project_repo
@@ -18,11 +36,13 @@ class ProjectService:
         if not (1 <= len(name) <= 100):
             raise ValidationError("Project name must be 1..100 characters")
 
-        # uniqueness check (repository provides get_by_name)
-        if self.project_repo.get_by_name(name) is not None:
-            raise ValidationError("Project with this name already exists")
-
-        return self.project_repo.create(name=name, description=description)
+        # uniqueness is enforced by the unique index on projects.name
+        try:
+            project = self.project_repo.create(name=name, description=description)
+        except IntegrityError:
+            raise ValidationError(DUPLICATE_NAME)
+        versions.bump(project.id)
+        return project
 
     def get_project(self, project_id: int) -> Project:
         proj = self.project_repo.get(project_id)
@@ -33,33 +53,57 @@ class ProjectService:
     def list_projects(self) -> List[Project]:
         return self.project_repo.list()
 
+    def list_projects_page(
+        self, limit: int, after: Optional[int] = None, as_rows: bool = False
+    ) -> Tuple[List[Tuple[Project, int, int, int]], Optional[int]]:
+        """
+        Returns ((project, todo, doing, done) rows, next_cursor).
+        as_rows=True returns flat (id, name, description, *_count) rows instead.
+        """
+        if as_rows:
+            rows = self.project_repo.list_with_task_counts_rows(limit=limit, after_id=after)
+        else:
+            rows = self.project_repo.list_with_task_counts(limit=limit, after_id=after)
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, (rows[-1].id if as_rows else rows[-1][0].id)
+        return rows, None
+
     def delete_project(self, project_id: int) -> None:
         proj = self.project_repo.get(project_id)
         if proj is None:
             raise ProjectNotFound(f"Project {project_id} not found")
         self.project_repo.delete(project_id)
-    def update_project(self, project_id: int, data: dict) -> Project:
+        versions.bump(project_id)
+    def update_project(self, project_id: int, data: dict, expected_version: Optional[int] = None) -> Project:
+        """
+        expected_version (from If-Match): fail with VersionConflict instead of
+        overwriting a newer row. The UPDATE itself is guarded by the version
+        column too, so a write that lands between our read and commit is
+        also a conflict; no row lock is held.
+        """
         proj = self.project_repo.get(project_id)
         if proj is None:
             raise ProjectNotFound(f"Project {project_id} not found")
+        check_version(proj, expected_version)
 
         # name
         if "name" in data and data["name"] is not None:
             name = data["name"].strip()
             if not (1 <= len(name) <= 100):
                 raise ValidationError("Project name must be 1..100 characters")
-
-            existing = self.project_repo.get_by_name(name)
-            if existing and existing.id != project_id:
-                raise ValidationError("Project with this name already exists")
-
             proj.name = name
 
         # description
         if "description" in data and data["description"] is not None:
             proj.description = data["description"]
         
-        self.project_repo.db.merge(proj)
-        self.project_repo.db.commit()
-        self.project_repo.db.refresh(proj)
+        try:
+            self.project_repo.update(proj)
+        except StaleDataError:
+            raise VersionConflict(f"Project {project_id} was changed by another request")
+        except IntegrityError:
+            raise ValidationError(DUPLICATE_NAME)
+        versions.bump(project_id)
         return proj
+
@@ -1,8 +1,13 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
+from sqlalchemy.orm.exc import StaleDataError
 from app.repositories.task_repository import TaskRepository
+from app.search import search_terms
 from app.repositories.project_repository import ProjectRepository
-from app.models.task import Task, StatusEnum
+from app.services.project_service import ProjectNotFound, VersionConflict, check_version
+from app.models.task import Task, StatusEnum, naive_utc
+from app.cache.versions import versions
+from app.events import deadline_notifier
 
 class TaskNotFound(Exception):
     pass
@@ -10,6 +15,42 @@ class TaskNotFound(Exception):
 class ValidationError(Exception):
     pass
 
+class BulkValidationError(ValidationError):
+    """Some items of a bulk request are invalid; errors = [{"index", "detail"}]."""
+
+    def __init__(self, errors: List[dict]):
+        super().__init__(f"{len(errors)} invalid task(s)")
+        self.errors = errors
+
+# upper bound for one bulk request (larger imports are split by the client)
+MAX_BULK_TASKS = 10_000
+
+
+def build_bulk_task_rows(project_id: int, items: List[dict]) -> List[dict]:
+    """
+    Validate a bulk request in one pass and return insert rows.
+    All-or-nothing: raises BulkValidationError listing every bad item.
+    """
+    if len(items) > MAX_BULK_TASKS:
+        raise ValidationError(f"At most {MAX_BULK_TASKS} tasks per request")
+
+    rows, errors = [], []
+    for i, item in enumerate(items):
+        title = (item.get("title") or "").strip()
+        if not (1 <= len(title) <= 100):
+            errors.append({"index": i, "detail": "Task title must be 1..100 characters"})
+            continue
+        rows.append({
+            "project_id": project_id,
+            "title": title,
+            "description": item.get("description") or "",
+            "deadline": naive_utc(item.get("deadline")),
+        })
+    if errors:
+        raise BulkValidationError(errors)
+    return rows
+
+
 class TaskService:
     def __init__(self, task_repo: TaskRepository, project_repo: ProjectRepository):
         self.task_repo = task_repo
@@ -24,7 +65,22 @@ class TaskService:
         if project is None:
             raise ValidationError("Project not found")
 
-        return self.task_repo.create(project_id=project_id, title=title, description=description, deadline=deadline)
+        deadline = naive_utc(deadline)
+        task = self.task_repo.create(project_id=project_id, title=title, description=description, deadline=deadline)
+        versions.bump(project_id)
+        deadline_notifier.notify(deadline)
+        return task
+
+    def add_tasks_bulk(self, project_id: int, items: List[dict]) -> list:
+        """Create many tasks in one transaction; returns rows in input order."""
+        if self.project_repo.get(project_id) is None:
+            raise ValidationError("Project not found")
+        rows = build_bulk_task_rows(project_id, items)
+        created = self.task_repo.bulk_create(rows)
+        versions.bump(project_id)
+        # rows hold naive UTC deadlines (build_bulk_task_rows), so they compare
+        deadline_notifier.notify(min((r["deadline"] for r in rows if r["deadline"] is not None), default=None))
+        return created
 
     def get_task(self, task_id: int) -> Task:
         t = self.task_repo.get(task_id)
@@ -35,7 +91,76 @@ class TaskService:
     def list_tasks_by_project(self, project_id: int) -> List[Task]:
         return self.task_repo.list_by_project(project_id)
 
-    def change_status(self, task_id: int, new_status: str) -> Task:
+    def list_tasks_page(
+        self,
+        project_id: int,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+        as_rows: bool = False,
+    ) -> Tuple[List[Task], Optional[int]]:
+        """
+        Returns (tasks, next_cursor); next_cursor is None on the last page.
+        as_rows=True returns plain column rows instead of Task objects.
+        """
+        status_enum = None
+        if status is not None:
+            try:
+                status_enum = StatusEnum(status)
+            except ValueError:
+                raise ValidationError("Invalid status")
+
+        # compare (and filter) the way deadlines are stored: naive UTC
+        deadline_from, deadline_to = naive_utc(deadline_from), naive_utc(deadline_to)
+        if deadline_from and deadline_to and deadline_from > deadline_to:
+            raise ValidationError("deadline_from must not be after deadline_to")
+
+        # as_rows: plain TASK_COLUMNS rows for the JSON fast path
+        fetch = self.task_repo.list_by_project_page_rows if as_rows else self.task_repo.list_by_project_page
+        rows = fetch(
+            project_id,
+            limit,
+            after_id=after,
+            status=status_enum,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+        )
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, rows[-1].id
+        return rows, None
+
+    def search_tasks(
+        self, query: str, project_id: Optional[int] = None, limit: int = 20, offset: int = 0
+    ) -> Tuple[list, Optional[int]]:
+        """
+        Tasks containing every word of `query` (in title or description),
+        best match first. Returns (TASK_COLUMNS rows, next_offset); next_offset
+        is None on the last page.
+        """
+        terms = search_terms(query)
+        if not terms:
+            raise ValidationError("Search query must contain at least one word")
+        if project_id is not None and self.project_repo.get(project_id) is None:
+            raise ProjectNotFound(f"Project {project_id} not found")
+        rows = self.task_repo.search(terms, project_id, limit=limit, offset=offset)
+        if len(rows) > limit:
+            return rows[:limit], offset + limit
+        return rows, None
+
+    def export_chunks(self, project_id: Optional[int] = None):
+        """
+        Iterator of TASK_COLUMNS row chunks for one project (or all). The
+        project is checked here, before anything is streamed; rows are only
+        read as the iterator is consumed.
+        """
+        if project_id is not None and self.project_repo.get(project_id) is None:
+            raise ProjectNotFound(f"Project {project_id} not found")
+        return self.task_repo.iter_export_chunks(project_id)
+
+    def change_status(self, task_id: int, new_status: str, expected_version: Optional[int] = None) -> Task:
         # validate status
         try:
             status_enum = StatusEnum(new_status)
@@ -45,13 +170,21 @@ class TaskService:
         task = self.task_repo.get(task_id)
         if task is None:
             raise TaskNotFound("Task not found")
+        check_version(task, expected_version)
 
-        return self.task_repo.change_status(task_id, status_enum)
+        try:
+            task = self.task_repo.change_status(task_id, status_enum)
+        except StaleDataError:
+            raise VersionConflict(f"Task {task_id} was changed by another request")
+        versions.bump(task.project_id)
+        deadline_notifier.task_changed(task)
+        return task
     
-    def update_task(self, task_id: int, data: dict) -> Task:
+    def update_task(self, task_id: int, data: dict, expected_version: Optional[int] = None) -> Task:
         task = self.task_repo.get(task_id)
         if task is None:
             raise TaskNotFound("Task not found")
+        check_version(task, expected_version)
 
         if "title" in data and data["title"] is not None:
             title = data["title"].strip()
@@ -63,7 +196,7 @@ class TaskService:
             task.description = data["description"]
 
         if "deadline" in data:
-            task.deadline = data["deadline"]
+            task.deadline = naive_utc(data["deadline"])
 
         if "status" in data and data["status"] is not None:
             try:
@@ -71,13 +204,19 @@ class TaskService:
             except ValueError:
                 raise ValidationError("Invalid status")
 
-        ok = self.task_repo.update(task)
+        try:
+            ok = self.task_repo.update(task)
+        except StaleDataError:
+            raise VersionConflict(f"Task {task_id} was changed by another request")
         if not ok:
             raise TaskNotFound("Task not found")
 
-        return self.task_repo.get(task_id)
+        versions.bump(task.project_id)
+        deadline_notifier.task_changed(task)
+        return task
 
     def delete_task(self, task_id: int) -> None:
-        ok = self.task_repo.delete(task_id)
-        if not ok:
+        task = self.task_repo.get(task_id)
+        if task is None or not self.task_repo.delete(task_id):
             raise TaskNotFound("Task not found")
+        versions.bump(task.project_id)
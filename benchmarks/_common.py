@@ -0,0 +1,49 @@
+"""Shared helpers for the benchmark scripts (SQLite only, no external DB)."""
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.project import Project
+from app.models.task import Task
+
+
+@contextmanager
+def sqlite_engine():
+    """Fresh file-backed SQLite database with the ORM schema, removed afterwards."""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}", future=True)
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def make_session(engine):
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, future=True)()
+
+
+def seed_tasks(engine, n_tasks: int, n_projects: int = 1, **task_fields) -> None:
+    """Insert projects and tasks with executemany (seeding is not measured)."""
+    with engine.begin() as conn:
+        conn.execute(insert(Project), [{"id": i + 1, "name": f"P{i + 1}", "description": ""} for i in range(n_projects)])
+        rows = [
+            {"project_id": i % n_projects + 1, "title": f"T{i}", "description": "", **task_fields}
+            for i in range(n_tasks)
+        ]
+        if rows:
+            conn.execute(insert(Task), rows)
+
+
+@contextmanager
+def timer(results: dict, key: str):
+    start = time.perf_counter()
+    yield
+    results[key] = round(time.perf_counter() - start, 6)
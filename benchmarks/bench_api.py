@@ -0,0 +1,100 @@
+"""
+Per-endpoint latency of the sync API through an in-process TestClient,
+against a file-backed SQLite database.
+
+List reads are timed with the response cache cleared before every request
+(`*_list_s`) and again with it warm (`cached_*`); the cache is opt-in
+(RESPONSE_CACHE_TTL), so it is switched on here. Single-row GETs are never
+cached.
+
+    python -m benchmarks.bench_api [n_requests ...]
+"""
+import json
+import sys
+
+from fastapi.testclient import TestClient
+
+from app.cache.response_cache import response_cache
+from app.db.deps import get_db
+from app.main import create_app
+from benchmarks._common import make_session, sqlite_engine, timer
+
+N_PROJECTS = 10
+
+
+def _client(engine) -> TestClient:
+    def override_get_db():
+        db = make_session(engine)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app("sync")
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def _call(client, method: str, url: str, expected: int, **kwargs):
+    resp = client.request(method, url, **kwargs)
+    assert resp.status_code == expected, (method, url, resp.status_code, resp.text)
+    return resp
+
+
+def run(n_requests: int) -> dict:
+    results = {"n_requests": n_requests}
+    ttl, response_cache.ttl = response_cache.ttl, 30
+    with sqlite_engine() as engine:
+        client = _client(engine)
+
+        with timer(results, "create_project_s"):
+            project_ids = [
+                _call(client, "POST", "/projects/", 201, json={"name": f"P{i}", "description": "d"}).json()["id"]
+                for i in range(N_PROJECTS)
+            ]
+        tasks = []  # (project_id, task_id)
+        with timer(results, "create_task_s"):
+            for i in range(n_requests):
+                pid = project_ids[i % N_PROJECTS]
+                body = {"title": f"T{i}", "description": "d"}
+                tasks.append((pid, _call(client, "POST", f"/projects/{pid}/tasks/", 201, json=body).json()["id"]))
+
+        with timer(results, "get_task_s"):
+            for pid, tid in tasks:
+                _call(client, "GET", f"/projects/{pid}/tasks/{tid}", 200)
+
+        list_urls = [f"/projects/{project_ids[i % N_PROJECTS]}/tasks/?limit=20" for i in range(n_requests)]
+        with timer(results, "list_tasks_s"):
+            for url in list_urls:
+                response_cache.clear()
+                _call(client, "GET", url, 200)
+        with timer(results, "cached_list_tasks_s"):
+            for url in list_urls:
+                _call(client, "GET", url, 200)
+
+        with timer(results, "list_projects_s"):
+            for _ in range(n_requests // 10 or 1):
+                response_cache.clear()
+                _call(client, "GET", "/projects/", 200)
+
+        with timer(results, "update_task_s"):
+            for pid, tid in tasks:
+                _call(client, "PATCH", f"/projects/{pid}/tasks/{tid}/status", 200, params={"status_value": "doing"})
+
+        with timer(results, "delete_task_s"):
+            for pid, tid in tasks:
+                _call(client, "DELETE", f"/projects/{pid}/tasks/{tid}", 204)
+        client.close()
+    response_cache.clear()
+    response_cache.ttl = ttl
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [500]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
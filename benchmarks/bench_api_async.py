@@ -0,0 +1,103 @@
+"""
+Throughput of the sync and async API stacks under concurrent load.
+
+Both apps run in-process behind httpx's ASGI transport against the same
+seeded SQLite file; sync endpoints go through Starlette's threadpool,
+async ones stay on the event loop.
+
+    python -m benchmarks.bench_api_async [concurrency ...]
+"""
+import asyncio
+import json
+import sys
+import time
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.deps import get_async_db, get_db
+from app.main import create_app
+from benchmarks._common import seed_tasks, sqlite_engine
+
+REQUESTS = 1000
+
+
+def _sync_app(url, pool_size: int):
+    engine = create_engine(url, pool_size=pool_size, max_overflow=0)
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app("sync")
+    app.dependency_overrides[get_db] = override_get_db
+    return app
+
+
+def _async_app(url, pool_size: int):
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(
+        url.set(drivername="sqlite+aiosqlite"), pool_size=pool_size, max_overflow=0
+    )
+    Session = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with Session() as db:
+            yield db
+
+    app = create_app("async")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # aiosqlite connections own worker threads; close them on the same loop
+    app.router.on_shutdown.append(async_engine.dispose)
+    return app
+
+
+async def _load(app, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        queue = asyncio.Queue()
+        for _ in range(REQUESTS):
+            queue.put_nowait("/projects/1/tasks/?limit=20")
+
+        async def worker():
+            while not queue.empty():
+                resp = await client.get(queue.get_nowait())
+                assert resp.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    for handler in app.router.on_shutdown:
+        await handler()
+    return REQUESTS / elapsed
+
+
+def run(concurrency: int) -> dict:
+    results = {"concurrency": concurrency, "requests": REQUESTS}
+    with sqlite_engine() as engine:
+        seed_tasks(engine, 1_000, n_projects=1)
+        # pools sized to the concurrency so neither stack is pool-bound (a
+        # smaller sync pool can deadlock: sessions waiting for a threadpool
+        # slot to close hold the connections the busy threads wait for)
+        pool_size = concurrency
+        sync_app = _sync_app(engine.url, pool_size)
+        async_app = _async_app(engine.url, pool_size)
+        results["sync_rps"] = round(asyncio.run(_load(sync_app, concurrency)), 1)
+        results["async_rps"] = round(asyncio.run(_load(async_app, concurrency)), 1)
+    return results
+
+
+def main(argv=None):
+    levels = [int(a) for a in (argv or [])] or [1, 50, 200]
+    for c in levels:
+        print(json.dumps(run(c)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,39 @@
+"""
+Compare the ORM loop and the set-based UPDATE in autoclose_overdue_tasks.
+
+    python -m benchmarks.bench_autoclose [n_tasks ...]
+"""
+import json
+import sys
+from datetime import datetime, timedelta
+
+from app.commands.autoclose_overdue import autoclose_overdue_tasks
+from app.models.task import StatusEnum
+from benchmarks._common import make_session, seed_tasks, sqlite_engine, timer
+
+
+def run(n_tasks: int) -> dict:
+    results = {"n_tasks": n_tasks}
+    past = datetime.utcnow() - timedelta(days=1)
+    for mode, bulk in (("orm_loop_s", False), ("bulk_update_s", True)):
+        with sqlite_engine() as engine:
+            seed_tasks(engine, n_tasks, n_projects=10, status=StatusEnum.TODO, deadline=past)
+            db = make_session(engine)
+            try:
+                with timer(results, mode):
+                    closed = autoclose_overdue_tasks(db, bulk=bulk)
+            finally:
+                db.close()
+            assert closed == n_tasks
+    results["speedup"] = round(results["orm_loop_s"] / max(results["bulk_update_s"], 1e-9), 1)
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [10_000, 100_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
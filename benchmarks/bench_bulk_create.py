@@ -0,0 +1,67 @@
+"""
+Loading tasks through the API: one POST per task vs POST .../tasks/bulk.
+
+The per-task rate is measured on a small sample and extrapolated; the
+bulk path loads all n_tasks in MAX_BULK_TASKS-sized requests.
+
+    python -m benchmarks.bench_bulk_create [n_tasks ...]
+"""
+import json
+import sys
+
+from fastapi.testclient import TestClient
+
+from app.db.deps import get_db
+from app.main import create_app
+from app.services.task_service import MAX_BULK_TASKS
+from benchmarks._common import make_session, seed_tasks, sqlite_engine, timer
+
+SINGLE_SAMPLE = 1000
+
+
+def _client(engine) -> TestClient:
+    def override_get_db():
+        db = make_session(engine)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app("sync")
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def run(n_tasks: int) -> dict:
+    results = {"n_tasks": n_tasks}
+    payload = [{"title": f"T{i}", "description": "imported"} for i in range(n_tasks)]
+
+    with sqlite_engine() as engine:
+        seed_tasks(engine, 0)
+        client = _client(engine)
+        sample = payload[:SINGLE_SAMPLE]
+        with timer(results, "single_sample_s"):
+            for item in sample:
+                assert client.post("/projects/1/tasks/", json=item).status_code == 201
+        results["single_est_s"] = round(results["single_sample_s"] * n_tasks / len(sample), 3)
+
+    with sqlite_engine() as engine:
+        seed_tasks(engine, 0)
+        client = _client(engine)
+        with timer(results, "bulk_s"):
+            for start in range(0, n_tasks, MAX_BULK_TASKS):
+                chunk = payload[start:start + MAX_BULK_TASKS]
+                assert client.post("/projects/1/tasks/bulk", json=chunk).status_code == 201
+
+    results["speedup"] = round(results["single_est_s"] / max(results["bulk_s"], 1e-9), 1)
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [100_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,53 @@
+"""
+Task export: throughput and peak traced memory of the streaming encoder.
+
+Peak memory should not grow with the number of rows (one chunk of rows
+and its encoded bytes are alive at a time).
+
+    python -m benchmarks.bench_export [n_tasks ...]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from app.controllers.export_controller import encode_chunks
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+from app.services.task_service import TaskService
+from benchmarks._common import make_session, seed_tasks, sqlite_engine
+
+
+def run(n_tasks: int) -> dict:
+    results = {"n_tasks": n_tasks}
+    with sqlite_engine() as engine:
+        seed_tasks(engine, n_tasks, n_projects=10)
+        db = make_session(engine)
+        try:
+            service = TaskService(TaskRepository(db), ProjectRepository(db))
+            for fmt in ("ndjson", "csv"):
+                start = time.perf_counter()
+                size = sum(len(b) for b in encode_chunks(service.export_chunks(), fmt))
+                elapsed = time.perf_counter() - start
+                results[f"{fmt}_rows_per_s"] = round(n_tasks / elapsed)
+                results[f"{fmt}_mb"] = round(size / 1e6, 1)
+
+                # separate pass: tracemalloc slows the encoder down several times
+                tracemalloc.start()
+                for _ in encode_chunks(service.export_chunks(), fmt):
+                    pass
+                results[f"{fmt}_peak_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+                tracemalloc.stop()
+        finally:
+            db.close()
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [10_000, 100_000, 1_000_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
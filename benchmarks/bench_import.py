@@ -0,0 +1,62 @@
+"""
+`todo import` throughput: TaskImporter over InMemoryStorage and DBStorage
+(file-backed SQLite), from an in-memory CSV. Project/task limits are lifted.
+
+    python -m benchmarks.bench_import [n_tasks ...]
+"""
+import io
+import json
+import sys
+
+from todo_cli.config.settings import get_settings
+from todo_cli.core.importer import TaskImporter, read_records
+from todo_cli.storage.db_storage import DBStorage
+from todo_cli.storage.in_memory_storage import InMemoryStorage
+from benchmarks._common import make_session, sqlite_engine, timer
+
+N_PROJECTS = 10
+
+
+def _csv(n_tasks: int) -> str:
+    lines = ["project,title,description,deadline,status"]
+    for i in range(n_tasks):
+        deadline = f"2099-{i % 12 + 1:02d}-{i % 28 + 1:02d}" if i % 2 else ""
+        lines.append(f"P{i % N_PROJECTS},T{i},description {i},{deadline},todo")
+    return "\n".join(lines) + "\n"
+
+
+def _import(storage, data: str, prefix: str, results: dict) -> None:
+    importer = TaskImporter(storage, batch_size=10_000, create_projects=True)
+    with timer(results, f"{prefix}_s"):
+        stats = importer.run(read_records(io.StringIO(data), "csv"))
+    assert stats.failed == 0, stats.errors[:3]
+    results[f"{prefix}_rows_per_s"] = round(stats.imported / results[f"{prefix}_s"])
+
+
+def run(n_tasks: int) -> dict:
+    settings = get_settings()
+    limits = (settings.max_projects, settings.max_tasks_per_project)
+    settings.max_projects, settings.max_tasks_per_project = N_PROJECTS, n_tasks
+    results = {"n_tasks": n_tasks}
+    data = _csv(n_tasks)
+    try:
+        _import(InMemoryStorage(), data, "memory", results)
+        with sqlite_engine() as engine:
+            session = make_session(engine)
+            try:
+                _import(DBStorage(session=session), data, "db", results)
+            finally:
+                session.close()
+    finally:
+        settings.max_projects, settings.max_tasks_per_project = limits
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [100_000, 1_000_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,58 @@
+"""
+JournaledStorage: write rate with group commit, snapshot size and restart time.
+
+    python -m benchmarks.bench_journal_restart [n_tasks ...]
+"""
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+from todo_cli.core.models import Project, Task
+from todo_cli.storage.journaled_storage import SNAPSHOT_FILE, JournaledStorage
+from benchmarks._common import timer
+
+N_PROJECTS = 10
+JOURNAL_TAIL = 10_000
+
+
+def run(n_tasks: int) -> dict:
+    results = {"n_tasks": n_tasks}
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = JournaledStorage(data_dir, compact_every=10 ** 9)
+        projects = [storage.create_project(Project(0, f"P{i}", "")) for i in range(N_PROJECTS)]
+        now = datetime.now()
+        with timer(results, "write_s"):
+            with storage.transaction():
+                for i in range(n_tasks):
+                    storage.create_task(Task(0, projects[i % N_PROJECTS].project_id, f"T{i}", "", created_at=now))
+        results["writes_per_s"] = round(n_tasks / results["write_s"])
+
+        with timer(results, "compact_s"):
+            storage.compact()
+        results["snapshot_mb"] = round(os.path.getsize(os.path.join(data_dir, SNAPSHOT_FILE)) / 2 ** 20, 1)
+
+        # leave some records in the journal so restart also replays a tail
+        with storage.transaction():
+            for i in range(JOURNAL_TAIL):
+                storage.create_task(Task(0, projects[0].project_id, f"tail{i}", "", created_at=now))
+        storage.close()
+
+        with timer(results, "restart_s"):
+            reopened = JournaledStorage(data_dir)
+        with timer(results, "first_project_listing_s"):
+            listed = reopened.get_tasks_by_project_id(projects[1].project_id)
+        assert len(listed) == n_tasks // N_PROJECTS
+        reopened.close()
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [100_000, 1_000_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
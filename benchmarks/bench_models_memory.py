@@ -0,0 +1,82 @@
+"""
+Memory and construction cost of the CLI domain models.
+
+For each size, builds n Task objects and then loads n tasks into
+InMemoryStorage, measuring traced bytes (tracemalloc) and build rate.
+`dict_*` rows use a copy of the old __dict__-based Task for comparison.
+
+    python -m benchmarks.bench_models_memory [n_tasks ...]
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from todo_cli.core.models import Project, Task, TaskStatus
+from todo_cli.storage.in_memory_storage import InMemoryStorage
+
+
+class _DictTask:
+    """The pre-__slots__ Task, kept only as a baseline."""
+
+    def __init__(self, task_id, project_id, title, description, status=TaskStatus.TODO, deadline=None):
+        self.task_id = task_id
+        self.project_id = project_id
+        self.title = title
+        self.description = description
+        self.status = status
+        self.deadline = deadline
+        self.created_at = datetime.now()
+
+
+def _measure(build, n: int) -> tuple:
+    """(bytes per item, items per second) for build(n)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    keep = build(n)
+    elapsed = time.perf_counter() - start
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return round(size / n, 1), round(n / elapsed)
+
+
+def _titles(n: int) -> list:
+    # built outside the measurement so only the objects themselves are counted
+    return [f"T{i}" for i in range(n)]
+
+
+def run(n_tasks: int) -> dict:
+    results = {"n_tasks": n_tasks}
+    titles = _titles(n_tasks)
+
+    results["dict_bytes_per_task"], results["dict_tasks_per_s"] = _measure(
+        lambda n: [_DictTask(i, 1, titles[i], "") for i in range(n)], n_tasks
+    )
+    results["slots_bytes_per_task"], results["slots_tasks_per_s"] = _measure(
+        lambda n: [Task(i, 1, titles[i], "") for i in range(n)], n_tasks
+    )
+
+    def fill_storage(n):
+        storage = InMemoryStorage()
+        project = storage.create_project(Project(0, "Bench", ""))
+        now = datetime.now()
+        for i in range(n):
+            storage.create_task(Task(0, project.project_id, titles[i], "", created_at=now))
+        return storage
+
+    results["storage_bytes_per_task"], results["storage_tasks_per_s"] = _measure(fill_storage, n_tasks)
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [10_000, 100_000, 1_000_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
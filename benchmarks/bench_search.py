@@ -0,0 +1,79 @@
+"""
+Task search latency: the InMemoryStorage inverted index and the SQLite FTS5
+table behind TaskRepository.search, for one common word (every 10th task)
+and a two-word AND query.
+
+    python -m benchmarks.bench_search [n_tasks ...]
+"""
+import json
+import sys
+import time
+
+from sqlalchemy import insert
+
+from app.models.project import Project as ProjectRow
+from app.models.task import Task as TaskRow
+from app.repositories.task_repository import TaskRepository
+from app.search import search_terms
+from todo_cli.core.models import Project, Task
+from todo_cli.storage.in_memory_storage import InMemoryStorage
+from benchmarks._common import make_session, sqlite_engine, timer
+
+N_QUERIES = 200
+QUERIES = {"common": "word3", "and": "word3 tag7"}
+
+
+def _text(i: int):
+    return f"Task {i} word{i % 10}", f"description tag{i % 100}"
+
+
+def _per_query_ms(search, query: str) -> float:
+    start = time.perf_counter()
+    for _ in range(N_QUERIES):
+        search(query)
+    return round((time.perf_counter() - start) * 1000 / N_QUERIES, 3)
+
+
+def _memory(n_tasks: int, results: dict) -> None:
+    storage = InMemoryStorage()
+    project = storage.create_project(Project(0, "P", "d"))
+    with timer(results, "memory_index_s"):
+        for i in range(n_tasks):
+            title, description = _text(i)
+            storage.create_task(Task(0, project.project_id, title, description))
+    for name, query in QUERIES.items():
+        results[f"memory_{name}_ms"] = _per_query_ms(storage.search_tasks, query)
+
+
+def _db(n_tasks: int, results: dict) -> None:
+    with sqlite_engine() as engine:
+        # executemany insert; the FTS triggers index every row
+        with timer(results, "db_index_s"), engine.begin() as conn:
+            conn.execute(insert(ProjectRow), [{"id": 1, "name": "P", "description": ""}])
+            rows = [{"project_id": 1, "title": t, "description": d} for t, d in map(_text, range(n_tasks))]
+            conn.execute(insert(TaskRow), rows)
+        session = make_session(engine)
+        try:
+            repo = TaskRepository(session)
+            for name, query in QUERIES.items():
+                terms = search_terms(query)
+                results[f"db_{name}_ms"] = _per_query_ms(lambda _: repo.search(terms), query)
+        finally:
+            session.close()
+
+
+def run(n_tasks: int) -> dict:
+    results = {"n_tasks": n_tasks}
+    _memory(n_tasks, results)
+    _db(n_tasks, results)
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [100_000, 1_000_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,93 @@
+"""
+List endpoint bodies: ORM objects + pydantic models vs plain rows + TypeAdapter.
+
+Measures fetch + serialize of one page (what list_tasks / list_projects do
+on a cache miss), best of REPEAT runs, reported in ms per 10k rows.
+
+    python -m benchmarks.bench_serialization [n_rows ...]
+"""
+import json
+import sys
+import time
+
+from sqlalchemy import insert
+
+from app.models.project import Project
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+from app.schemas.project_schema import ProjectPage, ProjectSummaryOut, dump_project_page
+from app.schemas.task_schema import TaskPage, dump_task_page
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+from benchmarks._common import make_session, seed_tasks, sqlite_engine
+
+REPEAT = 5
+
+
+def _best_ms_per_10k(fn, n_rows: int) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000 * 10_000 / n_rows, 1)
+
+
+def run(n_rows: int) -> dict:
+    results = {"n_rows": n_rows}
+    with sqlite_engine() as engine:
+        # n_rows tasks in project 1, and n_rows projects for the project list
+        seed_tasks(engine, n_rows, n_projects=1)
+        with engine.begin() as conn:
+            conn.execute(insert(Project), [{"name": f"X{i}", "description": ""} for i in range(n_rows - 1)])
+        db = make_session(engine)
+        tasks = TaskService(TaskRepository(db), ProjectRepository(db))
+        projects = ProjectService(ProjectRepository(db))
+
+        def fresh(fn):
+            # new identity map each run, as in a real request
+            def wrapped():
+                db.expunge_all()
+                return fn()
+            return wrapped
+
+        def tasks_models():
+            items, cursor = tasks.list_tasks_page(1, n_rows)
+            return TaskPage(items=items, next_cursor=cursor).model_dump_json().encode()
+
+        def tasks_fast():
+            rows, cursor = tasks.list_tasks_page(1, n_rows, as_rows=True)
+            return dump_task_page(rows, cursor)
+
+        def projects_models():
+            rows, cursor = projects.list_projects_page(n_rows)
+            items = [ProjectSummaryOut.from_row(r) for r in rows]
+            return ProjectPage(items=items, next_cursor=cursor).model_dump_json().encode()
+
+        def projects_fast():
+            rows, cursor = projects.list_projects_page(n_rows, as_rows=True)
+            return dump_project_page(rows, cursor)
+
+        assert tasks_models() == tasks_fast()
+        assert projects_models() == projects_fast()
+        for name, fn in (
+            ("tasks_models_ms", tasks_models),
+            ("tasks_fast_ms", tasks_fast),
+            ("projects_models_ms", projects_models),
+            ("projects_fast_ms", projects_fast),
+        ):
+            results[name] = _best_ms_per_10k(fresh(fn), n_rows)
+        db.close()
+    results["tasks_speedup"] = round(results["tasks_models_ms"] / results["tasks_fast_ms"], 2)
+    results["projects_speedup"] = round(results["projects_models_ms"] / results["projects_fast_ms"], 2)
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [10_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,79 @@
+"""
+CLI ProjectService / TaskService operations at scale, on InMemoryStorage and
+on DBStorage (file-backed SQLite). The MAX_NUMBER_OF_* limits are lifted
+for the run.
+
+    python -m benchmarks.bench_services [n_tasks ...]
+"""
+import json
+import sys
+
+from todo_cli.config.settings import get_settings
+from todo_cli.core.models import TaskStatus
+from todo_cli.core.services import ProjectService, TaskService
+from todo_cli.storage.db_storage import DBStorage
+from todo_cli.storage.in_memory_storage import InMemoryStorage
+from benchmarks._common import make_session, sqlite_engine, timer
+
+N_PROJECTS = 10
+
+
+def _workload(storage, n_tasks: int, prefix: str, results: dict) -> None:
+    projects = ProjectService(storage)
+    tasks = TaskService(storage)
+
+    with timer(results, f"{prefix}_create_projects_s"):
+        project_ids = [projects.create_project(f"P{i}", "d").project_id for i in range(N_PROJECTS)]
+
+    with timer(results, f"{prefix}_create_tasks_s"):
+        task_ids = [
+            tasks.create_task(project_ids[i % N_PROJECTS], f"T{i}", "d").task_id for i in range(n_tasks)
+        ]
+
+    with timer(results, f"{prefix}_change_status_s"):
+        for task_id in task_ids:
+            tasks.change_task_status(task_id, TaskStatus.DOING)
+
+    with timer(results, f"{prefix}_edit_task_s"):
+        for task_id in task_ids:
+            tasks.edit_task(task_id, new_title="edited", new_status=TaskStatus.DONE)
+
+    with timer(results, f"{prefix}_list_s"):
+        for project_id in project_ids:
+            tasks.get_tasks_by_project_id(project_id)
+        projects.get_projects_with_task_counts()
+
+    with timer(results, f"{prefix}_delete_s"):
+        for task_id in task_ids[::2]:
+            tasks.delete_task(task_id)
+        for project_id in project_ids:
+            projects.delete_project(project_id)
+
+
+def run(n_tasks: int) -> dict:
+    settings = get_settings()
+    limits = (settings.max_projects, settings.max_tasks_per_project)
+    settings.max_projects = N_PROJECTS
+    settings.max_tasks_per_project = n_tasks
+    results = {"n_tasks": n_tasks}
+    try:
+        _workload(InMemoryStorage(), n_tasks, "memory", results)
+        with sqlite_engine() as engine:
+            session = make_session(engine)
+            try:
+                _workload(DBStorage(session=session), n_tasks, "db", results)
+            finally:
+                session.close()
+    finally:
+        settings.max_projects, settings.max_tasks_per_project = limits
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [1_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,90 @@
+"""
+CRUD throughput of the CLI storage backends: InMemoryStorage, DBStorage
+(file-backed SQLite, default settings) and SQLiteStorage (WAL, group commit).
+The two SQL backends run both with per-call writes and with the writes
+batched in one transaction(). Each write phase ends with flush(), so
+group-committed writes are counted only once they are committed.
+
+    python -m benchmarks.bench_storage [n_tasks ...]
+"""
+import json
+import os
+import sys
+import tempfile
+from contextlib import nullcontext
+from datetime import datetime
+
+from todo_cli.core.models import Project, Task, TaskStatus
+from todo_cli.storage.db_storage import DBStorage
+from todo_cli.storage.in_memory_storage import InMemoryStorage
+from todo_cli.storage.sqlite_storage import SQLiteStorage
+from benchmarks._common import make_session, sqlite_engine, timer
+
+N_PROJECTS = 10
+
+
+def _crud(storage, n_tasks: int, prefix: str, results: dict, batched: bool = False) -> None:
+    batch = storage.transaction if batched else nullcontext
+    now = datetime.now()
+
+    with timer(results, f"{prefix}_create_s"):
+        with batch():
+            projects = [storage.create_project(Project(0, f"P{i}", "d", now)) for i in range(N_PROJECTS)]
+            storage.flush()  # project ids are needed for the tasks below
+            tasks = [
+                storage.create_task(Task(0, projects[i % N_PROJECTS].project_id, f"T{i}", "d", created_at=now))
+                for i in range(n_tasks)
+            ]
+        storage.flush()
+    ids = [t.task_id for t in tasks]
+
+    with timer(results, f"{prefix}_get_s"):
+        for task_id in ids:
+            storage.get_task_by_id(task_id)
+
+    with timer(results, f"{prefix}_list_s"):
+        for p in projects:
+            storage.get_tasks_by_project_id(p.project_id)
+
+    with timer(results, f"{prefix}_update_s"):
+        with batch():
+            for task in tasks:
+                task.status = TaskStatus.DONE
+                storage.update_task(task)
+        storage.flush()
+
+    with timer(results, f"{prefix}_delete_s"):
+        with batch():
+            for task_id in ids:
+                storage.delete_task(task_id)
+        storage.flush()
+
+
+def run(n_tasks: int) -> dict:
+    results = {"n_tasks": n_tasks}
+    _crud(InMemoryStorage(), n_tasks, "memory", results)
+    for prefix, batched in (("db", False), ("db_batched", True)):
+        with sqlite_engine() as engine:
+            session = make_session(engine)
+            try:
+                _crud(DBStorage(session=session), n_tasks, prefix, results, batched=batched)
+            finally:
+                session.close()
+    for prefix, batched in (("sqlite", False), ("sqlite_batched", True)):
+        with tempfile.TemporaryDirectory() as data_dir:
+            storage = SQLiteStorage(os.path.join(data_dir, "todo.db"))
+            try:
+                _crud(storage, n_tasks, prefix, results, batched=batched)
+            finally:
+                storage.close()
+    return results
+
+
+def main(argv=None):
+    sizes = [int(a) for a in (argv or [])] or [1_000, 10_000]
+    for n in sizes:
+        print(json.dumps(run(n)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
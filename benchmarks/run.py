@@ -0,0 +1,137 @@
+"""
+Run the benchmark suites at fixed sizes and write one JSON report.
+
+    python -m benchmarks.run [--quick] [--only NAME ...] [--save FILE]
+                             [--compare BASELINE] [--threshold 0.25]
+
+The report is {"meta": {...}, "suites": {name: [result, ...]}}; every result
+is the dict the suite's run(n) returns. With --compare, each timing in the
+report is checked against the same key in BASELINE and the run exits with
+status 1 if any got worse by more than --threshold (a fraction). Keys
+ending in `_s`/`_ms` are lower-is-better, `_per_s`/`_rps` are
+higher-is-better; anything else (sizes, derived ratios such as `speedup`)
+is ignored, as are timings under a millisecond, which are mostly noise.
+
+Typical use: `--save baseline.json` on the main branch, then
+`--compare baseline.json` on a change, on the same machine.
+"""
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+# name -> (module, full sizes, --quick sizes)
+SUITES = {
+    "storage": ("benchmarks.bench_storage", [1_000, 10_000], [500]),
+    "services": ("benchmarks.bench_services", [1_000], [200]),
+    "autoclose": ("benchmarks.bench_autoclose", [10_000, 100_000], [2_000]),
+    "api": ("benchmarks.bench_api", [500], [100]),
+    "serialization": ("benchmarks.bench_serialization", [10_000], [2_000]),
+    "bulk_create": ("benchmarks.bench_bulk_create", [10_000], [1_000]),
+    "export": ("benchmarks.bench_export", [100_000], [10_000]),
+    "import": ("benchmarks.bench_import", [100_000], [10_000]),
+    "search": ("benchmarks.bench_search", [100_000], [10_000]),
+}
+
+LOWER_IS_BETTER = ("_s", "_ms")
+HIGHER_IS_BETTER = ("_per_s", "_rps")
+NOISE_FLOOR_S = 0.001
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_suites(names, quick: bool = False) -> dict:
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "quick": quick,
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "suites": {},
+    }
+    for name in names:
+        module, sizes, quick_sizes = SUITES[name]
+        bench = importlib.import_module(module)
+        results = report["suites"][name] = []
+        for n in quick_sizes if quick else sizes:
+            result = bench.run(n)
+            results.append(result)
+            print(json.dumps({"suite": name, **result}), flush=True)
+    return report
+
+
+def _direction(key: str, value) -> int:
+    """1 if higher is better, -1 if lower is better, 0 if `key` is not compared."""
+    if key.endswith(HIGHER_IS_BETTER):
+        return 1
+    if key.endswith(LOWER_IS_BETTER):
+        seconds = value / 1000 if key.endswith("_ms") else value
+        return -1 if seconds >= NOISE_FLOOR_S else 0
+    return 0
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list:
+    """
+    Regressions of `report` against `baseline` as (suite, size, key, old, new, change).
+    Results are matched by suite and position; sizes that differ are skipped.
+    """
+    regressions = []
+    for name, results in report["suites"].items():
+        for result, old in zip(results, baseline.get("suites", {}).get(name, [])):
+            size_key = next(iter(result))
+            if result.get(size_key) != old.get(size_key):
+                continue
+            for key, new_value in result.items():
+                old_value = old.get(key)
+                if not isinstance(old_value, (int, float)) or old_value <= 0:
+                    continue
+                direction = _direction(key, old_value)
+                if not direction:
+                    continue
+                # positive change == worse, in both directions
+                change = (old_value - new_value) / old_value if direction > 0 else (new_value - old_value) / old_value
+                if change > threshold:
+                    regressions.append((name, result[size_key], key, old_value, new_value, change))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="small sizes, for a smoke run")
+    parser.add_argument("--only", nargs="+", choices=sorted(SUITES), help="run only these suites")
+    parser.add_argument("--save", metavar="FILE", help="write the report as JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="fail on regressions against a saved report")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown fraction (default 0.25)")
+    args = parser.parse_args(argv)
+
+    report = run_suites(args.only or list(SUITES), quick=args.quick)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    if not args.compare:
+        return 0
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    for name, size, key, old, new, change in regressions:
+        print(f"REGRESSION {name}[{size}] {key}: {old} -> {new} ({change:+.0%})", file=sys.stderr)
+    if not regressions:
+        print(f"no regressions beyond {args.threshold:.0%} against {args.compare}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -6,24 +6,69 @@ print("⚠️ CLI is deprecated starting Phase 3. Please use the FastAPI Web API
 
 from todo_cli.core.services import ProjectService, TaskService
 from todo_cli.storage.in_memory_storage import InMemoryStorage
-from todo_cli.storage.db_storage import DBStorage
 from todo_cli.core.models import TaskStatus
-from datetime import datetime
+from todo_cli.core.dates import DateParser
 import re
 import os
+import sys
+
+def make_storage():
+    """
+    Storage backend selected by STORAGE (memory | db | journal | sqlite) and STORAGE_CACHE.
+
+    Backends are imported here, not at module level: the db backend pulls in
+    SQLAlchemy and the ORM models, which dominate startup when unused.
+    """
+    storage_choice = os.getenv("STORAGE", "memory")
+    if storage_choice == "db":
+        from todo_cli.storage.db_storage import DBStorage
+        storage = DBStorage()
+    elif storage_choice == "journal":
+        from todo_cli.storage.journaled_storage import JournaledStorage
+        storage = JournaledStorage(os.getenv("TODO_DATA_DIR", ".todo_data"))
+    elif storage_choice == "sqlite":
+        from todo_cli.storage.sqlite_storage import SQLiteStorage
+        storage = SQLiteStorage(
+            os.getenv("TODO_SQLITE_PATH") or os.path.join(os.getenv("TODO_DATA_DIR", ".todo_data"), "todo.db"),
+            batch_size=int(os.getenv("TODO_SQLITE_BATCH_SIZE", "1000")),
+        )
+    else:
+        storage = InMemoryStorage()
+
+    if os.getenv("STORAGE_CACHE", "false").lower() in ("1", "true", "yes"):
+        from todo_cli.storage.cached_storage import CachedStorage
+        storage = CachedStorage(
+            storage,
+            maxsize=int(os.getenv("STORAGE_CACHE_SIZE", "1024")),
+            ttl=float(os.getenv("STORAGE_CACHE_TTL", "30")),
+        )
+    return storage
+
+
+def _require_persistent_storage(command):
+    """
+    True if STORAGE names a backend that outlives the process.
+
+    `import` and `search` run one command and exit, so against the default
+    in-memory storage an import is thrown away and a search never finds
+    anything; refuse instead of reporting a success that did not happen.
+    """
+    if os.getenv("STORAGE", "memory") in ("db", "journal", "sqlite"):
+        return True
+    print(
+        f"❌ `todo {command}` needs persistent storage: set STORAGE to db, journal or sqlite "
+        "(the in-memory store is discarded when the command exits).",
+        file=sys.stderr,
+    )
+    return False
+
 
 class ToDoListCLI:
     """Command Line Interface for ToDo List Management"""
     
     def __init__(self, storage=None):
-        if storage is not None:
-            self.storage = storage
-        else:
-            storage_choice = os.getenv("STORAGE", "memory")
-            if storage_choice == "db":
-                self.storage = DBStorage()
-            else:
-                self.storage = InMemoryStorage()
+        self.storage = storage if storage is not None else make_storage()
+        self.date_parser = DateParser()
 
         self.project_service = ProjectService(self.storage)
         self.task_service = TaskService(self.storage)
@@ -80,6 +125,8 @@ class ToDoListCLI:
     
     def get_user_input(self, prompt, validator=None):
         """Get user input with optional validation"""
+        # batched writes (STORAGE=sqlite / journal) are made durable before we wait on the user
+        self.storage.flush()
         while True:
             try:
                 user_input = input(prompt).strip()
@@ -109,32 +156,19 @@ class ToDoListCLI:
     
     def validate_date(self, date_string):
         """Validate and parse date input"""
-        if not date_string:
-            return None
-        
-        try:
-            # Try different date formats
-            for fmt in ['%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y', '%d/%m/%Y']:
-                try:
-                    return datetime.strptime(date_string, fmt).date()
-                except ValueError:
-                    continue
-            raise ValueError("Invalid date format. Use YYYY-MM-DD, DD-MM-YYYY, etc.")
-        except Exception:
-            raise ValueError("Invalid date format. Use YYYY-MM-DD, DD-MM-YYYY, etc.")
+        return self.date_parser.parse(date_string)
     
     def select_project(self):
         """Select a project to work with"""
-        projects = self.project_service.get_all_projects()
+        projects = self.project_service.get_projects_with_task_counts()
         if not projects:
             print("❌ No projects available. Please create a project first.")
             return None
         
         print("\nAvailable Projects:")
         print("-" * 30)
-        for project in projects:
-            tasks = self.task_service.get_tasks_by_project_id(project.project_id)
-            task_count = len(tasks)
+        for project, counts in projects:
+            task_count = sum(counts.values())
             print(f"{project.project_id}. {project.name} ({task_count} tasks)")
             print(f"   Description: {project.description}")
             print()
@@ -196,7 +230,7 @@ class ToDoListCLI:
     
     def handle_project_listing(self):
         """Handle listing all projects"""
-        projects = self.project_service.get_all_projects()
+        projects = self.project_service.get_projects_with_task_counts()
         
         if not projects:
             print("📭 No projects found.")
@@ -205,16 +239,15 @@ class ToDoListCLI:
         print(f"\n--- All Projects ({len(projects)}) ---")
         print("=" * 60)
         
-        for project in projects:
-            tasks = self.task_service.get_tasks_by_project_id(project.project_id)
-            todo_count = len([t for t in tasks if t.status == TaskStatus.TODO])
-            doing_count = len([t for t in tasks if t.status == TaskStatus.DOING])
-            done_count = len([t for t in tasks if t.status == TaskStatus.DONE])
+        for project, counts in projects:
+            todo_count = counts.get(TaskStatus.TODO, 0)
+            doing_count = counts.get(TaskStatus.DOING, 0)
+            done_count = counts.get(TaskStatus.DONE, 0)
             
             print(f"ID: {project.project_id}")
             print(f"Name: {project.name}")
             print(f"Description: {project.description}")
-            print(f"Tasks: 📋 Total: {len(tasks)} | ✅ Done: {done_count} | 🔄 Doing: {doing_count} | ⏳ Todo: {todo_count}")
+            print(f"Tasks: 📋 Total: {todo_count + doing_count + done_count} | ✅ Done: {done_count} | 🔄 Doing: {doing_count} | ⏳ Todo: {todo_count}")
             print(f"Created: {project.created_at.strftime('%Y-%m-%d %H:%M')}")
             print("-" * 60)
     
@@ -678,8 +711,114 @@ class ToDoListCLI:
                 print("❌ Invalid choice! Please enter a number between 1-6.")
 
 
-def main():
+def run_import(argv):
+    """`todo import FILE`: non-interactive bulk import into the selected storage."""
+    import argparse
+    from todo_cli.core.importer import FORMATS, TaskImporter, detect_format, read_records
+
+    parser = argparse.ArgumentParser(prog="todo import", description="Import tasks from a CSV or NDJSON file.")
+    parser.add_argument("file", help="CSV with a header row, or one JSON object per line; '-' for stdin")
+    parser.add_argument("--format", choices=FORMATS, help="default: from the file extension (csv otherwise)")
+    parser.add_argument("--project", help="project name for records without a 'project' field")
+    parser.add_argument("--create-projects", action="store_true", help="create projects that do not exist yet")
+    parser.add_argument("--batch-size", type=int, default=1000, help="rows per transaction (default 1000)")
+    args = parser.parse_args(argv)
+    fmt = args.format or detect_format(args.file)
+    if not _require_persistent_storage("import"):
+        return 2
+
+    def progress(stats):
+        print(f"  {stats.imported:,} imported, {stats.failed:,} rejected, {stats.rows_per_s:,.0f} rows/s", file=sys.stderr)
+
+    storage = make_storage()
+    try:
+        importer = TaskImporter(
+            storage,
+            batch_size=args.batch_size,
+            default_project=args.project,
+            create_projects=args.create_projects,
+            progress=progress,
+        )
+        f = sys.stdin if args.file == "-" else open(args.file, newline="", encoding="utf-8")
+        try:
+            stats = importer.run(read_records(f, fmt))
+        except Exception as e:
+            stats = importer.stats
+            print(
+                f"❌ Import stopped at row {stats.read:,}: {e}. {stats.imported:,} rows were stored.",
+                file=sys.stderr,
+            )
+            return 1
+        finally:
+            if f is not sys.stdin:
+                f.close()
+    finally:
+        storage.close()
+
+    for line_no, message in stats.errors:
+        print(f"line {line_no}: {message}", file=sys.stderr)
+    if stats.failed > len(stats.errors):
+        print(f"... and {stats.failed - len(stats.errors):,} more rejected rows", file=sys.stderr)
+    print(
+        f"✅ Imported {stats.imported:,} of {stats.read:,} rows in {stats.elapsed:.1f}s "
+        f"({stats.rows_per_s:,.0f} rows/s)"
+    )
+    return 1 if stats.failed else 0
+
+
+def run_search(argv):
+    """`todo search WORDS...`: ranked search over task titles and descriptions."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="todo search", description="Search task titles and descriptions.")
+    parser.add_argument("words", nargs="+", help="every word must appear in the title or description")
+    parser.add_argument("--project", help="search only this project (name)")
+    parser.add_argument("--limit", type=int, default=20, help="results per page (default 20)")
+    parser.add_argument("--offset", type=int, default=0, help="skip this many results (see the hint after a full page)")
+    args = parser.parse_args(argv)
+    if not _require_persistent_storage("search"):
+        return 2
+
+    storage = make_storage()
+    try:
+        project_id = None
+        if args.project:
+            project = storage.get_project_by_name(args.project)
+            if project is None:
+                print(f"❌ Project '{args.project}' not found.", file=sys.stderr)
+                return 1
+            project_id = project.project_id
+        try:
+            tasks, next_offset = TaskService(storage).search_tasks(
+                " ".join(args.words), project_id, limit=args.limit, offset=args.offset
+            )
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+    finally:
+        storage.close()
+
+    if not tasks:
+        print("📭 No matching tasks.")
+        return 0
+    for task in tasks:
+        deadline_str = f" | 📅 {task.deadline}" if task.deadline else ""
+        print(f"  #{task.task_id} [{task.status.value}] (project {task.project_id}) {task.title}{deadline_str}")
+        print(f"     Description: {task.description}")
+    if next_offset is not None:
+        print(f"... more results: --offset {next_offset}")
+    return 0
+
+
+def main(argv=None):
     """Main entry point for the application"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "import":
+        return run_import(argv[1:])
+    if argv and argv[0] == "search":
+        return run_search(argv[1:])
+
+    app = None
     try:
         app = ToDoListCLI()
         app.run()
@@ -688,7 +827,10 @@ def main():
     except Exception as e:
         print(f"\n💥 An unexpected error occurred: {e}")
         print("Please restart the application.")
+    finally:
+        if app is not None:
+            app.storage.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,70 @@
+from datetime import date, datetime
+
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%d-%m-%Y", "%d/%m/%Y")
+
+
+class DateParser:
+    """
+    Parses deadline strings in any of DATE_FORMATS.
+
+    The format that matched last is tried first, so a file written in one
+    format costs one parse per value instead of a failed strptime per
+    format. Repeated values are answered from a small memo.
+    """
+
+    MEMO_SIZE = 4096
+
+    def __init__(self):
+        self.format = None
+        self._memo = {}
+
+    def parse(self, text: str):
+        if not text:
+            return None
+        value = self._memo.get(text)
+        if value is not None:
+            return value
+
+        value = None
+        if self.format is not None:
+            value = _try(text, self.format)
+        if value is None:
+            for fmt in DATE_FORMATS:
+                if fmt != self.format:
+                    value = _try(text, fmt)
+                    if value is not None:
+                        self.format = fmt
+                        break
+        if value is None:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD, DD-MM-YYYY, etc.")
+
+        if len(self._memo) >= self.MEMO_SIZE:
+            self._memo.clear()
+        self._memo[text] = value
+        return value
+
+
+def _try(text: str, fmt: str):
+    try:
+        if fmt == "%Y-%m-%d" and _is_padded_iso_date(text):
+            # much cheaper than strptime for the common zero-padded form
+            return date.fromisoformat(text)
+        return datetime.strptime(text, fmt).date()
+    except ValueError:
+        return None
+
+
+def _is_padded_iso_date(text: str) -> bool:
+    """
+    Exactly YYYY-MM-DD in ASCII digits. fromisoformat also takes ISO week
+    dates ("2030-W01-2") and other forms strptime("%Y-%m-%d") rejects, so
+    only this shape may skip strptime.
+    """
+    return (
+        len(text) == 10
+        and text.isascii()
+        and text[4] == text[7] == "-"
+        and text[:4].isdigit()
+        and text[5:7].isdigit()
+        and text[8:].isdigit()
+    )
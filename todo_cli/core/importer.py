@@ -0,0 +1,184 @@
+import csv
+import json
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from todo_cli.config.settings import get_settings
+from todo_cli.core.dates import DateParser
+from todo_cli.core.models import Task, TaskStatus
+from todo_cli.core.services import ProjectService, validate_task_fields
+
+FORMATS = ("csv", "ndjson")
+_STATUS_BY_VALUE = {s.value: s for s in TaskStatus}
+
+
+def detect_format(path: str) -> str:
+    return "ndjson" if path.endswith((".ndjson", ".jsonl", ".json")) else "csv"
+
+
+def read_records(f, fmt: str) -> Iterator[Tuple[int, object]]:
+    """
+    Stream (line number, record) pairs from an open text file. A record is
+    a dict, or a ValueError for a line that could not be decoded.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_no, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_no, ValueError(f"Invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            record = ValueError("Each line must be a JSON object.")
+        yield line_no, record
+
+
+class ImportStats:
+    KEEP_ERRORS = 100
+
+    def __init__(self):
+        self.read = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors = []  # [(line number, message)], first ImportStats.KEEP_ERRORS only
+        self.started = time.perf_counter()
+
+    def error(self, line_no: int, message: str):
+        self.failed += 1
+        if len(self.errors) < self.KEEP_ERRORS:
+            self.errors.append((line_no, message))
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.read / self.elapsed if self.elapsed else 0.0
+
+
+class TaskImporter:
+    """
+    Bulk task import with the same rules as ProjectService/TaskService.
+
+    Records carry title, description, and optionally deadline, status and
+    project (name; falls back to `default_project`). Valid rows are written
+    in chunks of `batch_size`, one storage transaction and one
+    create_tasks() call per chunk. Invalid rows are counted and skipped.
+
+    Per-project task counts are read once and then tracked here, and
+    project lookups are cached, so the cost per row does not grow with
+    the size of the project.
+
+    If a batch write raises, the import stops and the exception propagates;
+    `self.stats` then counts what is stored: nothing of that batch on
+    storages with ATOMIC_TRANSACTIONS, the tasks created before the
+    failure on the others.
+    """
+
+    def __init__(
+        self,
+        storage,
+        batch_size: int = 1000,
+        default_project: Optional[str] = None,
+        create_projects: bool = False,
+        progress: Optional[Callable[[ImportStats], None]] = None,
+    ):
+        self.storage = storage
+        self.project_service = ProjectService(storage)
+        self.batch_size = batch_size
+        self.default_project = default_project
+        self.create_projects = create_projects
+        self.progress = progress
+        self.dates = DateParser()
+        self.stats = ImportStats()
+        self._projects = {}    # {name: project_id, or the error message for every row naming it}
+        self._remaining = {}   # {project_id: tasks that still fit}
+
+    def run(self, records: Iterable[Tuple[int, object]]) -> ImportStats:
+        stats = self.stats = ImportStats()
+        today = datetime.now().date()
+        created_at = datetime.now()
+        batch = []
+        for line_no, record in records:
+            stats.read += 1
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                batch.append(self._build_task(record, today, created_at))
+            except ValueError as e:
+                stats.error(line_no, str(e))
+                continue
+            if len(batch) >= self.batch_size:
+                self._write(batch, stats)
+                batch = []
+        if batch:
+            self._write(batch, stats)
+        return stats
+
+    def _write(self, batch, stats: ImportStats):
+        try:
+            with self.storage.transaction():
+                self.storage.create_tasks(batch)
+        except Exception:
+            if not self.storage.ATOMIC_TRANSACTIONS:
+                stats.imported += sum(1 for task in batch if task.task_id)
+            raise
+        stats.imported += len(batch)
+        if self.progress is not None:
+            self.progress(stats)
+
+    def _build_task(self, record: dict, today, created_at) -> Task:
+        title = str(record.get("title") or "").strip()
+        description = str(record.get("description") or "").strip()
+
+        deadline = record.get("deadline") or None
+        if isinstance(deadline, str):
+            deadline = self.dates.parse(deadline.strip())
+        deadline = validate_task_fields(title, description, deadline, today=today)
+
+        status = TaskStatus.TODO
+        if record.get("status"):
+            status = _STATUS_BY_VALUE.get(str(record["status"]).strip().lower())
+            if status is None:
+                raise ValueError("The status provided is not valid.")
+
+        project_id = self._project_id(str(record.get("project") or self.default_project or "").strip())
+        # reserve the slot now so later rows in the same batch see it
+        if self._remaining[project_id] <= 0:
+            raise ValueError(
+                f"Maximum number of tasks allowed in a project({get_settings().max_tasks_per_project}) has been reached."
+            )
+        self._remaining[project_id] -= 1
+        return Task(0, project_id, title, description, status, deadline, created_at)
+
+    def _project_id(self, name: str) -> int:
+        if not name:
+            raise ValueError("No project given (add a 'project' field or use --project).")
+        project_id = self._projects.get(name)
+        if project_id is None:
+            project_id = self._projects[name] = self._resolve_project(name)
+        if isinstance(project_id, str):
+            raise ValueError(project_id)
+        return project_id
+
+    def _resolve_project(self, name: str):
+        project = self.storage.get_project_by_name(name)
+        if project is None:
+            if not self.create_projects:
+                return f"Project '{name}' not found (use --create-projects)."
+            try:
+                project = self.project_service.create_project(name, name)
+            except ValueError as e:
+                return str(e)
+            self.storage.flush()  # the id is needed before the first batch
+        limit = get_settings().max_tasks_per_project
+        self._remaining[project.project_id] = limit - self.storage.count_tasks(project.project_id)
+        return project.project_id
@@ -6,25 +6,33 @@ class TaskStatus(Enum):
     DOING = "doing"
     DONE = "done"
 
+# __slots__: no per-instance __dict__, which matters when storage holds
+# hundreds of thousands of tasks. Callers that build many objects at once
+# can pass a shared created_at instead of calling datetime.now() per object.
+
 class Project:
-    def __init__(self, project_id: int, name: str, description: str):
+    __slots__ = ("project_id", "name", "description", "created_at")
+
+    def __init__(self, project_id: int, name: str, description: str, created_at: datetime = None):
         self.project_id = project_id
         self.name = name
         self.description = description
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
 
     def __str__(self):
         return f"Project(ID: {self.project_id}, Name: {self.name})"
 
 class Task:
-    def __init__(self, task_id: int, project_id: int, title: str, description: str, status: TaskStatus = TaskStatus.TODO, deadline: datetime = None):
+    __slots__ = ("task_id", "project_id", "title", "description", "status", "deadline", "created_at")
+
+    def __init__(self, task_id: int, project_id: int, title: str, description: str, status: TaskStatus = TaskStatus.TODO, deadline: datetime = None, created_at: datetime = None):
         self.task_id = task_id
         self.project_id = project_id
         self.title = title
         self.description = description
         self.status = status
         self.deadline = deadline
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
 
     def __str__(self):
         return f"Task(ID: {self.task_id}, Title: {self.title}, Status: {self.status.value})"
\ No newline at end of file
@@ -3,8 +3,6 @@ from todo_cli.core.models import Project, Task, TaskStatus
 from todo_cli.storage.in_memory_storage import InMemoryStorage
 from todo_cli.config.settings import get_settings
 
-settings = get_settings()
-
 
 class ProjectService:
 
@@ -25,11 +23,11 @@ class ProjectService:
         Raises:
             ValueError: In case of violation of any of the rules
         """
-        if len(self.storage.get_all_projects()) >= settings.max_projects:
+        settings = get_settings()
+        if self.storage.count_projects() >= settings.max_projects:
             raise ValueError(f"The maximum number of projects allowed ({settings.max_projects}) has been reached.")
 
-        existing_projects = self.storage.get_all_projects()
-        if any(p.name == name for p in existing_projects):
+        if self.storage.project_name_exists(name):
             raise ValueError("The project name is duplicated.")
 
         if not (0 < len(name) <= 30):
@@ -56,8 +54,8 @@ class ProjectService:
         if not project:
             raise ValueError("The desired project was not found.")
 
-        existing_projects = self.storage.get_all_projects()
-        if any(p.name == new_name and p.project_id != project_id for p in existing_projects):
+        existing = self.storage.get_project_by_name(new_name)
+        if existing is not None and existing.project_id != project_id:
             raise ValueError("The new project name conflicts with another project.")
 
         if not (0 < len(new_name) <= 30):
@@ -95,6 +93,15 @@ class ProjectService:
         """
         return self.storage.get_all_projects()
 
+    def get_projects_with_task_counts(self) -> list[tuple[Project, dict]]:
+        """
+        Get all projects together with their task counts per status
+        
+        Returns:
+            list[tuple[Project, dict]]: (project, {TaskStatus: count}) pairs
+        """
+        return self.storage.get_projects_with_task_counts()
+
     def get_project_by_id(self, project_id: int) -> Project:
         """
         Get project by ID
@@ -111,6 +118,27 @@ class ProjectService:
         return project
 
 
+def validate_task_fields(title: str, description: str, deadline: date = None, today: date = None) -> date:
+    """
+    Field rules shared by create_task and the bulk importer.
+
+    Returns the deadline as a date (or None).
+    Raises:
+        ValueError: In case of violation of any of the rules
+    """
+    if not (0 < len(title) <= 30):
+        raise ValueError("The task title must be between 1 and 30 characters.")
+    if not (0 < len(description) <= 150):
+        raise ValueError("Task descriptions must be between 1 and 150 characters.")
+
+    if deadline:
+        if isinstance(deadline, datetime):
+            deadline = deadline.date()
+        if deadline < (today or datetime.now().date()):
+            raise ValueError("The deadline date cannot be in the past.")
+    return deadline
+
+
 class TaskService:
 
     def __init__(self, storage: InMemoryStorage):
@@ -133,23 +161,11 @@ class TaskService:
         if not project:
             raise ValueError("The desired project was not found.")
 
-        project_tasks = self.storage.get_tasks_by_project_id(project_id)
-        if len(project_tasks) >= settings.max_tasks_per_project:
+        settings = get_settings()
+        if self.storage.count_tasks(project_id) >= settings.max_tasks_per_project:
             raise ValueError(f"Maximum number of tasks allowed in a project({settings.max_tasks_per_project}) has been reached.")
 
-        if not (0 < len(title) <= 30):
-            raise ValueError("The task title must be between 1 and 30 characters.")
-        if not (0 < len(description) <= 150):
-            raise ValueError("Task descriptions must be between 1 and 150 characters.")
-
-        if deadline:
-            
-            if isinstance(deadline, datetime):
-                deadline = deadline.date()
-
-            today = datetime.now().date()
-            if deadline < today:
-                raise ValueError("The deadline date cannot be in the past.")
+        deadline = validate_task_fields(title, description, deadline)
 
         new_task = Task(0, project_id, title, description, TaskStatus.TODO, deadline)
         return self.storage.create_task(new_task)
@@ -273,6 +289,27 @@ class TaskService:
 
         return self.storage.get_tasks_by_project_id(project_id)
 
+    def search_tasks(self, query: str, project_id: int = None, limit: int = 20, offset: int = 0) -> tuple[list[Task], int]:
+        """
+        Full-text search over task titles and descriptions
+        
+        Args:
+            query: Words that must all appear (case-insensitive)
+            project_id: Limit the search to one project (optional)
+            limit: Page size
+            offset: Number of ranked results to skip
+            
+        Returns:
+            tuple[list[Task], int]: Best matches first, and the offset of the next page (None on the last page)
+        """
+        if not any(ch.isalnum() for ch in query):
+            raise ValueError("The search text must contain at least one word.")
+        if not (1 <= limit <= 100):
+            raise ValueError("The page size must be between 1 and 100.")
+        if project_id is not None and not self.storage.get_project_by_id(project_id):
+            raise ValueError("The desired project was not found.")
+        return self.storage.search_tasks(query, project_id, limit, max(offset, 0))
+
     def get_all_tasks(self) -> list[Task]:
         """
         Receive all system tasks (for management purposes)
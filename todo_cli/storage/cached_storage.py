@@ -0,0 +1,168 @@
+import copy
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """Bounded LRU whose entries also expire `ttl` seconds after being stored."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # {key: (expires_at, value)}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key):
+        entry = self._entries.pop(key, None)
+        return _MISSING if entry is None else entry[1]
+
+    def items(self):
+        return list(self._entries.items())
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CachedStorage:
+    """
+    Read-through cache in front of a storage backend (DBStorage or InMemoryStorage).
+
+    Caches projects and tasks by id and task lists per project, in one
+    bounded LRU with a TTL. Writes go straight to the backend and drop the
+    affected entries. Callers get copies, so mutating a returned object
+    (the services do that before update_*) never changes the cache.
+    The TTL bounds staleness when something else writes to the same DB.
+    Methods that are not cached are passed through to the backend.
+    """
+
+    def __init__(self, backend, maxsize: int = 1024, ttl: float = 30.0):
+        self.backend = backend
+        self._cache = _TTLCache(maxsize, ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name):
+        return getattr(self.backend, name)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+
+    def clear(self):
+        self._cache.clear()
+
+    def _read(self, key, load):
+        value = self._cache.get(key)
+        if value is _MISSING:
+            self.misses += 1
+            value = load()
+            if value is not None:
+                self._cache.put(key, _copy(value))
+        else:
+            self.hits += 1
+        return _copy(value)
+
+    # -------------------
+    # Unit of work / lifecycle
+    # -------------------
+    @contextmanager
+    def transaction(self):
+        with self.backend.transaction():
+            try:
+                yield self
+            except Exception:
+                # the backend rolled back; entries cached inside the block may be wrong
+                self._cache.clear()
+                raise
+
+    def flush(self):
+        self.backend.flush()
+
+    def close(self):
+        self.backend.close()
+
+    # -------------------
+    # Projects
+    # -------------------
+    def create_project(self, project):
+        return self.backend.create_project(project)
+
+    def get_project_by_id(self, project_id):
+        return self._read(("project", project_id), lambda: self.backend.get_project_by_id(project_id))
+
+    def update_project(self, project):
+        self._cache.pop(("project", project.project_id))
+        return self.backend.update_project(project)
+
+    def delete_project(self, project_id):
+        self._cache.pop(("project", project_id))
+        self._cache.pop(("tasks", project_id))
+        for key, (_, value) in self._cache.items():
+            if key[0] == "task" and value.project_id == project_id:
+                self._cache.pop(key)
+        return self.backend.delete_project(project_id)
+
+    # -------------------
+    # Tasks
+    # -------------------
+    def create_task(self, task):
+        self._cache.pop(("tasks", task.project_id))
+        return self.backend.create_task(task)
+
+    def create_tasks(self, tasks):
+        for project_id in {t.project_id for t in tasks}:
+            self._cache.pop(("tasks", project_id))
+        return self.backend.create_tasks(tasks)
+
+    def get_tasks_by_project_id(self, project_id):
+        return self._read(("tasks", project_id), lambda: self.backend.get_tasks_by_project_id(project_id))
+
+    def get_task_by_id(self, task_id):
+        return self._read(("task", task_id), lambda: self.backend.get_task_by_id(task_id))
+
+    def _forget_task(self, task_id, project_id=None):
+        old = self._cache.pop(("task", task_id))
+        project_ids = {project_id}
+        if old is not _MISSING:
+            project_ids.add(old.project_id)
+        else:
+            # old project unknown: drop any cached list that holds the task
+            for key, (_, value) in self._cache.items():
+                if key[0] == "tasks" and any(t.task_id == task_id for t in value):
+                    project_ids.add(key[1])
+        for pid in project_ids:
+            self._cache.pop(("tasks", pid))
+
+    def update_task(self, task):
+        self._forget_task(task.task_id, task.project_id)
+        return self.backend.update_task(task)
+
+    def delete_task(self, task_id):
+        self._forget_task(task_id)
+        return self.backend.delete_task(task_id)
+
+
+def _copy(value):
+    if isinstance(value, list):
+        return [copy.copy(v) for v in value]
+    return copy.copy(value)
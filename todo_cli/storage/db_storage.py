@@ -1,19 +1,32 @@
-from typing import Optional, List
-from app.db.session import SessionLocal
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict
+from app.db.session import get_sessionmaker
 from app.repositories.project_repository import ProjectRepository
+from app.models.task import StatusEnum
 from app.repositories.task_repository import TaskRepository
+from app.search import search_terms
 from todo_cli.core.models import Project as DomainProject, Task as DomainTask, TaskStatus
-from datetime import datetime
+
+_STATUS_BY_VALUE = {s.value: s for s in TaskStatus}
+
 
 class DBStorage:
+    # an exception inside transaction() rolls back the whole block
+    ATOMIC_TRANSACTIONS = True
+
     def __init__(self, session=None):
         if session is None:
-            self.db = SessionLocal()
+            self.db = get_sessionmaker()()
             self._close_on_exit = True
         else:
             self.db = session
             self._close_on_exit = False
 
+        # unit-of-work state (see transaction())
+        self._in_transaction = False
+        self._pending = []  # [(orm_obj, domain_obj)] created but not flushed yet
+
     def close(self):
         """Close DB session (call when shutting down/tests)"""
         try:
@@ -21,111 +34,215 @@ class DBStorage:
         except Exception:
             pass
 
+    # -------------------
+    # Unit of work
+    # -------------------
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into one transaction:
+
+            with storage.transaction():
+                storage.create_task(...)   # no flush, no commit
+                ...
+            # one flush (batched INSERTs) + one commit here
+
+        Generated ids are copied onto the returned domain objects when the
+        block ends or when flush() is called. Reads inside the block flush
+        first, so they see the block's own writes. Nested blocks join the
+        outer one; an exception rolls everything back.
+        """
+        if self._in_transaction:
+            yield self
+            return
+
+        self._in_transaction = True
+        try:
+            yield self
+            self.flush()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+            self._pending.clear()
+
+    def flush(self):
+        """Send pending writes now and fill in generated ids."""
+        self.db.flush()
+        for orm_obj, domain_obj in self._pending:
+            if isinstance(domain_obj, DomainProject):
+                domain_obj.project_id = orm_obj.id
+            else:
+                domain_obj.task_id = orm_obj.id
+        self._pending.clear()
+
+    def _before_read(self):
+        if self._in_transaction:
+            self.flush()
+
+    def _commit(self):
+        if not self._in_transaction:
+            self.db.commit()
+
+    def _project_repo(self) -> ProjectRepository:
+        return ProjectRepository(self.db, autocommit=not self._in_transaction)
+
+    def _task_repo(self) -> TaskRepository:
+        return TaskRepository(self.db, autocommit=not self._in_transaction)
+
     # -------------------
     # Projects
     # -------------------
     def create_project(self, domain_project: DomainProject) -> DomainProject:
-        repo = ProjectRepository(self.db)
+        repo = self._project_repo()
         p = repo.create(name=domain_project.name, description=domain_project.description)
         # map ORM -> Domain (اگر ORM فیلد created_at داشت از آن استفاده کن)
-        created_at = getattr(p, "created_at", None) or datetime.now()
-        return DomainProject(p.id, p.name, p.description)
+        created = DomainProject(p.id, p.name, p.description)
+        if self._in_transaction:
+            self._pending.append((p, created))
+        return created
 
     def get_all_projects(self) -> List[DomainProject]:
-        repo = ProjectRepository(self.db)
-        res: List[DomainProject] = []
-        for p in repo.list():
-            res.append(DomainProject(p.id, p.name, p.description))
+        self._before_read()
+        repo = self._project_repo()
+        now = datetime.now()
+        return [DomainProject(p.id, p.name, p.description, now) for p in repo.list()]
+
+    def get_projects_with_task_counts(self) -> List[Tuple[DomainProject, Dict[TaskStatus, int]]]:
+        """Projects with per-status task counts from a single grouped query."""
+        self._before_read()
+        repo = self._project_repo()
+        now = datetime.now()
+        res = []
+        for p, todo, doing, done in repo.list_with_task_counts():
+            counts = {TaskStatus.TODO: todo, TaskStatus.DOING: doing, TaskStatus.DONE: done}
+            res.append((DomainProject(p.id, p.name, p.description, now), counts))
         return res
 
     def get_project_by_id(self, project_id: int) -> Optional[DomainProject]:
-        repo = ProjectRepository(self.db)
+        self._before_read()
+        repo = self._project_repo()
         p = repo.get(project_id)
         if not p:
             return None
         return DomainProject(p.id, p.name, p.description)
 
+    def get_project_by_name(self, name: str) -> Optional[DomainProject]:
+        self._before_read()
+        repo = self._project_repo()
+        p = repo.get_by_name(name)
+        if not p:
+            return None
+        return DomainProject(p.id, p.name, p.description)
+
+    def count_projects(self) -> int:
+        self._before_read()
+        return self._project_repo().count()
+
+    def project_name_exists(self, name: str) -> bool:
+        self._before_read()
+        return self._project_repo().name_exists(name)
+
     def update_project(self, domain_project: DomainProject) -> bool:
-        repo = ProjectRepository(self.db)
+        self._before_read()
+        repo = self._project_repo()
         p = repo.get(domain_project.project_id)
         if not p:
             return False
         p.name = domain_project.name
         p.description = domain_project.description
-        self.db.commit()
+        self._commit()
         return True
 
     def delete_project(self, project_id: int) -> bool:
-        repo = ProjectRepository(self.db)
+        self._before_read()
+        repo = self._project_repo()
         return repo.delete(project_id)
 
     # -------------------
     # Tasks
     # -------------------
+    def _to_domain_task(self, t, created_at: Optional[datetime] = None) -> DomainTask:
+        # robust mapping for status (handle if t.status is Enum, str or not yet set)
+        status_attr = getattr(t, "status", None)
+        status_value = getattr(status_attr, "value", status_attr)
+        status_enum = _STATUS_BY_VALUE.get(status_value, TaskStatus.TODO)
+        return DomainTask(t.id, t.project_id, t.title, t.description, status_enum, t.deadline, created_at)
+
     def create_task(self, domain_task: DomainTask) -> DomainTask:
-        repo = TaskRepository(self.db)
+        repo = self._task_repo()
         t = repo.create(
             project_id=domain_task.project_id,
             title=domain_task.title,
             description=domain_task.description,
             deadline=domain_task.deadline
         )
+        created = self._to_domain_task(t)
+        if self._in_transaction:
+            self._pending.append((t, created))
+        return created
 
-        # robust mapping for status (handle if t.status is Enum or str)
-        status_value = None
-        if hasattr(t, "status"):
-            status_attr = t.status
-            # if it's an enum with .value
-            status_value = getattr(status_attr, "value", None) or str(status_attr)
-
-        # ensure we pass a TaskStatus instance to DomainTask
-        try:
-            status_enum = TaskStatus(status_value) if status_value is not None else TaskStatus.TODO
-        except Exception:
-            # fallback safe
-            status_enum = TaskStatus.TODO
-
-        created_at = getattr(t, "created_at", None) or datetime.now()
-
-        return DomainTask(t.id, t.project_id, t.title, t.description, status_enum, t.deadline)
+    def create_tasks(self, domain_tasks: List[DomainTask]) -> List[DomainTask]:
+        """
+        Create many tasks with multi-row INSERTs (TaskRepository.bulk_create)
+        instead of one INSERT per task. Ids are set on the given objects.
+        Inside transaction() the commit is left to the block.
+        """
+        if not domain_tasks:
+            return []
+        # earlier deferred creates first, so ids keep following call order
+        self._before_read()
+        rows = [
+            {
+                "project_id": t.project_id,
+                "title": t.title,
+                "description": t.description,
+                "deadline": t.deadline,
+                "status": StatusEnum(t.status.value),
+            }
+            for t in domain_tasks
+        ]
+        for t, row in zip(domain_tasks, self._task_repo().bulk_create(rows)):
+            t.task_id = row.id
+        return domain_tasks
 
     def get_tasks_by_project_id(self, project_id: int) -> List[DomainTask]:
-        repo = TaskRepository(self.db)
-        tasks = repo.list_by_project(project_id)
-        result: List[DomainTask] = []
+        self._before_read()
+        repo = self._task_repo()
+        # one timestamp for the whole batch instead of datetime.now() per row
+        now = datetime.now()
+        return [self._to_domain_task(t, now) for t in repo.list_by_project(project_id)]
 
-        for t in tasks:
-            status_attr = getattr(t, "status", None)
-            status_value = getattr(status_attr, "value", None) or (str(status_attr) if status_attr is not None else None)
-            try:
-                status_enum = TaskStatus(status_value) if status_value is not None else TaskStatus.TODO
-            except Exception:
-                status_enum = TaskStatus.TODO
+    def count_tasks(self, project_id: int) -> int:
+        self._before_read()
+        return self._task_repo().count_by_project(project_id)
 
-            created_at = getattr(t, "created_at", None) or datetime.now()
-            result.append(DomainTask(t.id, t.project_id, t.title, t.description, status_enum, t.deadline))
-
-        return result
+    def search_tasks(
+        self, query: str, project_id: Optional[int] = None, limit: int = 20, offset: int = 0
+    ) -> Tuple[List[DomainTask], Optional[int]]:
+        """Ranked full-text search (FTS5 / tsvector, see TaskRepository.search)."""
+        terms = search_terms(query)
+        if not terms:
+            return [], None
+        self._before_read()
+        rows = self._task_repo().search(terms, project_id, limit=limit, offset=offset)
+        now = datetime.now()
+        tasks = [self._to_domain_task(t, now) for t in rows[:limit]]
+        return tasks, (offset + limit if len(rows) > limit else None)
 
     def get_task_by_id(self, task_id: int) -> Optional[DomainTask]:
-        repo = TaskRepository(self.db)
+        self._before_read()
+        repo = self._task_repo()
         t = repo.get(task_id)
         if not t:
             return None
-
-        status_attr = getattr(t, "status", None)
-        status_value = getattr(status_attr, "value", None) or (str(status_attr) if status_attr is not None else None)
-        try:
-            status_enum = TaskStatus(status_value) if status_value is not None else TaskStatus.TODO
-        except Exception:
-            status_enum = TaskStatus.TODO
-
-        created_at = getattr(t, "created_at", None) or datetime.now()
-
-        return DomainTask(t.id, t.project_id, t.title, t.description, status_enum, t.deadline)
+        return self._to_domain_task(t)
 
     def update_task(self, domain_task: DomainTask) -> bool:
-        repo = TaskRepository(self.db)
+        self._before_read()
+        repo = self._task_repo()
         t = repo.get(domain_task.task_id)
         if not t:
             return False
@@ -137,9 +254,10 @@ class DBStorage:
         else:
             t.status = str(domain_task.status)
         t.deadline = domain_task.deadline
-        self.db.commit()
+        self._commit()
         return True
 
     def delete_task(self, task_id: int) -> bool:
-        repo = TaskRepository(self.db)
-        return repo.delete(task_id)
\ No newline at end of file
+        self._before_read()
+        repo = self._task_repo()
+        return repo.delete(task_id)
@@ -1,14 +1,72 @@
+from contextlib import contextmanager
+from todo_cli.storage.search_index import SearchIndex
+
+
 class InMemoryStorage:
     """In-memory storage layer for managing projects and tasks."""
+
+    # an exception inside transaction() undoes nothing (see transaction())
+    ATOMIC_TRANSACTIONS = False
+
     def __init__(self):
         self._projects = {}  # {project_id: Project object}
         self._tasks = {}     # {task_id: Task object}
         self._project_id_counter = 1
         self._task_id_counter = 1
 
+        # Secondary indexes (kept in sync on every write)
+        self._project_names = {}      # {name: project_id}
+        self._tasks_by_project = {}   # {project_id: {task_id: Task object}}
+        self._status_counts = {}      # {project_id: {TaskStatus: count}}
+        # Indexed keys, because callers mutate objects before calling update_*
+        self._project_name_keys = {}  # {project_id: name}
+        self._task_keys = {}          # {task_id: (project_id, status)}
+        self._search = SearchIndex()  # words of title/description -> task ids
+
+    @contextmanager
+    def transaction(self):
+        """
+        Same interface as DBStorage.transaction(), weaker guarantee: writes
+        here are immediate and an exception leaves the ones made before it
+        in place. Callers that report progress check ATOMIC_TRANSACTIONS.
+        """
+        yield self
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    # -------------------
+    # Index helpers
+    # -------------------
+    def _count_status(self, project_id, status, delta):
+        counts = self._status_counts.setdefault(project_id, {})
+        counts[status] = counts.get(status, 0) + delta
+        if not counts[status]:
+            del counts[status]
+
+    def _index_task(self, task):
+        self._task_keys[task.task_id] = (task.project_id, task.status)
+        self._tasks_by_project.setdefault(task.project_id, {})[task.task_id] = task
+        self._count_status(task.project_id, task.status, 1)
+        self._search.add(task.task_id, task.title, task.description)
+
+    def _unindex_task(self, task_id):
+        project_id, status = self._task_keys.pop(task_id)
+        self._tasks_by_project[project_id].pop(task_id, None)
+        self._count_status(project_id, status, -1)
+        self._search.remove(task_id)
+
+    # -------------------
+    # Projects
+    # -------------------
     def create_project(self, project):
         project.project_id = self._project_id_counter
         self._projects[self._project_id_counter] = project
+        self._project_names[project.name] = project.project_id
+        self._project_name_keys[project.project_id] = project.name
         self._project_id_counter += 1
         return project
 
@@ -18,8 +76,32 @@ class InMemoryStorage:
     def get_project_by_id(self, project_id):
         return self._projects.get(project_id)
 
+    def get_project_by_name(self, name):
+        project_id = self._project_names.get(name)
+        if project_id is None:
+            return None
+        return self._projects.get(project_id)
+
+    def count_projects(self):
+        return len(self._projects)
+
+    def project_name_exists(self, name):
+        return name in self._project_names
+
+    def get_projects_with_task_counts(self):
+        """Return [(project, {TaskStatus: count})] from the per-status counters."""
+        return [
+            (project, self.count_tasks_by_status(project_id))
+            for project_id, project in self._projects.items()
+        ]
+
     def update_project(self, project):
         if project.project_id in self._projects:
+            old_name = self._project_name_keys.get(project.project_id)
+            if self._project_names.get(old_name) == project.project_id:
+                del self._project_names[old_name]
+            self._project_names[project.name] = project.project_id
+            self._project_name_keys[project.project_id] = project.name
             self._projects[project.project_id] = project
             return True
         return False
@@ -27,35 +109,83 @@ class InMemoryStorage:
     def delete_project(self, project_id):
         if project_id in self._projects:
             del self._projects[project_id]
-            # Cascade Delete
-            task_ids_to_delete = [task_id for task_id, task in self._tasks.items() if task.project_id == project_id]
-            for task_id in task_ids_to_delete:
+            name = self._project_name_keys.pop(project_id, None)
+            if self._project_names.get(name) == project_id:
+                del self._project_names[name]
+            # Cascade Delete (only this project's tasks are visited)
+            for task_id in self._tasks_by_project.pop(project_id, {}):
                 del self._tasks[task_id]
+                del self._task_keys[task_id]
+                self._search.remove(task_id)
+            self._status_counts.pop(project_id, None)
             return True
         return False
 
+    # -------------------
+    # Tasks
+    # -------------------
     def create_task(self, task):
         task.task_id = self._task_id_counter
         self._tasks[self._task_id_counter] = task
+        self._index_task(task)
         self._task_id_counter += 1
         return task
 
+    def create_tasks(self, tasks):
+        """Create many tasks; ids are assigned in input order."""
+        return [self.create_task(task) for task in tasks]
+
     def get_tasks_by_project_id(self, project_id):
-        return [task for task in self._tasks.values() if task.project_id == project_id]
+        return list(self._tasks_by_project.get(project_id, {}).values())
+
+    def count_tasks_by_status(self, project_id):
+        """Return {TaskStatus: count} for a project without visiting its tasks."""
+        return dict(self._status_counts.get(project_id, {}))
+
+    def count_tasks(self, project_id):
+        """Number of tasks in a project, from the per-status counters."""
+        return sum(self._status_counts.get(project_id, {}).values())
 
     def get_task_by_id(self, task_id):
         return self._tasks.get(task_id)
 
+    def search_tasks(self, query, project_id=None, limit=20, offset=0):
+        """
+        Tasks containing every word of `query`, best match first.
+        Returns (tasks, next_offset); next_offset is None on the last page.
+        """
+        accept = None if project_id is None else self._in_project(project_id)
+        ids = self._search.search(query, limit + 1, offset, accept)
+        tasks = [self.get_task_by_id(task_id) for task_id in ids[:limit]]
+        return tasks, (offset + limit if len(ids) > limit else None)
+
+    def _in_project(self, project_id):
+        """Predicate: does task_id belong to project_id (search filter)."""
+        return self._tasks_by_project.get(project_id, {}).__contains__
+
     def update_task(self, task):
         if task.task_id in self._tasks:
+            project_id, status = self._task_keys[task.task_id]
             self._tasks[task.task_id] = task
+            if project_id == task.project_id:
+                # Keep the task's position in the project index
+                self._tasks_by_project[project_id][task.task_id] = task
+                if status != task.status:
+                    self._count_status(project_id, status, -1)
+                    self._count_status(project_id, task.status, 1)
+                    self._task_keys[task.task_id] = (project_id, task.status)
+                self._search.update(task.task_id, task.title, task.description)
+            else:
+                self._unindex_task(task.task_id)
+                self._index_task(task)
             return True
         return False
 
     def delete_task(self, task_id):
         if task_id in self._tasks:
             del self._tasks[task_id]
+            self._unindex_task(task_id)
             return True
         return False
     def get_all_tasks(self):
-        return list(self._tasks.values())
\ No newline at end of file
+        return list(self._tasks.values())
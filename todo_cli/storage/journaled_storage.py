@@ -0,0 +1,464 @@
+"""
+Durable InMemoryStorage: snapshot + append-only journal.
+
+Files in data_dir:
+    snapshot.bin   column-wise dump of the whole store, written by compact()
+    journal.log    every mutation since that snapshot, one framed record each
+
+Writes are applied in memory and appended to a buffer; a background thread
+writes and fsyncs the buffer every `group_commit_interval` seconds (group
+commit). flush(), the end of a transaction() block and close() force it.
+With group_commit_interval=0 every write is fsynced before it returns.
+
+Startup memory-maps the snapshot and unpickles its columns, then replays
+the journal tail. Snapshot tasks become Task objects only when they are
+first read, so restart cost does not grow with the number of objects.
+The first search indexes their titles and descriptions straight from the
+snapshot columns and loads only the tasks it returns.
+
+Records are encoded before the in-memory state changes, so a write that
+cannot be journaled is not applied either.
+"""
+import mmap
+import os
+import pickle
+import struct
+import threading
+import zlib
+from array import array
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from todo_cli.core.models import Project, Task, TaskStatus
+from todo_cli.storage.in_memory_storage import InMemoryStorage
+
+SNAPSHOT_FILE = "snapshot.bin"
+JOURNAL_FILE = "journal.log"
+
+_SNAPSHOT_MAGIC = b"TODOSNP1"
+_FRAME = struct.Struct("<II")  # payload length, crc32 of payload
+
+_STATUSES = list(TaskStatus)  # status code -> TaskStatus
+_STATUS_CODES = {s: i for i, s in enumerate(_STATUSES)}
+_NAN = float("nan")
+# how a deadline float is stored: a timestamp, or a date's ordinal
+# (the CLI services keep deadlines as dates, the API as datetimes)
+_DATETIME, _DATE = 0, 1
+
+
+def _ts(value):
+    return value.timestamp() if value is not None else _NAN
+
+
+def _dt(ts):
+    return None if ts != ts else datetime.fromtimestamp(ts)  # NaN -> None
+
+
+def _deadline(value):
+    """(float, kind) for a deadline; datetime is checked first, it subclasses date."""
+    if value is None or isinstance(value, datetime):
+        return _ts(value), _DATETIME
+    if isinstance(value, date):
+        return float(value.toordinal()), _DATE
+    raise TypeError(f"unsupported deadline type: {type(value).__name__}")
+
+
+def _from_deadline(value, kind):
+    if kind == _DATE and value == value:
+        return date.fromordinal(int(value))
+    return _dt(value)
+
+
+def _project_row(p):
+    return (p.project_id, p.name, p.description, _ts(p.created_at))
+
+
+def _task_row(t):
+    deadline, kind = _deadline(t.deadline)
+    return (t.task_id, t.project_id, t.title, t.description, _STATUS_CODES[t.status], deadline, _ts(t.created_at), kind)
+
+
+def _task_from_row(row):
+    tid, pid, title, description, status, deadline, created, kind = row
+    return Task(tid, pid, title, description, _STATUSES[status], _from_deadline(deadline, kind), _dt(created))
+
+
+class _ColdTasks:
+    """Snapshot tasks not turned into Task objects yet; columns are indexed by task id."""
+
+    def __init__(self, columns, by_project):
+        (self.project_ids, self.titles, self.descriptions, self.statuses,
+         self.deadlines, self.created, self.deadline_kinds) = columns
+        self.by_project = by_project  # {project_id: array of task ids}
+
+    def has(self, task_id):
+        return 0 < task_id < len(self.project_ids) and self.project_ids[task_id] != 0
+
+    def pop(self, task_id) -> Task:
+        task = _task_from_row((
+            task_id,
+            self.project_ids[task_id],
+            self.titles[task_id],
+            self.descriptions[task_id],
+            self.statuses[task_id],
+            self.deadlines[task_id],
+            self.created[task_id],
+            self.deadline_kinds[task_id],
+        ))
+        self.project_ids[task_id] = 0
+        self.titles[task_id] = self.descriptions[task_id] = None
+        return task
+
+    def drop_project(self, project_id) -> list:
+        """Forget the project's snapshot tasks; returns their ids."""
+        dropped = []
+        for task_id in self.by_project.pop(project_id, ()):
+            if self.project_ids[task_id] == project_id:
+                self.project_ids[task_id] = 0
+                self.titles[task_id] = self.descriptions[task_id] = None
+                dropped.append(task_id)
+        return dropped
+
+
+class JournaledStorage(InMemoryStorage):
+    """InMemoryStorage that survives restarts (see module docstring)."""
+
+    def __init__(self, data_dir: str, group_commit_interval: float = 0.05, compact_every: int = 50_000):
+        super().__init__()
+        self.data_dir = data_dir
+        self.compact_every = compact_every
+        os.makedirs(data_dir, exist_ok=True)
+
+        self._cold = None
+        self._cold_searchable = False  # snapshot tasks are in self._search
+        self._seq = 0                  # sequence number of the last logged mutation
+        self._journal_records = 0      # records in journal.log (compaction trigger)
+        self._buffer = []              # framed records waiting for the next group commit
+        self._buffer_lock = threading.Lock()
+        self._io_lock = threading.Lock()  # keeps journal writes in buffer order
+
+        self._replaying = True
+        self._load_snapshot()
+        self._replay_journal()
+        self._replaying = False
+
+        self._journal = open(self._path(JOURNAL_FILE), "ab")
+        self._closed = False
+        self._stop = threading.Event()
+        self._flusher = None
+        if group_commit_interval:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, args=(group_commit_interval,), daemon=True
+            )
+            self._flusher.start()
+
+    def _path(self, name):
+        return os.path.join(self.data_dir, name)
+
+    # -------------------
+    # Durability
+    # -------------------
+    @contextmanager
+    def transaction(self):
+        """
+        Writes in the block are made durable together with one fsync at the
+        end. As in InMemoryStorage nothing is rolled back: writes made before
+        an exception stay, and are journaled.
+        """
+        try:
+            yield self
+        finally:
+            self.flush()
+
+    def flush(self):
+        """Write buffered journal records and fsync."""
+        with self._io_lock:
+            with self._buffer_lock:
+                if not self._buffer:
+                    return
+                data = b"".join(self._buffer)
+                self._buffer.clear()
+            self._journal.write(data)
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+
+    def _flush_loop(self, interval):
+        while not self._stop.wait(interval):
+            self.flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        self._journal.close()
+
+    def _log(self, op, data):
+        if self._replaying:
+            return
+        self._seq += 1
+        payload = pickle.dumps((self._seq, op, data), pickle.HIGHEST_PROTOCOL)
+        frame = _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._buffer_lock:
+            self._buffer.append(frame)
+        self._journal_records += 1
+        if self._flusher is None:
+            self.flush()
+        if self._journal_records >= self.compact_every:
+            self.compact()
+
+    # -------------------
+    # Snapshot
+    # -------------------
+    def compact(self):
+        """Write a snapshot of the whole store and empty the journal."""
+        self.flush()
+        n = self._task_id_counter
+        project_ids = array("q", bytes(8 * n))
+        titles = [None] * n
+        descriptions = [None] * n
+        statuses = array("b", bytes(n))
+        deadlines = array("d", [_NAN]) * n
+        created = array("d", [_NAN]) * n
+        deadline_kinds = array("b", bytes(n))
+        by_project = {}
+
+        cold = self._cold
+        if cold is not None:
+            m = len(cold.project_ids)
+            project_ids[:m] = cold.project_ids
+            titles[:m] = cold.titles
+            descriptions[:m] = cold.descriptions
+            statuses[:m] = cold.statuses
+            deadlines[:m] = cold.deadlines
+            created[:m] = cold.created
+            deadline_kinds[:m] = cold.deadline_kinds
+            for pid, task_ids in cold.by_project.items():
+                by_project[pid] = array("q", (t for t in task_ids if cold.project_ids[t] == pid))
+
+        for task in self._tasks.values():
+            tid, pid, title, description, status, deadline, created_ts, kind = _task_row(task)
+            project_ids[tid] = pid
+            titles[tid] = title
+            descriptions[tid] = description
+            statuses[tid] = status
+            deadlines[tid] = deadline
+            created[tid] = created_ts
+            deadline_kinds[tid] = kind
+            by_project.setdefault(pid, array("q")).append(tid)
+
+        state = {
+            "seq": self._seq,
+            "project_counter": self._project_id_counter,
+            "task_counter": self._task_id_counter,
+            "projects": [_project_row(p) for p in self._projects.values()],
+            "tasks": (project_ids, titles, descriptions, statuses, deadlines, created, deadline_kinds),
+            "by_project": by_project,
+            "status_counts": {
+                pid: {_STATUS_CODES[s]: c for s, c in counts.items()}
+                for pid, counts in self._status_counts.items()
+            },
+        }
+
+        tmp = self._path(SNAPSHOT_FILE + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_SNAPSHOT_MAGIC)
+            pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._path(SNAPSHOT_FILE))
+
+        # a crash before this truncate only leaves records the snapshot
+        # already covers; replay skips them by sequence number
+        with self._io_lock:
+            self._journal.seek(0)
+            self._journal.truncate()
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        self._journal_records = 0
+
+    def _load_snapshot(self):
+        path = self._path(SNAPSHOT_FILE)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(_SNAPSHOT_MAGIC)] != _SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a todo snapshot")
+            with memoryview(mm) as view, view[len(_SNAPSHOT_MAGIC):] as body:
+                state = pickle.loads(body)
+
+        for row in state["projects"]:
+            self._apply("P+", row)
+        self._project_id_counter = state["project_counter"]
+        self._task_id_counter = state["task_counter"]
+        self._status_counts = {
+            pid: {_STATUSES[code]: c for code, c in counts.items()}
+            for pid, counts in state["status_counts"].items()
+        }
+        self._cold = _ColdTasks(state["tasks"], state["by_project"])
+        self._seq = state["seq"]
+
+    def _replay_journal(self):
+        path = self._path(JOURNAL_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+
+        pos = 0
+        while pos + _FRAME.size <= len(data):
+            length, crc = _FRAME.unpack_from(data, pos)
+            start = pos + _FRAME.size
+            payload = data[start:start + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break  # torn write at the tail
+            seq, op, record = pickle.loads(payload)
+            if seq > self._seq:
+                self._apply(op, record)
+                self._seq = seq
+            self._journal_records += 1
+            pos = start + length
+
+        if pos < len(data):
+            with open(path, "r+b") as f:
+                f.truncate(pos)
+
+    def _apply(self, op, record):
+        if op == "P+":
+            self._project_id_counter = record[0]
+            pid, name, description, created = record
+            self.create_project(Project(pid, name, description, _dt(created)))
+        elif op == "P~":
+            pid, name, description, created = record
+            self.update_project(Project(pid, name, description, _dt(created)))
+        elif op == "P-":
+            self.delete_project(record)
+        elif op == "T+":
+            self._task_id_counter = record[0]
+            self.create_task(_task_from_row(record))
+        elif op == "T~":
+            self._fault(record[0])
+            self.update_task(_task_from_row(record))
+        elif op == "T-":
+            self._fault(record)
+            self.delete_task(record)
+        else:
+            raise ValueError(f"unknown journal record {op!r}")
+
+    # -------------------
+    # Loading snapshot tasks on first use
+    # -------------------
+    def _fault(self, task_id):
+        cold = self._cold
+        if cold is None or task_id in self._tasks or not cold.has(task_id):
+            return
+        task = cold.pop(task_id)
+        # counts already include snapshot tasks, so no _count_status here
+        self._tasks[task_id] = task
+        self._tasks_by_project.setdefault(task.project_id, {})[task_id] = task
+        self._task_keys[task_id] = (task.project_id, task.status)
+        self._search.update(task_id, task.title, task.description)
+
+    def _fault_project(self, project_id):
+        cold = self._cold
+        if cold is None or project_id not in cold.by_project:
+            return
+        for task_id in cold.by_project.pop(project_id):
+            self._fault(task_id)
+        # keep id order, as if the tasks had never left memory
+        tasks = self._tasks_by_project.get(project_id, {})
+        self._tasks_by_project[project_id] = dict(sorted(tasks.items()))
+
+    def _fault_all(self):
+        if self._cold is None:
+            return
+        for project_id in list(self._cold.by_project):
+            self._fault_project(project_id)
+        self._tasks = dict(sorted(self._tasks.items()))
+        self._cold = None
+
+    def _index_cold(self):
+        """Add snapshot tasks to the search index from the columns, without loading them."""
+        cold = self._cold
+        if cold is None or self._cold_searchable:
+            return
+        project_ids, titles, descriptions = cold.project_ids, cold.titles, cold.descriptions
+        for task_id in range(1, len(project_ids)):
+            if project_ids[task_id]:
+                self._search.add(task_id, titles[task_id], descriptions[task_id])
+        self._cold_searchable = True
+
+    # -------------------
+    # Projects
+    # -------------------
+    def create_project(self, project):
+        row = _project_row(project)
+        project = super().create_project(project)
+        self._log("P+", (project.project_id,) + row[1:])
+        return project
+
+    def update_project(self, project):
+        row = _project_row(project)
+        ok = super().update_project(project)
+        if ok:
+            self._log("P~", row)
+        return ok
+
+    def delete_project(self, project_id):
+        ok = super().delete_project(project_id)
+        if ok:
+            if self._cold is not None:
+                for task_id in self._cold.drop_project(project_id):
+                    self._search.remove(task_id)
+            self._log("P-", project_id)
+        return ok
+
+    # -------------------
+    # Tasks
+    # -------------------
+    def create_task(self, task):
+        row = _task_row(task)
+        task = super().create_task(task)
+        self._log("T+", (task.task_id,) + row[1:])
+        return task
+
+    def get_tasks_by_project_id(self, project_id):
+        self._fault_project(project_id)
+        return super().get_tasks_by_project_id(project_id)
+
+    def get_task_by_id(self, task_id):
+        self._fault(task_id)
+        return super().get_task_by_id(task_id)
+
+    def update_task(self, task):
+        row = _task_row(task)
+        self._fault(task.task_id)
+        ok = super().update_task(task)
+        if ok:
+            self._log("T~", row)
+        return ok
+
+    def delete_task(self, task_id):
+        self._fault(task_id)
+        ok = super().delete_task(task_id)
+        if ok:
+            self._log("T-", task_id)
+        return ok
+
+    def get_all_tasks(self):
+        self._fault_all()
+        return super().get_all_tasks()
+
+    def search_tasks(self, query, project_id=None, limit=20, offset=0):
+        self._index_cold()
+        return super().search_tasks(query, project_id, limit, offset)
+
+    def _in_project(self, project_id):
+        hot = super()._in_project(project_id)
+        if self._cold is None:
+            return hot
+        project_ids = self._cold.project_ids
+        return lambda task_id: hot(task_id) or (task_id < len(project_ids) and project_ids[task_id] == project_id)
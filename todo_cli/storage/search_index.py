@@ -0,0 +1,76 @@
+import heapq
+
+from app.search import search_terms, words
+
+TITLE_WEIGHT = 2  # same weighting as the DB's bm25(2.0, 1.0)
+
+
+class SearchIndex:
+    """
+    Inverted index over task titles and descriptions for InMemoryStorage.
+
+    postings: {word: {task_id: weight}}, weight = occurrences in the title
+    times TITLE_WEIGHT plus occurrences in the description. A query walks
+    the shortest posting list of its words and probes the others, so the
+    cost follows the rarest word, not the number of tasks. Results are
+    ordered by summed weight, then id.
+
+    The indexed (title, description) of each task is kept, because callers
+    mutate task objects before update_task() and the old words must be
+    removed.
+    """
+
+    def __init__(self):
+        self._postings = {}  # {word: {task_id: weight}}
+        self._indexed = {}   # {task_id: (title, description)}
+
+    def __len__(self):
+        return len(self._indexed)
+
+    def add(self, task_id, title, description):
+        weights = {}
+        for word in words(title):
+            weights[word] = weights.get(word, 0) + TITLE_WEIGHT
+        for word in words(description):
+            weights[word] = weights.get(word, 0) + 1
+        postings = self._postings
+        for word, weight in weights.items():
+            posting = postings.get(word)
+            if posting is None:
+                posting = postings[word] = {}
+            posting[task_id] = weight
+        self._indexed[task_id] = (title, description)
+
+    def remove(self, task_id):
+        text = self._indexed.pop(task_id, None)
+        if text is None:
+            return
+        for word in set(words(text[0])) | set(words(text[1])):
+            posting = self._postings[word]
+            del posting[task_id]
+            if not posting:
+                del self._postings[word]
+
+    def update(self, task_id, title, description):
+        """Re-index a task whose text may have changed (no-op if it did not)."""
+        if self._indexed.get(task_id) == (title, description):
+            return
+        self.remove(task_id)
+        self.add(task_id, title, description)
+
+    def search(self, query: str, n: int, offset: int = 0, accept=None) -> list:
+        """
+        Ids of the best `n` matches after skipping `offset`, for tasks that
+        contain every word of the query. `accept(task_id)` filters (e.g. by project).
+        """
+        terms = set(search_terms(query))
+        if not terms:
+            return []
+        postings = sorted((self._postings.get(w, {}) for w in terms), key=len)
+        first, rest = postings[0], postings[1:]
+        scored = (
+            (-sum(p[task_id] for p in postings), task_id)
+            for task_id in first
+            if all(task_id in p for p in rest) and (accept is None or accept(task_id))
+        )
+        return [task_id for _, task_id in heapq.nsmallest(offset + n, scored)[offset:]]
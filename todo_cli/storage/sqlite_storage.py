@@ -0,0 +1,163 @@
+"""
+Embedded SQLite storage for single-machine CLI use (STORAGE=sqlite).
+
+DBStorage on its own engine, tuned for one local process:
+
+    journal_mode=WAL      readers never block the writer, commits append to the WAL
+    synchronous=NORMAL    fsync at checkpoints, not at every commit (a power cut
+                          can lose the last commits, never corrupt the file)
+    mmap_size             reads go through a memory map instead of read() calls
+    cached_statements     sqlite3 keeps this many prepared statements per connection;
+                          SQLAlchemy's compiled cache keeps the SQL text stable
+
+Writes outside transaction() are group-committed: each one runs in a
+SAVEPOINT (so a failed write does not discard the others) and the
+transaction is committed every `batch_size` writes, on flush() and on
+close(). Other processes see a write once it is committed.
+
+The schema is created from the ORM models (create_all), including the
+full-text search table; the file is not managed by Alembic.
+"""
+import os
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from todo_cli.storage.db_storage import DBStorage
+
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_CACHED_STATEMENTS = 256
+
+
+def create_sqlite_engine(path: str, mmap_size: int = DEFAULT_MMAP_SIZE):
+    """Engine for a local SQLite file with the pragmas above, schema created."""
+    import app.models  # noqa: F401  (registers the mappers)
+    from app.db.base import Base
+
+    engine = create_engine(
+        f"sqlite:///{path}",
+        future=True,
+        connect_args={"cached_statements": DEFAULT_CACHED_STATEMENTS},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _configure(dbapi_connection, _record):
+        # SQLAlchemy emits BEGIN itself (below), otherwise pysqlite
+        # defers it and SAVEPOINT does not work
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in (
+            "journal_mode=WAL",
+            "synchronous=NORMAL",
+            f"mmap_size={int(mmap_size)}",
+            "temp_store=MEMORY",
+            "foreign_keys=ON",
+        ):
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+class SQLiteStorage(DBStorage):
+    """DBStorage over a tuned local SQLite file (see module docstring)."""
+
+    def __init__(self, path: str, batch_size: int = 1000, mmap_size: int = DEFAULT_MMAP_SIZE):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.engine = create_sqlite_engine(path, mmap_size)
+        super().__init__(
+            session=sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False, future=True)()
+        )
+        # DBStorage's unit-of-work mode is always on: repositories never commit
+        self._in_transaction = True
+        self._explicit = False   # inside a transaction() block
+        self._uncommitted = 0    # writes since the last commit
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            super().close()
+            self.engine.dispose()
+
+    # -------------------
+    # Group commit
+    # -------------------
+    @contextmanager
+    def transaction(self):
+        """Writes in the block are committed together at the end, or not at all."""
+        if self._explicit:
+            yield self
+            return
+
+        self.flush()  # a rollback below must not take earlier writes with it
+        self._explicit = True
+        try:
+            yield self
+            DBStorage.flush(self)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        finally:
+            self._explicit = False
+            self._pending.clear()
+
+    def flush(self):
+        """Send pending writes; outside transaction() also commit them."""
+        super().flush()
+        if not self._explicit and self._uncommitted:
+            self.db.commit()
+            self._uncommitted = 0
+
+    def _before_read(self):
+        if self._pending:
+            DBStorage.flush(self)
+
+    def _write(self, method, *args):
+        if self._explicit:
+            return method(*args)
+        try:
+            with self.db.begin_nested():
+                result = method(*args)
+                DBStorage.flush(self)  # ids onto the returned objects, errors surface here
+        except Exception:
+            self._pending.clear()
+            raise
+        self._uncommitted += 1
+        if self._uncommitted >= self.batch_size:
+            self.flush()
+        return result
+
+    # -------------------
+    # Writes
+    # -------------------
+    def create_project(self, domain_project):
+        return self._write(super().create_project, domain_project)
+
+    def update_project(self, domain_project):
+        return self._write(super().update_project, domain_project)
+
+    def delete_project(self, project_id):
+        return self._write(super().delete_project, project_id)
+
+    def create_task(self, domain_task):
+        return self._write(super().create_task, domain_task)
+
+    def create_tasks(self, domain_tasks):
+        return self._write(super().create_tasks, domain_tasks)
+
+    def update_task(self, domain_task):
+        return self._write(super().update_task, domain_task)
+
+    def delete_task(self, task_id):
+        return self._write(super().delete_task, task_id)
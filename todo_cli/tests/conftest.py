@@ -1,6 +1,8 @@
 import pytest
 import os
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker
 from app.db.base import Base
 from app.models.project import Project
@@ -13,9 +15,12 @@ TEST_DB_URL = "sqlite:///:memory:"
 
 @pytest.fixture(scope="function")
 def db_session():
-    engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False})
+    # StaticPool: one shared connection, so the in-memory DB survives commits
+    # and is visible from TestClient's worker threads
+    engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
     Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine, autoflush=False, future=True)
+    # same session options as app.db.session.SessionLocal
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, future=True)
     session = Session()
     try:
         yield session
@@ -23,10 +28,85 @@ def db_session():
         session.close()
         Base.metadata.drop_all(engine)
 
+@pytest.fixture(params=["memory", "db", "sqlite", "journal"])
+def storage(request, db_session, tmp_path):
+    """Each CLI storage backend in turn, empty, closed afterwards."""
+    from todo_cli.storage.db_storage import DBStorage
+    from todo_cli.storage.in_memory_storage import InMemoryStorage
+    from todo_cli.storage.journaled_storage import JournaledStorage
+    from todo_cli.storage.sqlite_storage import SQLiteStorage
+
+    if request.param == "memory":
+        storage = InMemoryStorage()
+    elif request.param == "db":
+        storage = DBStorage(session=db_session)
+    elif request.param == "sqlite":
+        storage = SQLiteStorage(str(tmp_path / "todo.db"))
+    else:
+        storage = JournaledStorage(str(tmp_path / "journal"), group_commit_interval=0)
+    yield storage
+    storage.close()
+
 @pytest.fixture
 def project_repo(db_session):
     return ProjectRepository(db_session)
 
 @pytest.fixture
 def task_repo(db_session):
-    return TaskRepository(db_session)
\ No newline at end of file
+    return TaskRepository(db_session)
+
+@pytest.fixture(autouse=True)
+def _fresh_response_cache():
+    # cache/versions are process-wide, but every test starts with a new database
+    from app.cache.response_cache import response_cache
+    from app.cache.versions import versions
+
+    response_cache.clear()
+    versions.reset()
+    yield
+
+
+@pytest.fixture
+def client(db_session):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.db.deps import get_db
+
+    def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def count_queries(db_session):
+    """
+    Query-count harness:
+
+        with count_queries() as statements:
+            client.put(...)
+        assert len(statements) == 2
+
+    The identity map is cleared first so each block starts like a new request.
+    """
+    engine = db_session.get_bind()
+
+    @contextmanager
+    def _count():
+        statements = []
+        db_session.expunge_all()
+
+        def listener(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+    return _count
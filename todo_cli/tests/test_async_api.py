@@ -0,0 +1,73 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+from app.db.base import Base
+from app.db.deps import get_async_db
+from app.main import create_app
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    Session = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with Session() as db:
+            yield db
+
+    app = create_app("async")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(app) as client:
+        yield client
+
+
+def test_async_crud_and_listing(async_client):
+    resp = async_client.post("/projects/", json={"name": "Async", "description": "d"})
+    assert resp.status_code == 201
+    pid = resp.json()["id"]
+
+    ids = [
+        async_client.post(f"/projects/{pid}/tasks/", json={"title": f"T{i}"}).json()["id"]
+        for i in range(3)
+    ]
+    resp = async_client.patch(f"/projects/{pid}/tasks/{ids[0]}/status", params={"status_value": "done"})
+    assert resp.json()["status"] == "done"
+    assert resp.json()["closed_at"] is not None
+
+    resp = async_client.post(f"/projects/{pid}/tasks/bulk", json=[{"title": "B0"}, {"title": "B1"}])
+    assert resp.status_code == 201
+    bulk_ids = [t["id"] for t in resp.json()["items"]]
+    assert bulk_ids == sorted(bulk_ids) and bulk_ids[0] > ids[-1]
+
+    page = async_client.get(f"/projects/{pid}/tasks/", params={"limit": 2}).json()
+    assert [t["id"] for t in page["items"]] == ids[:2]
+    assert page["next_cursor"] == ids[1]
+
+    projects = async_client.get("/projects/").json()["items"]
+    assert (projects[0]["todo_count"], projects[0]["done_count"]) == (4, 1)
+
+    resp = async_client.put(f"/projects/{pid}/tasks/{ids[1]}", json={"title": "Renamed"}, headers={"If-Match": '"1"'})
+    assert (resp.json()["title"], resp.headers["etag"]) == ("Renamed", '"2"')
+    resp = async_client.put(f"/projects/{pid}/tasks/{ids[1]}", json={"title": "Stale"}, headers={"If-Match": '"1"'})
+    assert resp.status_code == 409
+    assert async_client.post("/projects/", json={"name": "Async"}).status_code == 400
+
+    hits = async_client.get(f"/projects/{pid}/tasks/search", params={"q": "renamed"}).json()["items"]
+    assert [t["id"] for t in hits] == [ids[1]]
+
+    export = async_client.get(f"/projects/{pid}/tasks/export").text.splitlines()
+    assert len(export) == 5
+    assert async_client.get("/tasks/export", params={"format": "csv"}).text.count("\n") == 6
+
+    assert async_client.delete(f"/projects/{pid}").status_code == 204
+    assert async_client.get(f"/projects/{pid}/tasks/{ids[1]}").status_code == 404
@@ -0,0 +1,159 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.commands.autoclose_overdue import autoclose_overdue_tasks
+from app.commands.autoclose_scheduler import DeadlineScheduler
+from app.events import DeadlineNotifier, deadline_notifier
+from app.db.base import Base
+from app.models.task import StatusEnum, Task
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+from app.services.task_service import TaskService
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_autoclose_closes_only_overdue_open_tasks(db_session, project_repo, task_repo, bulk):
+    p = project_repo.create(name="AC", description="d")
+    past = datetime.utcnow() - timedelta(days=1)
+    future = datetime.utcnow() + timedelta(days=1)
+    overdue = [task_repo.create(project_id=p.id, title=f"O{i}", deadline=past) for i in range(5)]
+    upcoming = task_repo.create(project_id=p.id, title="F", deadline=future)
+    no_deadline = task_repo.create(project_id=p.id, title="N")
+    already_done = task_repo.create(project_id=p.id, title="D", deadline=past)
+    task_repo.change_status(already_done.id, StatusEnum.DONE)
+    done_at = task_repo.get(already_done.id).closed_at
+
+    closed = autoclose_overdue_tasks(db_session, bulk=bulk, batch_size=2)
+    assert closed == 5
+
+    db_session.expire_all()
+    for t in overdue:
+        t = task_repo.get(t.id)
+        assert t.status == StatusEnum.DONE
+        assert t.closed_at is not None
+    assert task_repo.get(upcoming.id).status == StatusEnum.TODO
+    assert task_repo.get(no_deadline.id).status == StatusEnum.TODO
+    assert task_repo.get(already_done.id).closed_at == done_at
+
+    assert autoclose_overdue_tasks(db_session, bulk=bulk) == 0
+
+
+def test_bulk_autoclose_refreshes_loaded_tasks(db_session, project_repo, task_repo):
+    p = project_repo.create(name="AC", description="d")
+    task = task_repo.create(project_id=p.id, title="O", deadline=datetime.utcnow() - timedelta(days=1))
+    assert task.version == 1
+
+    assert autoclose_overdue_tasks(db_session, bulk=True) == 1
+    # no manual expire: the loaded object must not keep the pre-UPDATE version
+    assert (task.status, task.version) == (StatusEnum.DONE, 2)
+    TaskService(task_repo, project_repo).update_task(task.id, {"title": "renamed"})
+    assert task_repo.get(task.id).version == 3
+
+
+def test_next_open_deadline_skips_done_and_missing(project_repo, task_repo):
+    p = project_repo.create(name="ND", description="d")
+    assert task_repo.next_open_deadline() is None
+    soon = datetime(2030, 1, 1)
+    done = task_repo.create(project_id=p.id, title="D", deadline=datetime(2029, 1, 1))
+    task_repo.change_status(done.id, StatusEnum.DONE)
+    task_repo.create(project_id=p.id, title="N")
+    task_repo.create(project_id=p.id, title="L", deadline=datetime(2031, 1, 1))
+    doing = task_repo.create(project_id=p.id, title="S", deadline=soon)
+    task_repo.change_status(doing.id, StatusEnum.DOING)
+    assert task_repo.next_open_deadline() == soon
+
+
+def test_scheduler_sleeps_until_next_deadline(db_session, project_repo, task_repo):
+    now = datetime.utcnow()
+    p = project_repo.create(name="S", description="d")
+    task_repo.create(project_id=p.id, title="Due", deadline=now - timedelta(minutes=1))
+    later = task_repo.create(project_id=p.id, title="Later", deadline=now + timedelta(hours=1))
+    scheduler = DeadlineScheduler(lambda: db_session, max_sleep=7200, clock=lambda: now)
+
+    assert scheduler.run_once() == 1
+    assert scheduler.next_deadline == later.deadline
+    assert scheduler.sleep_seconds() == 3600
+    scheduler.max_sleep = 60
+    assert scheduler.sleep_seconds() == 60
+    scheduler.next_deadline = None
+    assert scheduler.sleep_seconds() == 60
+
+
+def test_scheduler_is_woken_by_new_earlier_deadline(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'sched.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    db = Session()
+    notifier = DeadlineNotifier()
+    scheduler = DeadlineScheduler(Session, max_sleep=30, notifier=notifier).start()
+    try:
+        p = ProjectRepository(db).create(name="W", description="d")
+        task = TaskRepository(db).create(
+            project_id=p.id, title="T", deadline=datetime.utcnow() + timedelta(milliseconds=200)
+        )
+        # the scheduler is in a 30s sleep (nothing was due); this cuts it short
+        notifier.notify(task.deadline)
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            db.expire_all()
+            if db.get(Task, task.id).status == StatusEnum.DONE:
+                break
+            time.sleep(0.05)
+        assert db.get(Task, task.id).status == StatusEnum.DONE
+    finally:
+        scheduler.stop(timeout=5)
+        db.close()
+        engine.dispose()
+
+
+def test_task_service_notifies_open_deadlines(project_repo, task_repo, monkeypatch):
+    seen = []
+    monkeypatch.setattr(deadline_notifier, "_listeners", [seen.append])
+    service = TaskService(task_repo, project_repo)
+    p = project_repo.create(name="N", description="d")
+    when = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+    t = service.add_task(p.id, "T", deadline=when)
+    service.add_task(p.id, "No deadline")
+    service.change_status(t.id, "done")
+    service.update_task(t.id, {"status": "todo"})
+    assert seen == [datetime(2030, 1, 1), datetime(2030, 1, 1)]
+
+
+def test_bulk_mixed_offsets_and_failing_listener(client, project_repo, monkeypatch):
+    seen = []
+
+    def broken(deadline):
+        raise RuntimeError("listener bug")
+
+    monkeypatch.setattr(deadline_notifier, "_listeners", [broken, seen.append])
+    p = project_repo.create(name="B", description="d")
+    payload = [
+        {"title": "aware", "deadline": "2030-01-01T02:00:00+03:00"},
+        {"title": "naive", "deadline": "2030-01-01T00:00:00"},
+    ]
+    # the rows are committed before the notifier runs: its errors must not turn into a 500
+    resp = client.post(f"/projects/{p.id}/tasks/bulk", json=payload)
+    assert resp.status_code == 201
+    assert [t["deadline"] for t in resp.json()["items"]] == ["2029-12-31T23:00:00", "2030-01-01T00:00:00"]
+    assert seen == [datetime(2029, 12, 31, 23)]
+
+
+def test_in_app_scheduler_runs_for_the_app_lifespan(db_session, monkeypatch):
+    from fastapi.testclient import TestClient
+    from app.db import session as db_session_module
+    from app.main import create_app
+
+    monkeypatch.setenv("AUTOCLOSE_IN_APP", "true")
+    monkeypatch.setattr(db_session_module, "get_sessionmaker", lambda: lambda: db_session)
+    monkeypatch.setattr("app.cli.console.report", lambda closed, next_deadline: None)
+
+    def running():
+        return any(t.name == "autoclose-scheduler" for t in threading.enumerate())
+
+    with TestClient(create_app("sync")):
+        assert running()
+    assert not running()
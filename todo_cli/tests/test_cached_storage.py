@@ -0,0 +1,75 @@
+import pytest
+
+from todo_cli.core.models import Project, Task, TaskStatus
+from todo_cli.storage.cached_storage import CachedStorage
+from todo_cli.storage.db_storage import DBStorage
+from todo_cli.storage.in_memory_storage import InMemoryStorage
+
+
+@pytest.fixture
+def backend(storage):
+    return storage
+
+
+def test_reads_are_cached_and_writes_invalidate(backend):
+    storage = CachedStorage(backend)
+    p = storage.create_project(Project(0, "P", "d"))
+    t = storage.create_task(Task(0, p.project_id, "T", "d"))
+
+    for _ in range(3):
+        assert storage.get_project_by_id(p.project_id).name == "P"
+        assert storage.get_task_by_id(t.task_id).title == "T"
+        assert [x.title for x in storage.get_tasks_by_project_id(p.project_id)] == ["T"]
+    assert storage.stats()["misses"] == 3
+    assert storage.stats()["hits"] == 6
+
+    # callers mutate what they get back; that must not leak into the cache
+    task = storage.get_task_by_id(t.task_id)
+    task.title = "unsaved"
+    assert storage.get_task_by_id(t.task_id).title == "T"
+
+    task.status = TaskStatus.DONE
+    storage.update_task(task)
+    assert storage.get_task_by_id(t.task_id).status == TaskStatus.DONE
+    assert storage.get_tasks_by_project_id(p.project_id)[0].status == TaskStatus.DONE
+
+    storage.create_task(Task(0, p.project_id, "T2", "d"))
+    assert len(storage.get_tasks_by_project_id(p.project_id)) == 2
+
+    storage.delete_task(t.task_id)
+    assert storage.get_task_by_id(t.task_id) is None
+    assert [x.title for x in storage.get_tasks_by_project_id(p.project_id)] == ["T2"]
+
+    project = storage.get_project_by_id(p.project_id)
+    project.name = "Q"
+    storage.update_project(project)
+    assert storage.get_project_by_id(p.project_id).name == "Q"
+
+    storage.delete_project(p.project_id)
+    assert storage.get_project_by_id(p.project_id) is None
+    assert storage.get_tasks_by_project_id(p.project_id) == []
+
+
+def test_cache_skips_the_database(db_session, count_queries):
+    storage = CachedStorage(DBStorage(session=db_session))
+    p = storage.create_project(Project(0, "P", "d"))
+    storage.get_project_by_id(p.project_id)
+
+    with count_queries() as statements:
+        for _ in range(10):
+            storage.get_project_by_id(p.project_id)
+    assert statements == []
+
+
+def test_entries_expire_and_lru_is_bounded():
+    storage = CachedStorage(InMemoryStorage(), maxsize=2, ttl=-1)
+    p = storage.create_project(Project(0, "P", "d"))
+    storage.get_project_by_id(p.project_id)
+    storage.get_project_by_id(p.project_id)
+    assert storage.stats()["hits"] == 0
+
+    storage = CachedStorage(InMemoryStorage(), maxsize=2)
+    ids = [storage.create_project(Project(0, f"P{i}", "d")).project_id for i in range(3)]
+    for pid in ids:
+        storage.get_project_by_id(pid)
+    assert storage.stats()["size"] == 2
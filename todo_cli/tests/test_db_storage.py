@@ -26,4 +26,92 @@ def test_db_storage_create_project_and_task():
     t = DomainTask(0, created.project_id, "TTitle", "desc")
     created_task = storage.create_task(t)
     assert created_task.task_id > 0
-    assert created_task.project_id == created.project_id
\ No newline at end of file
+    assert created_task.project_id == created.project_id
+
+    done = storage.create_task(DomainTask(0, created.project_id, "Done", "desc"))
+    done.status = TaskStatus.DONE
+    storage.update_task(done)
+    empty = storage.create_project(DomainProject(0, "Empty", "sd"))
+
+    counts = {p.project_id: c for p, c in storage.get_projects_with_task_counts()}
+    assert counts[created.project_id] == {TaskStatus.TODO: 1, TaskStatus.DOING: 0, TaskStatus.DONE: 1}
+    assert counts[empty.project_id] == {TaskStatus.TODO: 0, TaskStatus.DOING: 0, TaskStatus.DONE: 0}
+
+
+def _storage_with_counters():
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from app.db.base import Base
+
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False, future=True)()
+
+    stats = {"inserts": 0, "commits": 0}
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO tasks"):
+            stats["inserts"] += 1
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", lambda conn: stats.__setitem__("commits", stats["commits"] + 1))
+    return DBStorage(session=session), stats
+
+
+def test_db_storage_transaction_batches_writes():
+    storage, stats = _storage_with_counters()
+    project = storage.create_project(DomainProject(0, "Batch", "d"))
+    stats.update(inserts=0, commits=0)
+
+    with storage.transaction():
+        created = [storage.create_task(DomainTask(0, project.project_id, f"T{i}", "d")) for i in range(200)]
+        # nothing is sent until the block ends
+        assert stats["inserts"] == 0
+        assert stats["commits"] == 0
+
+    assert stats["commits"] == 1
+    assert stats["inserts"] == 200
+    ids = [t.task_id for t in created]
+    assert all(ids) and len(set(ids)) == 200
+    assert len(storage.get_tasks_by_project_id(project.project_id)) == 200
+
+
+def test_db_storage_transaction_reads_own_writes_and_rolls_back():
+    storage, stats = _storage_with_counters()
+    project = storage.create_project(DomainProject(0, "RB", "d"))
+
+    try:
+        with storage.transaction():
+            t = storage.create_task(DomainTask(0, project.project_id, "T", "d"))
+            # reads flush first, so the pending task is visible and has an id
+            assert [x.title for x in storage.get_tasks_by_project_id(project.project_id)] == ["T"]
+            assert t.task_id
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+
+    assert storage.get_tasks_by_project_id(project.project_id) == []
+
+
+def test_service_limit_checks_use_count_queries(db_session, count_queries):
+    from todo_cli.core.services import ProjectService, TaskService
+
+    storage = DBStorage(session=db_session)
+    project = ProjectService(storage).create_project("Counted", "d")
+    tasks = TaskService(storage)
+    for i in range(3):
+        tasks.create_task(project.project_id, f"T{i}", "d")
+    assert (storage.count_projects(), storage.count_tasks(project.project_id)) == (1, 3)
+    assert storage.project_name_exists("Counted") and not storage.project_name_exists("Other")
+
+    with count_queries() as statements:
+        tasks.create_task(project.project_id, "T3", "d")
+    # project lookup, COUNT, INSERT: no task rows are fetched
+    assert [s.split()[0] for s in statements] == ["SELECT", "SELECT", "INSERT"]
+    assert "count(" in statements[1].lower()
+
+    with count_queries() as statements:
+        ProjectService(storage).create_project("Second", "d")
+    assert [s.split()[0] for s in statements] == ["SELECT", "SELECT", "INSERT"]
+    assert "count(" in statements[0].lower() and "exists" in statements[1].lower()
@@ -0,0 +1,141 @@
+import io
+import json
+
+import pytest
+
+from todo_cli.config.settings import get_settings
+from todo_cli.core.dates import DateParser
+from todo_cli.core.importer import TaskImporter, read_records
+from todo_cli.core.models import Project, TaskStatus
+from todo_cli.storage.journaled_storage import JournaledStorage
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "max_projects", 2)
+    monkeypatch.setattr(settings, "max_tasks_per_project", 3)
+    return settings
+
+
+def _csv(*rows):
+    return io.StringIO("project,title,description,deadline,status\n" + "".join(r + "\n" for r in rows))
+
+
+def test_import_csv_in_batches(storage, limits):
+    storage.create_project(Project(0, "Home", "d"))
+    batches = []
+    importer = TaskImporter(storage, batch_size=2, progress=lambda s: batches.append(s.imported))
+    stats = importer.run(
+        read_records(
+            _csv(
+                "Home,A,d,2099-01-02,",
+                "Home,B,d,,doing",
+                "Home,C,d,03/04/2099,done",
+                "Home,D,d,,",       # over max_tasks_per_project
+                "Home,,d,,",        # empty title
+                "Work,E,d,,",       # unknown project
+            ),
+            "csv",
+        )
+    )
+
+    assert (stats.read, stats.imported, stats.failed) == (6, 3, 3)
+    assert [line for line, _ in stats.errors] == [5, 6, 7]
+    assert "Maximum number of tasks" in stats.errors[0][1]
+    assert batches == [2, 3]
+
+    home = storage.get_project_by_name("Home")
+    tasks = sorted(storage.get_tasks_by_project_id(home.project_id), key=lambda t: t.task_id)
+    assert [t.title for t in tasks] == ["A", "B", "C"]
+    assert [t.status for t in tasks] == [TaskStatus.TODO, TaskStatus.DOING, TaskStatus.DONE]
+    assert str(tasks[0].deadline)[:10] == "2099-01-02"
+    assert str(tasks[2].deadline)[:10] == "2099-04-03"
+    assert all(t.task_id > 0 for t in tasks)
+
+
+def test_failed_batch_is_reported_as_stored(storage):
+    storage.create_project(Project(0, "Home", "d"))
+    create_tasks, calls = storage.create_tasks, []
+
+    def fail_on_second_batch(tasks):
+        calls.append(len(tasks))
+        if len(calls) == 1:
+            return create_tasks(tasks)
+        create_tasks(tasks[:1])
+        raise RuntimeError("disk full")
+
+    storage.create_tasks = fail_on_second_batch
+    importer = TaskImporter(storage, batch_size=2)
+    with pytest.raises(RuntimeError):
+        importer.run(read_records(_csv("Home,A,d,,", "Home,B,d,,", "Home,C,d,,", "Home,D,d,,"), "csv"))
+
+    stored = storage.get_tasks_by_project_id(storage.get_project_by_name("Home").project_id)
+    # DB backends roll the batch back; memory and journal keep what was written
+    assert len(stored) == (2 if storage.ATOMIC_TRANSACTIONS else 3)
+    assert importer.stats.imported == len(stored)
+
+
+def test_journaled_import_keeps_date_deadlines(tmp_path, limits):
+    storage = JournaledStorage(str(tmp_path), group_commit_interval=0)
+    stats = TaskImporter(storage, create_projects=True).run(
+        read_records(_csv("Home,A,d,2099-01-02,", "Home,B,d,,"), "csv")
+    )
+    assert (stats.imported, stats.failed) == (2, 0)
+    storage.close()
+
+    reopened = JournaledStorage(str(tmp_path))
+    try:
+        home = reopened.get_project_by_name("Home")
+        tasks = reopened.get_tasks_by_project_id(home.project_id)
+        assert [(t.title, str(t.deadline)) for t in tasks] == [("A", "2099-01-02"), ("B", "None")]
+    finally:
+        reopened.close()
+
+
+def test_import_ndjson_creates_projects_within_limits(storage, limits):
+    lines = [json.dumps({"project": f"P{i}", "title": f"T{i}", "description": "d"}) for i in range(3)]
+    lines.insert(1, "not json")
+    importer = TaskImporter(storage, create_projects=True)
+    stats = importer.run(read_records(io.StringIO("\n".join(lines)), "ndjson"))
+
+    assert (stats.imported, stats.failed) == (2, 2)
+    assert stats.errors[0][1].startswith("Invalid JSON")
+    assert "maximum number of projects" in stats.errors[1][1]
+    assert sorted(p.name for p in storage.get_all_projects()) == ["P0", "P1"]
+
+
+def test_date_parser_remembers_format():
+    parser = DateParser()
+    assert str(parser.parse("05/01/2030")) == "2030-01-05"
+    assert parser.format == "%d/%m/%Y"
+    assert str(parser.parse("2030-01-05")) == "2030-01-05"
+    assert parser.format == "%Y-%m-%d"
+    with pytest.raises(ValueError):
+        parser.parse("2030.01.05")
+
+
+@pytest.mark.parametrize("text", ["2030-W01-2", "2030-003-1"])
+def test_date_parser_fast_path_accepts_only_what_strptime_does(text):
+    parser = DateParser()
+    assert str(parser.parse("2030-01-05")) == "2030-01-05"
+    with pytest.raises(ValueError):
+        parser.parse(text)
+
+
+def test_cli_import_and_search_need_persistent_storage(tmp_path, monkeypatch, capsys):
+    from todo_cli.cli.main import main
+
+    path = tmp_path / "tasks.csv"
+    path.write_text("project,title,description\nHome,Milk,corner shop\n", encoding="utf-8")
+
+    monkeypatch.setenv("STORAGE", "memory")
+    assert main(["import", str(path), "--create-projects"]) == 2
+    assert main(["search", "milk"]) == 2
+    assert "needs persistent storage" in capsys.readouterr().err
+
+    monkeypatch.setenv("STORAGE", "sqlite")
+    monkeypatch.setenv("TODO_SQLITE_PATH", str(tmp_path / "todo.db"))
+    assert main(["import", str(path), "--create-projects"]) == 0
+    assert main(["search", "milk"]) == 0
+    assert "Milk" in capsys.readouterr().out
@@ -0,0 +1,80 @@
+from todo_cli.storage.in_memory_storage import InMemoryStorage
+from todo_cli.core.models import Project, Task, TaskStatus
+
+
+def test_project_name_index_follows_update_and_delete():
+    storage = InMemoryStorage()
+    p = storage.create_project(Project(0, "Alpha", "d"))
+    assert storage.get_project_by_name("Alpha") is p
+
+    # services mutate the object before calling update_project
+    p.name = "Beta"
+    assert storage.update_project(p)
+    assert storage.get_project_by_name("Alpha") is None
+    assert storage.get_project_by_name("Beta") is p
+
+    storage.delete_project(p.project_id)
+    assert storage.get_project_by_name("Beta") is None
+
+
+def test_tasks_by_project_and_status_counts():
+    storage = InMemoryStorage()
+    p1 = storage.create_project(Project(0, "P1", "d"))
+    p2 = storage.create_project(Project(0, "P2", "d"))
+    t1 = storage.create_task(Task(0, p1.project_id, "T1", "d"))
+    t2 = storage.create_task(Task(0, p1.project_id, "T2", "d"))
+    storage.create_task(Task(0, p2.project_id, "T3", "d"))
+
+    assert storage.get_tasks_by_project_id(p1.project_id) == [t1, t2]
+    assert storage.count_tasks_by_status(p1.project_id) == {TaskStatus.TODO: 2}
+
+    t1.status = TaskStatus.DONE
+    storage.update_task(t1)
+    assert storage.count_tasks_by_status(p1.project_id) == {TaskStatus.TODO: 1, TaskStatus.DONE: 1}
+    assert storage.get_tasks_by_project_id(p1.project_id) == [t1, t2]
+
+    storage.delete_task(t2.task_id)
+    assert storage.count_tasks_by_status(p1.project_id) == {TaskStatus.DONE: 1}
+
+
+def test_count_and_exists_primitives():
+    storage = InMemoryStorage()
+    assert (storage.count_projects(), storage.project_name_exists("P")) == (0, False)
+    p = storage.create_project(Project(0, "P", "d"))
+    t = storage.create_task(Task(0, p.project_id, "T1", "d"))
+    storage.create_task(Task(0, p.project_id, "T2", "d"))
+    assert (storage.count_projects(), storage.project_name_exists("P")) == (1, True)
+    assert storage.count_tasks(p.project_id) == 2
+
+    t.status = TaskStatus.DONE
+    storage.update_task(t)
+    storage.delete_task(t.task_id)
+    assert storage.count_tasks(p.project_id) == 1
+    assert storage.count_tasks(999) == 0
+
+    storage.delete_project(p.project_id)
+    assert (storage.count_projects(), storage.project_name_exists("P")) == (0, False)
+
+
+def test_delete_project_cascades_only_its_tasks():
+    storage = InMemoryStorage()
+    p1 = storage.create_project(Project(0, "P1", "d"))
+    p2 = storage.create_project(Project(0, "P2", "d"))
+    t1 = storage.create_task(Task(0, p1.project_id, "T1", "d"))
+    t2 = storage.create_task(Task(0, p2.project_id, "T2", "d"))
+
+    assert storage.delete_project(p1.project_id)
+    assert storage.get_task_by_id(t1.task_id) is None
+    assert storage.get_tasks_by_project_id(p1.project_id) == []
+    assert storage.count_tasks_by_status(p1.project_id) == {}
+    assert storage.get_all_tasks() == [t2]
+
+
+def test_models_are_slotted_and_accept_created_at():
+    from datetime import datetime
+
+    stamp = datetime(2030, 1, 1)
+    t = Task(1, 1, "T", "d", created_at=stamp)
+    assert not hasattr(t, "__dict__")
+    assert t.created_at is stamp
+    assert Project(1, "P", "d").created_at is not None
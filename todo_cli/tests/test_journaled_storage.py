@@ -0,0 +1,123 @@
+import os
+import shutil
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from todo_cli.core.models import Project, Task, TaskStatus
+from todo_cli.core.services import TaskService
+from todo_cli.storage.journaled_storage import JOURNAL_FILE, JournaledStorage
+
+
+def _fill(storage):
+    p1 = storage.create_project(Project(0, "P1", "d"))
+    p2 = storage.create_project(Project(0, "P2", "d"))
+    tasks = [storage.create_task(Task(0, p1.project_id, f"T{i}", "d", deadline=datetime(2030, 1, 1))) for i in range(5)]
+    storage.create_task(Task(0, p2.project_id, "other", "d"))
+
+    tasks[1].status = TaskStatus.DONE
+    storage.update_task(tasks[1])
+    storage.delete_task(tasks[3].task_id)
+    p1.name = "Renamed"
+    storage.update_project(p1)
+    return p1, p2
+
+
+def _check(storage, p1, p2):
+    assert storage.get_project_by_name("Renamed").project_id == p1.project_id
+    titles = [t.title for t in storage.get_tasks_by_project_id(p1.project_id)]
+    assert titles == ["T0", "T1", "T2", "T4"]
+    assert storage.count_tasks_by_status(p1.project_id) == {TaskStatus.TODO: 3, TaskStatus.DONE: 1}
+    t1 = storage.get_task_by_id(2)
+    assert (t1.status, t1.deadline) == (TaskStatus.DONE, datetime(2030, 1, 1))
+    assert [t.title for t in storage.get_all_tasks()] == ["T0", "T1", "T2", "T4", "other"]
+    # ids keep counting from where the old process stopped
+    assert storage.create_task(Task(0, p2.project_id, "new", "d")).task_id == 7
+
+
+def test_journal_replay_restores_state(tmp_path):
+    storage = JournaledStorage(str(tmp_path), group_commit_interval=0)
+    p1, p2 = _fill(storage)
+    storage.close()
+
+    reopened = JournaledStorage(str(tmp_path))
+    _check(reopened, p1, p2)
+    reopened.close()
+
+
+def test_snapshot_then_journal_tail(tmp_path):
+    storage = JournaledStorage(str(tmp_path))
+    p1, p2 = _fill(storage)
+    storage.compact()
+    assert os.path.getsize(tmp_path / JOURNAL_FILE) == 0
+    storage.delete_project(p2.project_id)
+    storage.close()
+
+    reopened = JournaledStorage(str(tmp_path))
+    # snapshot tasks are loaded lazily but behave the same
+    assert reopened.count_tasks_by_status(p1.project_id) == {TaskStatus.TODO: 3, TaskStatus.DONE: 1}
+    assert reopened.count_tasks(p1.project_id) == 4
+    assert reopened.count_projects() == 1
+    assert reopened.get_project_by_id(p2.project_id) is None
+    assert reopened.get_task_by_id(6) is None
+    t = reopened.get_task_by_id(1)
+    t.status = TaskStatus.DOING
+    reopened.update_task(t)
+    assert reopened.get_tasks_by_project_id(p1.project_id)[0] is t
+    assert reopened.count_tasks_by_status(p1.project_id) == {TaskStatus.TODO: 2, TaskStatus.DOING: 1, TaskStatus.DONE: 1}
+    reopened.compact()
+    reopened.close()
+
+    again = JournaledStorage(str(tmp_path))
+    assert [x.status for x in again.get_tasks_by_project_id(p1.project_id)][:2] == [TaskStatus.DOING, TaskStatus.DONE]
+    again.close()
+
+
+def test_torn_tail_and_stale_records_are_ignored(tmp_path):
+    storage = JournaledStorage(str(tmp_path), group_commit_interval=0)
+    p1, p2 = _fill(storage)
+    journal = tmp_path / JOURNAL_FILE
+    shutil.copy(journal, tmp_path / "old.log")
+    storage.compact()
+    storage.close()
+
+    # crash between writing the snapshot and truncating the journal,
+    # plus half a record from an interrupted write
+    with open(journal, "wb") as f:
+        f.write((tmp_path / "old.log").read_bytes() + b"\x10\x00\x00\x00garbage")
+
+    reopened = JournaledStorage(str(tmp_path))
+    assert not journal.read_bytes().endswith(b"garbage")
+    _check(reopened, p1, p2)
+    reopened.close()
+
+
+def test_date_deadlines_survive_journal_and_snapshot(tmp_path):
+    # the CLI services store deadlines as dates, not datetimes
+    deadline = date.today() + timedelta(days=3)
+    storage = JournaledStorage(str(tmp_path), group_commit_interval=0)
+    p = storage.create_project(Project(0, "P", "d"))
+    service = TaskService(storage)
+    first = service.create_task(p.project_id, "T", "d", deadline)
+    storage.close()
+
+    reopened = JournaledStorage(str(tmp_path), group_commit_interval=0)
+    assert reopened.get_task_by_id(first.task_id).deadline == deadline
+    TaskService(reopened).create_task(p.project_id, "U", "d", deadline)
+    reopened.compact()
+    reopened.close()
+
+    again = JournaledStorage(str(tmp_path))
+    deadlines = [t.deadline for t in again.get_tasks_by_project_id(p.project_id)]
+    assert deadlines == [deadline, deadline] and type(deadlines[0]) is date
+    again.close()
+
+
+def test_unjournalable_write_is_not_applied(tmp_path):
+    storage = JournaledStorage(str(tmp_path), group_commit_interval=0)
+    p = storage.create_project(Project(0, "P", "d"))
+    with pytest.raises(TypeError):
+        storage.create_task(Task(0, p.project_id, "T", "d", deadline="2030-01-01"))
+    assert storage.get_tasks_by_project_id(p.project_id) == []
+    assert storage.count_tasks(p.project_id) == 0
+    storage.close()
@@ -0,0 +1,67 @@
+import pytest
+from app.db.query_metrics import QueryTimer
+from app.metrics.middleware import (
+    http_request_db_queries,
+    http_request_duration_seconds,
+    http_requests_total,
+    reset_http_metrics,
+)
+from app.metrics.prometheus import Histogram, render
+
+
+@pytest.fixture
+def timed_client(client, db_session):
+    # the app's engine has the timer attached; the test engine needs its own
+    engine = db_session.get_bind()
+    timer = QueryTimer().attach(engine)
+    reset_http_metrics()
+    try:
+        yield client
+    finally:
+        timer.detach(engine)
+        reset_http_metrics()
+
+
+def test_histogram_buckets_are_cumulative():
+    h = Histogram("h", "help", ("route",), buckets=(1, 5))
+    for v in (0.5, 1, 3, 7):
+        h.observe(v, "/a")
+    text = render([h])
+    assert 'h_bucket{route="/a",le="1"} 2' in text
+    assert 'h_bucket{route="/a",le="5"} 3' in text
+    assert 'h_bucket{route="/a",le="+Inf"} 4' in text
+    assert 'h_sum{route="/a"} 11.5' in text
+    assert 'h_count{route="/a"} 4' in text
+
+
+def test_requests_are_recorded_per_route_template(timed_client):
+    pid = timed_client.post("/projects/", json={"name": "P", "description": "d"}).json()["id"]
+    timed_client.get(f"/projects/{pid}")
+    timed_client.get("/projects/999")
+    timed_client.get("/no-such-path")
+
+    assert http_requests_total.value("POST", "/projects/", "201") == 1
+    assert http_requests_total.value("GET", "/projects/{project_id}", "200") == 1
+    assert http_requests_total.value("GET", "/projects/{project_id}", "404") == 1
+    assert http_requests_total.value("GET", "<unmatched>", "404") == 1
+    assert http_request_duration_seconds.count("GET", "/projects/{project_id}") == 2
+    # GET project by id: one SELECT each
+    assert http_request_db_queries.sum("GET", "/projects/{project_id}") == 2
+
+
+def test_server_timing_header(timed_client):
+    resp = timed_client.post("/projects/", json={"name": "P", "description": "d"})
+    timing = resp.headers["server-timing"]
+    assert timing.startswith("app;dur=")
+    assert 'desc="1 queries"' in timing  # INSERT; names are unique by constraint
+
+
+def test_prometheus_endpoint(timed_client):
+    timed_client.get("/projects/")
+    resp = timed_client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = resp.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_requests_total{method="GET",route="/projects/",status="200"} 1' in body
+    assert 'db_pool_checkouts{engine="sync"}' in body
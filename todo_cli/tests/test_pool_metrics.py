@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from app.db.pool_metrics import PoolMetrics, TimedQueuePool
+from app.db.session import pool_options
+
+
+def test_pool_options_from_env(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "true")
+    opts = pool_options("postgresql://u:p@localhost/db")
+    assert opts["poolclass"] is TimedQueuePool
+    assert (opts["pool_size"], opts["max_overflow"], opts["pool_pre_ping"]) == (3, 0, True)
+    assert pool_options("sqlite:///:memory:") == {}
+
+
+def test_pool_metrics_counts_checkouts_and_timeouts(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "1")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "0.05")
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, **pool_options(url))
+    metrics = PoolMetrics().attach(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+        assert metrics.snapshot()["checked_out"] == 1
+
+    engine.dispose()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    stats = metrics.snapshot()
+    assert stats["checkouts"] == stats["checkins"] == 2
+    assert stats["connects"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["wait_seconds_max"] >= 0.05
+    assert stats["peak_checked_out"] == 1
+    assert stats["pool_size"] == 1
+
+
+def test_pool_metrics_endpoint(client):
+    body = client.get("/metrics/pool").json()
+    assert "checkouts" in body["sync"]
@@ -0,0 +1,24 @@
+from app.models.task import StatusEnum
+
+
+def test_list_projects_with_counts_in_one_query(client, count_queries, project_repo, task_repo):
+    projects = [project_repo.create(name=f"P{i}", description="") for i in range(3)]
+    for i in range(3):
+        task_repo.create(project_id=projects[0].id, title=f"T{i}")
+    done = task_repo.create(project_id=projects[1].id, title="D")
+    task_repo.change_status(done.id, StatusEnum.DONE)
+
+    with count_queries() as statements:
+        body = client.get("/projects/", params={"limit": 2}).json()
+
+    assert len(statements) == 1
+    assert [(p["name"], p["todo_count"], p["doing_count"], p["done_count"]) for p in body["items"]] == [
+        ("P0", 3, 0, 0),
+        ("P1", 0, 0, 1),
+    ]
+    assert body["next_cursor"] == projects[1].id
+
+    body = client.get("/projects/", params={"limit": 2, "after": body["next_cursor"]}).json()
+    assert [p["name"] for p in body["items"]] == ["P2"]
+    assert body["items"][0]["todo_count"] == 0
+    assert body["next_cursor"] is None
@@ -0,0 +1,67 @@
+import pytest
+
+
+@pytest.fixture
+def seeded(project_repo, task_repo):
+    p = project_repo.create(name="P", description="d")
+    t = task_repo.create(project_id=p.id, title="T")
+    return p, t
+
+
+def _kinds(statements):
+    return [s.split()[0] for s in statements]
+
+
+def test_task_endpoint_query_counts(client, count_queries, seeded):
+    p, t = seeded
+    base = f"/projects/{p.id}/tasks"
+
+    with count_queries() as statements:
+        assert client.post(f"{base}/", json={"title": "N"}).status_code == 201
+    assert _kinds(statements) == ["SELECT", "INSERT"]
+
+    with count_queries() as statements:
+        assert client.get(f"{base}/{t.id}").status_code == 200
+    assert _kinds(statements) == ["SELECT"]
+
+    with count_queries() as statements:
+        resp = client.put(f"{base}/{t.id}", json={"title": "X", "status": "doing"})
+    assert resp.json()["title"] == "X"
+    assert _kinds(statements) == ["SELECT", "UPDATE"]
+
+    with count_queries() as statements:
+        resp = client.patch(f"{base}/{t.id}/status", params={"status_value": "done"})
+    assert resp.json()["status"] == "done"
+    assert _kinds(statements) == ["SELECT", "UPDATE"]
+
+    with count_queries() as statements:
+        assert client.delete(f"{base}/{t.id}").status_code == 204
+    assert _kinds(statements) == ["SELECT", "DELETE"]
+
+
+def test_project_endpoint_query_counts(client, count_queries, seeded):
+    p, _ = seeded
+
+    with count_queries() as statements:
+        assert client.get(f"/projects/{p.id}").status_code == 200
+    assert _kinds(statements) == ["SELECT"]
+
+    # get + UPDATE ... WHERE version = ?; name uniqueness is left to the unique index
+    with count_queries() as statements:
+        assert client.put(f"/projects/{p.id}", json={"name": "Q"}).json()["name"] == "Q"
+    assert _kinds(statements) == ["SELECT", "UPDATE"]
+
+    with count_queries() as statements:
+        assert client.get(f"/projects/{p.id}").status_code == 200
+    assert _kinds(statements) == ["SELECT"]
+
+
+def test_bulk_create_is_one_insert_on_sqlite(client, count_queries, seeded):
+    p, _ = seeded
+    payload = [{"title": f"T{i}"} for i in range(100)]
+
+    with count_queries() as statements:
+        items = client.post(f"/projects/{p.id}/tasks/bulk", json=payload).json()["items"]
+    # unordered RETURNING keeps the multi-row INSERT; rows are put back in order by id
+    assert _kinds(statements).count("INSERT") == 1
+    assert [t["title"] for t in items] == [f"T{i}" for i in range(100)]
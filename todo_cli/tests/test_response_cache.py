@@ -0,0 +1,73 @@
+from sqlalchemy import text
+
+from app.cache.response_cache import response_cache
+from app.cache.versions import versions
+
+
+def test_conditional_get_and_cache(client, count_queries, project_repo, task_repo, monkeypatch):
+    monkeypatch.setattr(response_cache, "ttl", 30)  # opt-in (RESPONSE_CACHE_TTL)
+    p = client.post("/projects/", json={"name": "Dash", "description": "d"}).json()
+    task = client.post(f"/projects/{p['id']}/tasks/", json={"title": "T"}).json()
+    url = f"/projects/{p['id']}/tasks/"
+
+    first = client.get(url)
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    # unchanged poll: served from the cache, no SQL at all
+    with count_queries() as statements:
+        again = client.get(url)
+        not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert statements == []
+    assert again.content == first.content
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    # any write through the services moves the version
+    client.patch(f"{url}{task['id']}/status", params={"status_value": "done"})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["items"][0]["status"] == "done"
+
+    # project list depends on every project's counts
+    listing = client.get("/projects/")
+    assert listing.json()["items"][0]["done_count"] == 1
+    client.post(url, json={"title": "T2"})
+    assert client.get("/projects/").json()["items"][0]["todo_count"] == 1
+
+
+def test_version_bumps_are_per_project(client):
+    a = client.post("/projects/", json={"name": "A"}).json()["id"]
+    b = client.post("/projects/", json={"name": "B"}).json()["id"]
+    etag_a = client.get(f"/projects/{a}").headers["etag"]
+
+    before = versions.project(a)
+    client.put(f"/projects/{b}", json={"description": "changed"})
+    assert versions.project(a) == before
+    assert client.get(f"/projects/{a}", headers={"If-None-Match": etag_a}).status_code == 304
+
+    client.put(f"/projects/{a}", json={"description": "changed"})
+    resp = client.get(f"/projects/{a}", headers={"If-None-Match": etag_a})
+    assert resp.status_code == 200
+    assert resp.json()["description"] == "changed"
+
+
+def test_cache_is_off_by_default_so_external_writes_show(client, db_session, count_queries):
+    assert response_cache.ttl == 0
+    p = client.post("/projects/", json={"name": "X"}).json()
+    url = f"/projects/{p['id']}/tasks/"
+    client.post(url, json={"title": "T"})
+    etag = client.get(url).headers["etag"]
+
+    # unchanged: still a 304, but computed from the database
+    with count_queries() as statements:
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert statements != []
+
+    # a write from another process (autoclose console, CLI) is visible at once
+    db_session.execute(text("UPDATE tasks SET status = 'DONE'"))
+    db_session.commit()
+    resp = client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 200 and resp.json()["items"][0]["status"] == "done"
@@ -0,0 +1,114 @@
+import pytest
+
+from todo_cli.core.models import Project, Task
+from todo_cli.core.services import TaskService
+from todo_cli.storage.in_memory_storage import InMemoryStorage
+from todo_cli.storage.journaled_storage import JournaledStorage
+
+
+def _titles(result):
+    tasks, _ = result
+    return [t.title for t in tasks]
+
+
+def test_search_ranks_filters_and_pages(storage):
+    home = storage.create_project(Project(0, "Home", "d"))
+    work = storage.create_project(Project(0, "Work", "d"))
+    for project, title, description in [
+        (home, "Buy milk", "from the corner shop"),
+        (home, "Shop list", "eggs and bread"),
+        (home, "Clean kitchen", "before the milk delivery"),
+        (work, "Milk shop call", "ask for a discount"),
+    ]:
+        storage.create_task(Task(0, project.project_id, title, description))
+
+    # every word must appear; title hits rank above description hits
+    assert _titles(storage.search_tasks("MILK shop")) == ["Milk shop call", "Buy milk"]
+    assert _titles(storage.search_tasks("milk", home.project_id)) == ["Buy milk", "Clean kitchen"]
+    assert storage.search_tasks("nothing here") == ([], None)
+
+    first = storage.search_tasks("milk", limit=2)
+    assert _titles(first) == ["Buy milk", "Milk shop call"] and first[1] == 2
+    rest = storage.search_tasks("milk", limit=2, offset=first[1])
+    assert _titles(rest) == ["Clean kitchen"] and rest[1] is None
+
+
+def test_search_follows_updates_and_deletes(storage):
+    project = storage.create_project(Project(0, "P", "d"))
+    task = storage.create_task(Task(0, project.project_id, "Paint fence", "white"))
+    other = storage.create_task(Task(0, project.project_id, "Fix fence", "gate"))
+    storage.flush()
+
+    # services edit the object in place, then call update_task
+    task.title, task.description = "Paint door", "blue"
+    storage.update_task(task)
+    assert _titles(storage.search_tasks("fence")) == ["Fix fence"]
+    assert _titles(storage.search_tasks("blue door")) == ["Paint door"]
+
+    storage.delete_task(other.task_id)
+    assert _titles(storage.search_tasks("fence")) == []
+    storage.delete_project(project.project_id)
+    assert _titles(storage.search_tasks("door")) == []
+
+
+def test_service_validates_search():
+    storage = InMemoryStorage()
+    service = TaskService(storage)
+    with pytest.raises(ValueError):
+        service.search_tasks("  ?! ")
+    with pytest.raises(ValueError):
+        service.search_tasks("milk", project_id=42)
+
+
+def test_journaled_search_covers_snapshot_tasks(tmp_path):
+    storage = JournaledStorage(str(tmp_path), group_commit_interval=0)
+    p = storage.create_project(Project(0, "P", "d"))
+    q = storage.create_project(Project(0, "Q", "d"))
+    passport = storage.create_task(Task(0, p.project_id, "Renew passport", "before June"))
+    storage.create_task(Task(0, p.project_id, "Book flights", "after the passport"))
+    storage.create_task(Task(0, q.project_id, "Passport photos", "two copies"))
+    storage.create_task(Task(0, q.project_id, "Water plants", "weekly"))
+    storage.compact()
+    storage.close()
+
+    reopened = JournaledStorage(str(tmp_path), group_commit_interval=0)
+    try:
+        # indexed from the snapshot columns; only the returned tasks are loaded
+        assert _titles(reopened.search_tasks("passport", limit=1)) == ["Renew passport"]
+        assert list(reopened._tasks) == [1]
+        assert _titles(reopened.search_tasks("passport", q.project_id)) == ["Passport photos"]
+        assert sorted(reopened._tasks) == [1, 3]
+
+        task = reopened.get_task_by_id(passport.task_id)
+        task.title = "Renew visa"
+        reopened.update_task(task)
+        assert _titles(reopened.search_tasks("passport")) == ["Passport photos", "Book flights"]
+        reopened.delete_project(q.project_id)
+        assert _titles(reopened.search_tasks("passport")) == ["Book flights"]
+        assert _titles(reopened.search_tasks("water")) == []
+    finally:
+        reopened.close()
+
+
+def test_search_api(client, project_repo, task_repo):
+    p = project_repo.create(name="S", description="d")
+    other = project_repo.create(name="O", description="d")
+    a = task_repo.create(project_id=p.id, title="Write report", description="quarterly numbers")
+    task_repo.create(project_id=p.id, title="Read mail", description="report inbox")
+    task_repo.create(project_id=other.id, title="Report bug", description="")
+
+    body = client.get(f"/projects/{p.id}/tasks/search", params={"q": "report", "limit": 1}).json()
+    assert [t["id"] for t in body["items"]] == [a.id]
+    assert body["next_offset"] == 1
+    body = client.get("/tasks/search", params={"q": "report"}).json()
+    assert len(body["items"]) == 3 and body["next_offset"] is None
+
+    # a title edit is searchable at once (FTS triggers); status changes leave it alone
+    resp = client.put(f"/projects/{p.id}/tasks/{a.id}", json={"title": "Write summary"})
+    assert resp.status_code == 200
+    client.patch(f"/projects/{p.id}/tasks/{a.id}/status", params={"status_value": "done"})
+    hits = client.get("/tasks/search", params={"q": "summary"}).json()["items"]
+    assert [(t["id"], t["status"]) for t in hits] == [(a.id, "done")]
+
+    assert client.get("/tasks/search", params={"q": "--"}).status_code == 400
+    assert client.get("/projects/999/tasks/search", params={"q": "x"}).status_code == 404
@@ -0,0 +1,108 @@
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from todo_cli.core.models import Project, Task, TaskStatus
+from todo_cli.core.services import ProjectService, TaskService
+from todo_cli.storage.sqlite_storage import SQLiteStorage
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "todo.db")
+
+
+def _committed_titles(path):
+    """What another process would see."""
+    conn = sqlite3.connect(path)
+    try:
+        return [row[0] for row in conn.execute("SELECT title FROM tasks ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def test_pragmas(path):
+    storage = SQLiteStorage(path, mmap_size=1 << 20)
+    try:
+        with storage.engine.connect() as conn:
+            pragma = lambda name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("mmap_size") == 1 << 20
+            assert pragma("foreign_keys") == 1
+    finally:
+        storage.close()
+
+
+def test_group_commit_and_reopen(path):
+    storage = SQLiteStorage(path, batch_size=3)
+    p = storage.create_project(Project(0, "P", "d"))
+    a = storage.create_task(Task(0, p.project_id, "A", "d"))
+    assert a.task_id > 0  # ids are assigned at once, as with InMemoryStorage
+    assert _committed_titles(path) == []
+
+    storage.create_task(Task(0, p.project_id, "B", "d"))  # third write: commit
+    assert _committed_titles(path) == ["A", "B"]
+
+    a.status = TaskStatus.DONE
+    storage.update_task(a)
+    assert storage.get_task_by_id(a.task_id).status == TaskStatus.DONE  # own writes are visible
+    storage.flush()
+    storage.create_task(Task(0, p.project_id, "C", "d"))
+    storage.close()
+
+    reopened = SQLiteStorage(path)
+    try:
+        tasks = reopened.get_tasks_by_project_id(p.project_id)
+        assert [(t.title, t.status) for t in tasks] == [
+            ("A", TaskStatus.DONE), ("B", TaskStatus.TODO), ("C", TaskStatus.TODO)
+        ]
+    finally:
+        reopened.close()
+
+
+def test_failed_write_keeps_the_batch(path):
+    storage = SQLiteStorage(path)
+    try:
+        p = storage.create_project(Project(0, "P", "d"))
+        storage.create_task(Task(0, p.project_id, "A", "d"))
+        with pytest.raises(IntegrityError):
+            storage.create_project(Project(0, "P", "duplicate name"))
+        storage.create_task(Task(0, p.project_id, "B", "d"))
+        storage.flush()
+        assert _committed_titles(path) == ["A", "B"]
+    finally:
+        storage.close()
+
+
+def test_transaction_rolls_back_only_the_block(path):
+    storage = SQLiteStorage(path)
+    try:
+        p = storage.create_project(Project(0, "P", "d"))
+        storage.create_task(Task(0, p.project_id, "kept", "d"))
+        with pytest.raises(RuntimeError):
+            with storage.transaction():
+                storage.create_tasks([Task(0, p.project_id, "dropped", "d")])
+                raise RuntimeError
+        assert _committed_titles(path) == ["kept"]
+
+        with storage.transaction():
+            storage.create_tasks([Task(0, p.project_id, "X", "d"), Task(0, p.project_id, "Y", "d")])
+        assert _committed_titles(path) == ["kept", "X", "Y"]
+    finally:
+        storage.close()
+
+
+def test_services_on_sqlite(path):
+    storage = SQLiteStorage(path)
+    try:
+        projects, tasks = ProjectService(storage), TaskService(storage)
+        p = projects.create_project("Home", "d")
+        t = tasks.create_task(p.project_id, "Buy milk", "corner shop")
+        tasks.change_task_status(t.task_id, TaskStatus.DONE)
+        assert storage.get_task_by_id(t.task_id).status == TaskStatus.DONE
+        projects.delete_project(p.project_id)
+        assert storage.count_projects() == 0 and storage.get_task_by_id(t.task_id) is None
+    finally:
+        storage.close()
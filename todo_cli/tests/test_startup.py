@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# cumulative import time of todo_cli.cli.main, in microseconds (about 30ms
+# locally; SQLAlchemy and the ORM models alone used to add ~400ms)
+CLI_IMPORT_BUDGET_US = 150_000
+HEAVY_MODULES = ("sqlalchemy", "app.db", "app.models", "todo_cli.storage.db_storage")
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", STORAGE="memory")
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _import_times(module: str) -> dict:
+    """{module: cumulative import time in us} from `python -X importtime`."""
+    stderr = _run(f"import {module}", "-X", "importtime").stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_memory_cli_startup_skips_db_stack_and_fits_budget():
+    times = _import_times("todo_cli.cli.main")
+    heavy = sorted(m for m in times if m.startswith(HEAVY_MODULES))
+    assert heavy == []
+    assert times["todo_cli.cli.main"] < CLI_IMPORT_BUDGET_US
+
+
+def test_importing_the_api_does_not_create_an_engine():
+    _run(
+        "import app.main\n"
+        "from app.db import session\n"
+        "assert session._engine is None and session._SessionLocal is None\n"
+        "assert session.engine is session.get_engine()\n"
+        "assert session.SessionLocal is session.get_sessionmaker()\n",
+    )
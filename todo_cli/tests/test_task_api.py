@@ -0,0 +1,196 @@
+import csv
+import io
+import json
+from datetime import datetime
+from app.schemas.task_schema import TaskOut
+
+
+def _make_project_with_tasks(project_repo, task_repo, n):
+    p = project_repo.create(name="API", description="d")
+    tasks = [
+        task_repo.create(project_id=p.id, title=f"T{i}", deadline=datetime(2030, 1, i + 1))
+        for i in range(n)
+    ]
+    return p, tasks
+
+
+def test_list_tasks_keyset_pagination(client, project_repo, task_repo):
+    p, tasks = _make_project_with_tasks(project_repo, task_repo, 5)
+
+    seen, after = [], None
+    while True:
+        params = {"limit": 2}
+        if after is not None:
+            params["after"] = after
+        body = client.get(f"/projects/{p.id}/tasks/", params=params).json()
+        seen += [t["id"] for t in body["items"]]
+        after = body["next_cursor"]
+        if after is None:
+            break
+
+    assert seen == [t.id for t in tasks]
+
+
+def test_list_tasks_filters(client, project_repo, task_repo):
+    p, tasks = _make_project_with_tasks(project_repo, task_repo, 5)
+    client.patch(f"/projects/{p.id}/tasks/{tasks[0].id}/status", params={"status_value": "done"})
+
+    body = client.get(f"/projects/{p.id}/tasks/", params={"status": "done"}).json()
+    assert [t["id"] for t in body["items"]] == [tasks[0].id]
+    assert body["next_cursor"] is None
+
+    body = client.get(
+        f"/projects/{p.id}/tasks/",
+        params={"deadline_from": "2030-01-02T00:00:00", "deadline_to": "2030-01-03T00:00:00"},
+    ).json()
+    assert [t["id"] for t in body["items"]] == [tasks[1].id, tasks[2].id]
+
+    resp = client.get(f"/projects/{p.id}/tasks/", params={"status": "nope"})
+    assert resp.status_code == 422
+    resp = client.get(
+        f"/projects/{p.id}/tasks/",
+        params={"deadline_from": "2030-02-01T00:00:00", "deadline_to": "2030-01-01T00:00:00"},
+    )
+    assert resp.status_code == 400
+
+    # one bound with an offset, one without: both are compared as naive UTC
+    body = client.get(
+        f"/projects/{p.id}/tasks/",
+        params={"deadline_from": "2030-01-02T03:00:00+03:00", "deadline_to": "2030-01-02T00:00:00"},
+    ).json()
+    assert [t["id"] for t in body["items"]] == [tasks[1].id]
+    resp = client.get(
+        f"/projects/{p.id}/tasks/",
+        params={"deadline_from": "2030-01-02T00:00:00Z", "deadline_to": "2030-01-01T00:00:00"},
+    )
+    assert resp.status_code == 400
+
+
+def test_bulk_create_tasks(client, project_repo):
+    p = project_repo.create(name="Bulk", description="d")
+    payload = [{"title": f" T{i} ", "deadline": "2030-01-01T00:00:00"} for i in range(250)]
+
+    resp = client.post(f"/projects/{p.id}/tasks/bulk", json=payload)
+    assert resp.status_code == 201
+    items = resp.json()["items"]
+    assert [t["title"] for t in items] == [f"T{i}" for i in range(250)]
+    assert [t["id"] for t in items] == sorted(t["id"] for t in items)
+    assert {t["status"] for t in items} == {"todo"}
+
+    body = client.get(f"/projects/{p.id}/tasks/", params={"limit": 500}).json()
+    assert [t["id"] for t in body["items"]] == [t["id"] for t in items]
+
+
+def test_bulk_create_tasks_is_all_or_nothing(client, project_repo):
+    p = project_repo.create(name="Bulk", description="d")
+
+    resp = client.post(f"/projects/{p.id}/tasks/bulk", json=[{"title": "ok"}, {"title": "   "}, {"title": "ok2"}])
+    assert resp.status_code == 400
+    assert resp.json()["detail"]["errors"] == [{"index": 1, "detail": "Task title must be 1..100 characters"}]
+    assert client.get(f"/projects/{p.id}/tasks/").json()["items"] == []
+
+    resp = client.post("/projects/9999/tasks/bulk", json=[{"title": "ok"}])
+    assert resp.status_code == 400
+
+
+def test_list_fast_path_matches_model_serialization(client, project_repo, task_repo):
+    from app.models.task import StatusEnum
+    from app.schemas.project_schema import ProjectPage, ProjectSummaryOut
+    from app.schemas.task_schema import TaskPage
+
+    p, tasks = _make_project_with_tasks(project_repo, task_repo, 3)
+    task_repo.change_status(tasks[0].id, StatusEnum.DONE)
+
+    expected = TaskPage(items=task_repo.list_by_project(p.id), next_cursor=None)
+    assert client.get(f"/projects/{p.id}/tasks/").content == expected.model_dump_json().encode()
+
+    rows = project_repo.list_with_task_counts()
+    expected = ProjectPage(items=[ProjectSummaryOut.from_row(r) for r in rows], next_cursor=None)
+    assert client.get("/projects/").content == expected.model_dump_json().encode()
+
+
+def test_export_ndjson_and_csv(client, project_repo, task_repo):
+    p, tasks = _make_project_with_tasks(project_repo, task_repo, 3)
+    other = project_repo.create(name="Other", description="d")
+    extra = task_repo.create(project_id=other.id, title="X")
+
+    resp = client.get(f"/projects/{p.id}/tasks/export")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines == [TaskOut.model_validate(t).model_dump(mode="json") for t in tasks]
+
+    resp = client.get("/tasks/export", params={"format": "csv"})
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert 'filename="tasks.csv"' in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [int(r["id"]) for r in rows] == [t.id for t in tasks] + [extra.id]
+    assert rows[0]["status"] == "todo"
+    assert rows[0]["deadline"] == "2030-01-01T00:00:00"
+    assert rows[-1]["deadline"] == ""
+
+
+def test_export_unknown_project_and_format(client):
+    assert client.get("/projects/999/tasks/export").status_code == 404
+    assert client.get("/tasks/export", params={"format": "xml"}).status_code == 422
+
+
+def test_if_match_optimistic_concurrency(client, project_repo):
+    p = project_repo.create(name="OCC", description="d")
+    base = f"/projects/{p.id}/tasks"
+    created = client.post(f"{base}/", json={"title": "T"})
+    url = f"{base}/{created.json()['id']}"
+    assert created.headers["etag"] == '"1"'
+    assert client.get(url).headers["etag"] == '"1"'
+
+    resp = client.put(url, json={"title": "first"}, headers={"If-Match": '"1"'})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] == '"2"'
+
+    # a second editor still holding version 1 gets 409 instead of overwriting
+    stale = client.put(url, json={"title": "second"}, headers={"If-Match": '"1"'})
+    assert stale.status_code == 409
+    stale = client.patch(f"{url}/status", params={"status_value": "done"}, headers={"If-Match": '"1"'})
+    assert stale.status_code == 409
+    assert client.put(url, json={"title": "x"}, headers={"If-Match": 'W/"2"'}).status_code == 400
+
+    current = client.get(url)
+    assert (current.json()["title"], current.headers["etag"]) == ("first", '"2"')
+    resp = client.patch(f"{url}/status", params={"status_value": "done"}, headers={"If-Match": current.headers["etag"]})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] == '"3"'
+    # no If-Match: unconditional, as before
+    assert client.put(url, json={"title": "last"}).headers["etag"] == '"4"'
+
+
+def test_if_match_after_write_from_another_process(client, db_session, project_repo):
+    from sqlalchemy import text
+
+    p = project_repo.create(name="EXT", description="d")
+    url = f"/projects/{p.id}/tasks/{client.post(f'/projects/{p.id}/tasks/', json={'title': 'T'}).json()['id']}"
+    assert client.get(url).headers["etag"] == '"1"'
+
+    # e.g. the autoclose console or the CLI: bumps the row, not this process's cache versions
+    db_session.execute(text("UPDATE tasks SET title = 'external', version = version + 1"))
+    db_session.commit()
+    db_session.expire_all()  # each request normally gets a fresh session
+
+    current = client.get(url, headers={"If-None-Match": '"1"'})
+    assert (current.status_code, current.headers["etag"]) == (200, '"2"')
+    assert current.json()["title"] == "external"
+    resp = client.put(url, json={"title": "mine"}, headers={"If-Match": current.headers["etag"]})
+    assert (resp.status_code, resp.headers["etag"]) == (200, '"3"')
+
+
+def test_project_name_uniqueness_from_constraint(client):
+    a = client.post("/projects/", json={"name": "A"})
+    assert a.headers["etag"] == '"1"'
+    b = client.post("/projects/", json={"name": "B"}).json()
+    assert client.post("/projects/", json={"name": "A"}).status_code == 400
+
+    resp = client.put(f"/projects/{b['id']}", json={"name": "A"})
+    assert (resp.status_code, resp.json()["detail"]) == (400, "Project with this name already exists")
+    # the failed writes were rolled back; the session keeps working
+    resp = client.put(f"/projects/{b['id']}", json={"name": "C"}, headers={"If-Match": '"1"'})
+    assert (resp.status_code, resp.json()["name"], resp.headers["etag"]) == (200, "C", '"2"')
+    assert client.put(f"/projects/{b['id']}", json={"name": "D"}, headers={"If-Match": '"1"'}).status_code == 409
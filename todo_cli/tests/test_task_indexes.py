@@ -0,0 +1,47 @@
+from sqlalchemy import event
+from app.models.task import StatusEnum
+
+
+def _plan_of(db_session, call):
+    """Run a repository call, then EXPLAIN QUERY PLAN the SELECT it issued."""
+    captured = []
+    engine = db_session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[-1]
+    raw = db_session.connection().connection.driver_connection
+    rows = raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return " ".join(row[-1] for row in rows)
+
+
+def test_list_by_project_uses_project_index(db_session, task_repo):
+    plan = _plan_of(db_session, lambda: task_repo.list_by_project(1))
+    assert "SEARCH tasks USING INDEX ix_tasks_project_id_" in plan
+
+
+def test_keyset_page_seeks_without_sorting(db_session, task_repo):
+    plan = _plan_of(db_session, lambda: task_repo.list_by_project_page(1, 50, after_id=100))
+    assert "USING INDEX ix_tasks_project_id_id (project_id=? AND id>?)" in plan
+    assert "TEMP B-TREE" not in plan
+
+    plan = _plan_of(
+        db_session,
+        lambda: task_repo.list_by_project_page(1, 50, after_id=100, status=StatusEnum.DOING),
+    )
+    assert "USING INDEX ix_tasks_project_id_status" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_overdue_scan_uses_status_deadline_index(db_session, task_repo):
+    plan = _plan_of(db_session, task_repo.list_overdue_open_tasks)
+    assert "USING INDEX ix_tasks_status_deadline" in plan
+    assert "SCAN tasks" not in plan
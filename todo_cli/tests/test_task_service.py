@@ -15,4 +15,31 @@ def test_change_status(task_repo, project_repo):
     t = task_repo.create(project_id=p.id, title="T2", description="d")
     updated = task_repo.change_status(t.id, StatusEnum.DOING)
     assert updated is not None
-    assert updated.status == StatusEnum.DOING
\ No newline at end of file
+    assert updated.status == StatusEnum.DOING
+
+def test_update_detects_write_between_read_and_commit(db_session, task_repo, project_repo):
+    import pytest
+    from sqlalchemy import update
+    from app.models.task import Task
+    from app.services.project_service import VersionConflict
+    from app.services.task_service import TaskService
+
+    p = project_repo.create(name="TP3", description="d")
+    t = task_repo.create(project_id=p.id, title="T3", description="d")
+    assert t.version == 1
+    service = TaskService(task_repo, project_repo)
+    assert service.update_task(t.id, {"title": "mine"}, expected_version=1).version == 2
+
+    # another writer commits after our read: the identity map still says version 2
+    db_session.execute(
+        update(Task).where(Task.id == t.id).values(title="theirs", version=3).execution_options(synchronize_session=False)
+    )
+    db_session.commit()
+    with pytest.raises(VersionConflict):
+        service.update_task(t.id, {"title": "lost update"})
+
+    # rolled back, so the session reloads the winner
+    assert task_repo.get(t.id).title == "theirs"
+    with pytest.raises(VersionConflict):
+        service.change_status(t.id, "done", expected_version=2)
+    assert service.change_status(t.id, "done", expected_version=3).version == 4